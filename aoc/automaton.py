@@ -0,0 +1,95 @@
+import collections
+
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+newline = ord('\n')
+blank = frozenset(b' \t\r')
+
+
+class Automaton:
+    # Aho-Corasick matcher compiled down to a full transition table, so every
+    # input byte costs one list lookup whatever the patterns are, and matches
+    # that overlap ("twone") are all seen.
+
+    def __init__(self, patterns: Dict[Union[str, bytes], Any]):
+        goto = [{}]
+        outputs = [[]]
+        for pattern, value in patterns.items():
+            pattern = pattern.encode('ascii') if isinstance(pattern, str) else pattern
+            if not pattern or newline in pattern:
+                raise ValueError(f'cannot match {pattern!r}')
+            state = 0
+            for byte in pattern:
+                if byte not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][byte] = len(goto) - 1
+                state = goto[state][byte]
+            outputs[state].append(value)
+        table = [[0] * 256 for _ in goto]
+        fail = [0] * len(goto)
+        queue = collections.deque()
+        for byte, child in goto[0].items():
+            table[0][byte] = child
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            # the longest match ending here comes first
+            outputs[state] += outputs[fail[state]]
+            table[state] = table[fail[state]][:]
+            for byte, child in goto[state].items():
+                table[state][byte] = child
+                fail[child] = table[fail[state]][byte]
+                queue.append(child)
+        self._table = table
+        self._matches = [tuple(x) for x in outputs]
+        self._values = [x[0] if x else None for x in outputs]
+
+    def scan(self, data, start: int = 0, end: int = None) -> Iterator[Tuple[int, Any]]:
+        # (offset just past the match, value) for every match, in order
+        table, matches = self._table, self._matches
+        state = 0
+        end = len(data) if end is None else end
+        for position in range(start, end):
+            state = table[state][data[position]]
+            for value in matches[state]:
+                yield position + 1, value
+
+    def first_and_last(self, data) -> Optional[Tuple[Any, Any]]:
+        table, values = self._table, self._values
+        state, first, last = 0, None, None
+        for byte in data:
+            state = table[state][byte]
+            value = values[state]
+            if value is not None:
+                if first is None:
+                    first = value
+                last = value
+        return None if first is None else (first, last)
+
+    def first_and_last_per_line(self, data) -> Iterator[Tuple[Any, Any]]:
+        # The bulk version of first_and_last: one pass over a whole file,
+        # starting again at every newline. Blank lines are skipped, and a
+        # line with no match gives None.
+        table, values = self._table, self._values
+        state, first, last, filled = 0, None, None, False
+        for byte in data:
+            if byte == newline:
+                if first is not None:
+                    yield first, last
+                elif filled:
+                    yield None
+                state, first, last, filled = 0, None, None, False
+                continue
+            if first is None and byte not in blank:
+                filled = True
+            state = table[state][byte]
+            value = values[state]
+            if value is not None:
+                if first is None:
+                    first = value
+                last = value
+        if first is not None:
+            yield first, last
+        elif filled:
+            yield None
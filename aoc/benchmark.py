@@ -0,0 +1,169 @@
+import glob
+import hashlib
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from aoc import cache, generators, solvers
+
+default_directory = os.environ.get('AOC_BENCH_DIR', os.path.join(solvers.root, '.aoc_bench'))
+default_scales = [0.25, 0.5, 1.0]
+default_threshold = 0.2
+# differences smaller than this are noise, however large the ratio
+min_difference = 0.005
+seed = 0
+
+
+@dataclass
+class Run:
+    # the history of one commit: benchmark name -> best seconds, or None if it failed
+    commit: str
+    created: str
+    python: str
+    machine: str
+    dirty: bool = False
+    timings: Dict[str, Optional[float]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Change:
+    name: str
+    before: Optional[float]
+    after: Optional[float]
+
+    @property
+    def ratio(self):
+        return self.after / self.before if self.before and self.after is not None else None
+
+
+def benchmark_name(solver: solvers.Solver, size: int):
+    return f'{solver.name}@{size}'
+
+
+def get_sizes(day: int, scales: List[float]) -> List[int]:
+    default_size = generators.get_generator(day).default_size
+    return sorted({max(1, round(default_size * x)) for x in scales})
+
+
+def get_input(day: int, size: int, directory: str = default_directory) -> str:
+    # Generated once and kept, so every commit is timed on the same bytes.
+    # The name carries a hash of the generator's source, so changing the
+    # generator makes a new input instead of reusing the old one.
+    path = os.path.join(directory, 'inputs', f'day{day:02}_{size}_{seed}_{hash_generator(day)[:12]}.txt')
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        generators.write(path + '.tmp', day, size, seed=seed)
+        os.replace(path + '.tmp', path)
+    return path
+
+
+def hash_generator(day: int) -> str:
+    digest = hashlib.sha256()
+    for path in [generators.__file__, generators.get_generator(day).__file__]:
+        digest.update(cache.hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def time_solver(solver: solvers.Solver, path: str, repeat: int, timeout: float = None):
+    # Best of repeat parse + solve times; the minimum is the least noisy
+    # estimate of what the code costs. Returns (seconds, error).
+    best = None
+    for _ in range(repeat):
+        result = solvers.run(solver, [path], out=io.StringIO(), trace_memory=False, timeout=timeout)
+        if result.error:
+            return None, result.error
+        seconds = (result.parse_ns + result.solve_ns) / 1e9
+        best = seconds if best is None else min(best, seconds)
+    return best, None
+
+
+def new_run() -> Run:
+    return Run(_git('rev-parse', 'HEAD') or 'unknown', time.strftime('%Y-%m-%dT%H:%M:%S%z'), platform.python_version(),
+               platform.node() or 'unknown', bool(_git('status', '--porcelain', '--untracked-files=no')))
+
+
+def save(run: Run, directory: str = default_directory):
+    path = os.path.join(directory, 'history', run.machine, f'{run.commit}.json')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    previous = load(path) if os.path.exists(path) else None
+    if previous:
+        # a partial run on the same commit only replaces what it measured
+        previous.timings.update(run.timings)
+        for name in run.timings:
+            previous.errors.pop(name, None)
+        previous.errors.update(run.errors)
+        run = Run(**dict(asdict(run), timings=previous.timings, errors=previous.errors))
+    with open(path, 'w') as file:
+        json.dump(asdict(run), file, indent=2, sort_keys=True)
+    return path
+
+
+def load(path: str) -> Run:
+    with open(path) as file:
+        return Run(**json.load(file))
+
+
+def history(machine: str = None, directory: str = default_directory) -> List[Run]:
+    machine = machine or platform.node() or 'unknown'
+    runs = [load(x) for x in glob.glob(os.path.join(directory, 'history', machine, '*.json'))]
+    return sorted(runs, key=lambda x: x.created)
+
+
+def find_baseline(runs: List[Run], commit: Optional[str]) -> Optional[Run]:
+    # the latest run of commit, which may be given by a prefix
+    if not commit:
+        return None
+    matches = [x for x in runs if x.commit.startswith(commit)]
+    return matches[-1] if matches else None
+
+
+def parent_commit(commit: str = 'HEAD') -> Optional[str]:
+    # what a change is measured against by default
+    return _git('rev-parse', f'{commit}~1')
+
+
+def compare(before: Run, after: Run, threshold: float = default_threshold) -> List[Change]:
+    # Slowdowns beyond the threshold, and benchmarks that stopped working.
+    result = []
+    for name, seconds in sorted(after.timings.items()):
+        if name not in before.timings:
+            continue
+        previous = before.timings[name]
+        if seconds is None and previous is not None:
+            result.append(Change(name, previous, None))
+        elif seconds is not None and previous is not None and seconds > previous * (1 + threshold) and seconds - previous > min_difference:
+            result.append(Change(name, previous, seconds))
+    return result
+
+
+def format_change(change: Change):
+    if change.after is None:
+        return f'{change.name}: {change.before:.4f} s -> failed'
+    return f'{change.name}: {change.before:.4f} s -> {change.after:.4f} s ({change.ratio:.2f}x)'
+
+
+def format_history(runs: List[Run], names: List[str]):
+    lines = []
+    for name in names:
+        lines.append(name)
+        for run in runs:
+            if name in run.timings:
+                seconds = run.timings[name]
+                timing = 'failed' if seconds is None else f'{seconds:.4f} s'
+                lines.append(f'    {run.commit[:10]}{"+" if run.dirty else " "} {run.created}  {timing}')
+    return '\n'.join(lines)
+
+
+def _git(*arguments):
+    try:
+        process = subprocess.run(['git', *arguments], cwd=solvers.root, capture_output=True, text=True)
+        return process.stdout.strip() if process.returncode == 0 else None
+    except OSError:
+        return None
@@ -0,0 +1,122 @@
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+
+from typing import Any, Dict, Tuple
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+default_directory = os.environ.get('AOC_CACHE_DIR', os.path.join(root, '.aoc_cache'))
+default_max_bytes = 64 * 2 ** 20
+
+
+class ResultCache:
+    # Entries are pickle files named after their key. Reading an entry touches
+    # it, so when the directory grows past max_bytes the entries that were
+    # used least recently are removed first.
+
+    def __init__(self, directory: str = default_directory, max_bytes: int = default_max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, solver_path: str, input_path: str, *parts: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(hash_file(input_path).encode())
+        digest.update(hash_source(solver_path).encode())
+        for part in parts:
+            digest.update(b'\0' + part.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        # False if the value cannot be pickled or would not fit on its own
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(value, file)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            _remove(temp_path)
+            return False
+        if _get_size(temp_path) > self.max_bytes:
+            _remove(temp_path)
+            return False
+        os.replace(temp_path, self._get_path(key))
+        self._evict()
+        return True
+
+    def clear(self):
+        for path in self._get_entries():
+            _remove(path)
+
+    def size(self) -> int:
+        return sum(_get_size(x) for x in self._get_entries())
+
+    def _get_path(self, key: str):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _get_entries(self):
+        return glob.glob(os.path.join(self.directory, '*.pickle'))
+
+    def _evict(self):
+        entries = []
+        for path in self._get_entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(x[1] for x in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def hash_file(path: str) -> str:
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(2 ** 20), b''):
+                digest.update(block)
+        _file_hashes[key] = digest.hexdigest()
+    return _file_hashes[key]
+
+
+def hash_source(solver_path: str) -> str:
+    # The shared aoc modules count as part of every solver's source.
+    digest = hashlib.sha256()
+    shared = sorted(x for x in glob.glob(os.path.join(root, 'aoc', '*.py')) if not os.path.basename(x).startswith('test_'))
+    for path in [solver_path] + shared:
+        digest.update(hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def _get_size(path):
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,135 @@
+import collections
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+from aoc import lazy
+
+hand_types = ['high_card', 'one_pair', 'two_pair', 'three_of_a_kind', 'full_house', 'four_of_a_kind', 'five_of_a_kind']
+# card labels from weakest to strongest, without and with jokers
+card_labels = {False: '23456789TJQKA', True: 'J23456789TQKA'}
+joker = 'J'
+hand_count = 13 ** 5
+
+Cards = Union[str, bytes]
+
+# the counts of the labels in a hand, most common first -> its type
+signatures = {
+    (1, 1, 1, 1, 1): 0,
+    (2, 1, 1, 1): 1,
+    (2, 2, 1): 2,
+    (3, 1, 1): 3,
+    (3, 2): 4,
+    (4, 1): 5,
+    (5,): 6,
+}
+_card_ranks = {x: {label: i for i, label in enumerate(labels)} for x, labels in card_labels.items()}
+_classified: Dict[bool, Dict[str, int]] = {False: {}, True: {}}
+_type_tables = {}
+
+
+def get_signature(cards: str, jokers: bool = False) -> tuple:
+    # jokers join whichever label there is most of, which is always the best
+    # hand they can make
+    wild = cards.count(joker) if jokers else 0
+    counts = sorted(collections.Counter(cards.replace(joker, '') if wild else cards).values(), reverse=True) or [0]
+    counts[0] += wild
+    return tuple(counts)
+
+
+def classify(cards: Cards, jokers: bool = False) -> int:
+    # index into hand_types, remembered for every hand already seen
+    if isinstance(cards, bytes):
+        cards = cards.decode('ascii')
+    classified = _classified[jokers]
+    result = classified.get(cards)
+    if result is None:
+        if len(cards) != 5:
+            raise ValueError(f'{cards!r} is not a hand of five cards')
+        result = classified[cards] = signatures[get_signature(cards, jokers)]
+    return result
+
+
+def get_sort_key(cards: Cards, jokers: bool = False) -> int:
+    # The type, then the five cards as base-13 digits, packed into one int so
+    # that hands order the same way their keys do.
+    if isinstance(cards, bytes):
+        cards = cards.decode('ascii')
+    key = classify(cards, jokers)
+    ranks = _card_ranks[jokers]
+    for card in cards:
+        key = key * 13 + ranks[card]
+    return key
+
+
+def get_sort_keys(hands: Sequence[Cards], jokers: bool = False):
+    # get_sort_key for every hand, as a numpy array when there are enough
+    # hands. numpy saves about 5 us a hand, but the first use of each rules
+    # builds their type table, which takes about 0.23 s.
+    numpy = lazy.numpy_for(len(hands), 5e-6, 0 if jokers in _type_tables else 0.23)
+    if numpy:
+        return _numpy_sort_keys(numpy, hands, jokers)
+    return [get_sort_key(x, jokers) for x in hands]
+
+
+def total_winnings(hands: Sequence[Cards], bids: Sequence[int], jokers: bool = False) -> int:
+    # every bid times the rank of its hand; equal hands keep their order
+    if len(hands) != len(bids):
+        raise ValueError('every hand needs a bid')
+    keys = get_sort_keys(hands, jokers)
+    if isinstance(keys, list):
+        order = sorted(range(len(hands)), key=keys.__getitem__)
+        return sum(rank * bids[i] for rank, i in enumerate(order, start=1))
+    numpy = lazy.optional_import('numpy')
+    order = numpy.argsort(keys, kind='stable')
+    ranks = numpy.arange(1, len(hands) + 1, dtype=numpy.int64)
+    return int((numpy.asarray(bids, dtype=numpy.int64)[order] * ranks).sum())
+
+
+def get_type_table(numpy, jokers: bool = False):
+    # The type of all 13^5 hands, indexed by the cards as base-13 digits.
+    # Built once per rules from the same signatures classify uses: a label
+    # count per hand, jokers moved onto the most common label, then the top
+    # two counts pick the type.
+    if jokers not in _type_tables:
+        powers = 13 ** numpy.arange(4, -1, -1)
+        digits = numpy.arange(hand_count)[:, None] // powers % 13
+        counts = (digits[:, :, None] == numpy.arange(13)).sum(axis=1)
+        wild = 0
+        if jokers:
+            wild = counts[:, 0].copy()
+            counts[:, 0] = 0
+        counts.sort(axis=1)
+        top, second = counts[:, -1] + wild, counts[:, -2]
+        table = numpy.zeros(hand_count, dtype=numpy.int8)
+        for signature, hand_type in signatures.items():
+            table[(top == signature[0]) & (second == (signature[1] if len(signature) > 1 else 0))] = hand_type
+        _type_tables[jokers] = table
+    return _type_tables[jokers]
+
+
+def _numpy_sort_keys(numpy, hands, jokers):
+    hands = [x if isinstance(x, bytes) else x.encode('ascii') for x in hands]
+    # checked one by one, as a short hand and a long one would add up to two
+    # of five and shift every hand after them
+    for cards in hands:
+        if len(cards) != 5:
+            raise ValueError(f'{cards!r} is not a hand of five cards')
+    data = b''.join(hands)
+    ranks = numpy.full(256, -1, dtype=numpy.int64)
+    for label, rank in _card_ranks[jokers].items():
+        ranks[ord(label)] = rank
+    cards = ranks[numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, 5)]
+    if (cards < 0).any():
+        raise ValueError('unknown card label')
+    indexes = cards @ (13 ** numpy.arange(4, -1, -1))
+    return get_type_table(numpy, jokers)[indexes].astype(numpy.int64) * hand_count + indexes
+
+
+def read_hands(chunks) -> Tuple[List[bytes], List[int]]:
+    # (hands, bids) from chunks of whole lines
+    hands, bids = [], []
+    for chunk in chunks:
+        tokens = chunk.split()
+        hands.extend(tokens[0::2])
+        bids.extend(map(int, tokens[1::2]))
+    return hands, bids
@@ -0,0 +1,142 @@
+import collections
+import functools
+import operator
+
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from aoc import inputs, lazy
+
+field_pattern = lazy.compile(rb'[0-9]+')
+space, ascii_zero = ord(' '), ord('0')
+
+
+class _Bits(dict):
+    # number as written -> its bit, worked out the first time it is seen
+
+    def __missing__(self, key):
+        value = self[key] = 1 << int(key)
+        return value
+
+
+bits = _Bits()
+
+
+def parse_card(line: Union[str, bytes]) -> Tuple[int, int, int]:
+    # (card id, winning numbers, numbers held), the numbers as bitmasks
+    if isinstance(line, str):
+        line = line.encode('ascii')
+    header, numbers = line.split(b':')
+    winning, held = numbers.split(b'|')
+    get_bit = bits.__getitem__
+    winning = functools.reduce(operator.or_, map(get_bit, winning.split()), 0)
+    held = functools.reduce(operator.or_, map(get_bit, held.split()), 0)
+    return int(header.split()[1]), winning, held
+
+
+def count_matches(winning: int, held: int) -> int:
+    return (winning & held).bit_count()
+
+
+def get_score(matches: int) -> int:
+    return 1 << (matches - 1) if matches else 0
+
+
+def count_copies(match_counts: Sequence[int]) -> List[int]:
+    # How many of each card end up being held. A card adds its count to a
+    # run of the cards after it, which a difference array records as one
+    # addition where the run starts and one subtraction where it ends, so
+    # the work is O(cards) however many matches there are. Copies of cards
+    # past the end of the deck are not held.
+    size = len(match_counts)
+    differences = [0] * (size + 1)
+    result = []
+    extra = 0
+    for i, matches in enumerate(match_counts):
+        extra += differences[i]
+        count = 1 + extra
+        result.append(count)
+        if matches:
+            differences[i + 1] += count
+            differences[min(i + 1 + matches, size)] -= count
+    return result
+
+
+class CardCounter:
+    # count_copies for a deck that keeps growing: add returns the count of
+    # each new card and keeps total up to date. Only the differences for
+    # cards not yet added are kept, at most one per match of a recent card.
+
+    def __init__(self):
+        self.cards = self.total = 0
+        self._extra = 0
+        self._differences = collections.deque()
+
+    def add(self, matches: int) -> int:
+        if self._differences:
+            self._extra += self._differences.popleft()
+        count = 1 + self._extra
+        if matches:
+            while len(self._differences) <= matches:
+                self._differences.append(0)
+            self._differences[0] += count
+            self._differences[matches] -= count
+        self.cards += 1
+        self.total += count
+        return count
+
+    def extend(self, match_counts: Iterable[int]) -> int:
+        for matches in match_counts:
+            self.add(matches)
+        return self.total
+
+
+def read_match_counts(source: inputs.Input) -> List[int]:
+    # matches on every card, in the order of the file
+    # reading the columns with numpy saves about 80 ns a byte
+    numpy = lazy.numpy_for(len(source), 8e-8)
+    if numpy:
+        result = _read_fixed_width(numpy, source.data)
+        if result is not None:
+            return result
+    result = []
+    for line in source.lines():
+        if len(line):
+            card_id, winning, held = parse_card(bytes(line))
+            result.append(count_matches(winning, held))
+    return result
+
+
+def _read_fixed_width(numpy, data):
+    # The puzzle input lines up: every card is the same width, with numbers
+    # right-aligned in two-character fields. Then the whole deck is one byte
+    # matrix, each number a pair of columns, and each side of a card a row of
+    # flags. Returns None if any card is not laid out like the first one.
+    width = bytes(data[:256]).find(b'\n') + 1
+    if width > 0 and len(data) % width == width - 1:
+        data = bytes(data) + b'\n'
+    if width <= 0 or len(data) % width:
+        return None
+    deck = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, width)
+    first = bytes(data[:width])
+    colon, bar = first.find(b':'), first.find(b'|')
+    if colon == -1 or bar == -1 or (deck[:, [colon, bar, width - 1]] != [ord(':'), ord('|'), ord('\n')]).any():
+        return None
+    ends = numpy.array([x.end() for x in field_pattern.finditer(first, colon)])
+    if (ends - 2 <= colon).any() or ((ends > bar) & (ends - 2 <= bar)).any():
+        return None
+    # everything after the colon but the number fields must match the first
+    # card byte for byte, so a wider number cannot hide in the spaces
+    fields = numpy.zeros(width, dtype=bool)
+    fields[ends - 2] = fields[ends - 1] = True
+    fields[:colon] = True
+    if (deck[:, ~fields] != deck[0, ~fields]).any():
+        return None
+    tens, ones = deck[:, ends - 2], deck[:, ends - 1]
+    if ((tens != space) & ((tens < ascii_zero) | (tens > ascii_zero + 9))).any() or ((ones < ascii_zero) | (ones > ascii_zero + 9)).any():
+        return None
+    values = numpy.where(tens == space, 0, tens.astype(numpy.int64) - ascii_zero) * 10 + ones - ascii_zero
+    rows = numpy.arange(len(deck))[:, None]
+    winning, held = numpy.zeros((2, len(deck), int(values.max()) + 1), dtype=bool)
+    winning[rows, values[:, ends < bar]] = True
+    held[rows, values[:, ends > bar]] = True
+    return (winning & held).sum(axis=1).tolist()
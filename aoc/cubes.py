@@ -0,0 +1,221 @@
+import bisect
+
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from aoc import inputs, lazy
+
+colors = ('red', 'green', 'blue')
+color_indexes = {color: i for i, color in enumerate(colors)}
+comma, ascii_r, ascii_g = ord(','), ord('r'), ord('g')
+# a LimitIndex bigger than this is not built; queries scan the games instead
+max_index_cells = 2 ** 24
+
+Draw = Tuple[int, int, int]
+Limits = Union[Dict[str, int], Sequence[int]]
+
+
+def parse_game(line: str) -> Tuple[int, List[Draw]]:
+    header, rest = line.split(':', 1)
+    draws = []
+    for draw in rest.split(';'):
+        counts = [0, 0, 0]
+        for item in draw.split(','):
+            count, color = item.split()
+            counts[color_indexes[color]] = int(count)
+        draws.append(tuple(counts))
+    return int(header.split()[1]), draws
+
+
+def get_maximums(draws: Iterable[Draw]) -> Draw:
+    red = green = blue = 0
+    for r, g, b in draws:
+        red, green, blue = max(red, r), max(green, g), max(blue, b)
+    return red, green, blue
+
+
+def to_limits(limits: Limits) -> Draw:
+    if isinstance(limits, dict):
+        return tuple(limits.get(x, 0) for x in colors)
+    return tuple(limits)
+
+
+class GameLog:
+    # Every draw of every game as one row of five columns, parsed once so that
+    # any number of questions can be asked without reading the file again.
+
+    def __init__(self):
+        self.game_ids, self.draws = array('L'), array('L')
+        self.red, self.green, self.blue = array('L'), array('L'), array('L')
+        self._maximums = self._index = None
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> 'GameLog':
+        log = cls()
+        log.extend('\n'.join(lines).encode('ascii'))
+        return log
+
+    @classmethod
+    def from_input(cls, source: inputs.Input) -> 'GameLog':
+        log = cls()
+        for chunk in inputs.line_chunks(source.data):
+            log.extend(chunk)
+        return log
+
+    def extend(self, data: bytes):
+        # Parses whole games straight into the columns. Splitting on
+        # whitespace leaves (count, color) pairs, and a color without a
+        # trailing comma is the last one of its draw.
+        game_ids, draws, reds, greens, blues = [], [], [], [], []
+        tokens = iter(data.split())
+        game_id = draw = red = green = blue = 0
+        for count, word in zip(tokens, tokens):
+            if count == b'Game':
+                game_id, draw = int(word[:-1]), 0
+                continue
+            if word[0] == ascii_r:
+                red = int(count)
+            elif word[0] == ascii_g:
+                green = int(count)
+            else:
+                blue = int(count)
+            if word[-1] != comma:
+                game_ids.append(game_id)
+                draws.append(draw)
+                reds.append(red)
+                greens.append(green)
+                blues.append(blue)
+                draw, red, green, blue = draw + 1, 0, 0, 0
+        for column, values in zip([self.game_ids, self.draws, self.red, self.green, self.blue], [game_ids, draws, reds, greens, blues]):
+            column.extend(values)
+        self._maximums = self._index = None
+
+    def add(self, game_id: int, draws: List[Draw]):
+        for i, (red, green, blue) in enumerate(draws):
+            self.game_ids.append(game_id)
+            self.draws.append(i)
+            self.red.append(red)
+            self.green.append(green)
+            self.blue.append(blue)
+        self._maximums = self._index = None
+
+    def __len__(self):
+        return len(self.game_ids)
+
+    def maximums(self) -> Tuple[array, array, array, array]:
+        # (game id, most red, most green, most blue), one entry per game
+        if self._maximums is None:
+            numpy = self._get_numpy()
+            self._maximums = self._numpy_maximums(numpy) if numpy else self._loop_maximums()
+        return self._maximums
+
+    def sum_possible(self, limits: Limits) -> int:
+        red, green, blue = to_limits(limits)
+        game_ids, reds, greens, blues = self.maximums()
+        numpy = self._get_numpy()
+        if numpy:
+            return int(game_ids[(reds <= red) & (greens <= green) & (blues <= blue)].sum())
+        total = 0
+        for game_id, r, g, b in zip(game_ids, reds, greens, blues):
+            if r <= red and g <= green and b <= blue:
+                total += game_id
+        return total
+
+    def sum_possible_batch(self, limits: Iterable[Limits]) -> List[int]:
+        limits = [to_limits(x) for x in limits]
+        if self._index is None:
+            game_ids, reds, greens, blues = self.maximums()
+            if LimitIndex.get_cells(reds, greens, blues) <= max_index_cells:
+                self._index = LimitIndex(game_ids, reds, greens, blues)
+        if self._index is None:
+            return [self.sum_possible(x) for x in limits]
+        return [self._index.sum_possible(x) for x in limits]
+
+    def sum_powers(self) -> int:
+        game_ids, reds, greens, blues = self.maximums()
+        numpy = self._get_numpy()
+        if numpy:
+            return int((reds * greens * blues).sum())
+        return sum(r * g * b for r, g, b in zip(reds, greens, blues))
+
+    def to_numpy(self):
+        numpy = lazy.optional_import('numpy')
+        if numpy is None:
+            raise ImportError('numpy is not installed')
+        columns = {x: getattr(self, x) for x in ['game_ids', 'draws', 'red', 'green', 'blue']}
+        return {k: numpy.frombuffer(v, dtype=f'u{v.itemsize}') for k, v in columns.items()}
+
+    def _get_numpy(self):
+        # the numpy maximums save about 1 us a draw
+        return lazy.numpy_for(len(self.game_ids), 1e-6)
+
+    def _loop_maximums(self):
+        game_ids, reds, greens, blues = array('L'), array('L'), array('L'), array('L')
+        for game_id, draw, red, green, blue in zip(self.game_ids, self.draws, self.red, self.green, self.blue):
+            if draw == 0:
+                game_ids.append(game_id)
+                reds.append(red)
+                greens.append(green)
+                blues.append(blue)
+            else:
+                reds[-1], greens[-1], blues[-1] = max(reds[-1], red), max(greens[-1], green), max(blues[-1], blue)
+        return game_ids, reds, greens, blues
+
+    def _numpy_maximums(self, numpy):
+        columns = self.to_numpy()
+        starts = numpy.flatnonzero(columns['draws'] == 0)
+        maximums = [numpy.maximum.reduceat(columns[x].astype(numpy.int64), starts) for x in colors]
+        return (columns['game_ids'][starts].astype(numpy.int64), *maximums)
+
+
+class LimitIndex:
+    # The answer to sum_possible for every combination of limits, kept as a
+    # 3-D prefix sum over the distinct per-game maximums of each color. Cell
+    # (i, j, k) holds the ids of the games whose maximums are at most the
+    # i-th red, j-th green and k-th blue value (0 meaning below all of them),
+    # so a query is three bisects and one lookup however many games there are.
+
+    def __init__(self, game_ids: Sequence[int], reds: Sequence[int], greens: Sequence[int], blues: Sequence[int]):
+        self._axes = [sorted(set(int(x) for x in values)) for values in (reds, greens, blues)]
+        self._strides = self._get_strides(self._axes)
+        cells = (len(self._axes[0]) + 1) * self._strides[0]
+        # the numpy prefix sums save about 3 us a cell
+        numpy = lazy.numpy_for(cells, 3e-6)
+        if numpy:
+            self._table = self._build_numpy(numpy, game_ids, reds, greens, blues)
+            return
+        table = [0] * cells
+        for game_id, *maximums in zip(game_ids, reds, greens, blues):
+            table[self._locate(maximums)] += int(game_id)
+        for axis, stride in enumerate(self._strides):
+            size = len(self._axes[axis]) + 1
+            for cell in range(len(table)):
+                if cell // stride % size:
+                    table[cell] += table[cell - stride]
+        self._table = table
+
+    @staticmethod
+    def get_cells(reds: Sequence[int], greens: Sequence[int], blues: Sequence[int]) -> int:
+        result = 1
+        for values in (reds, greens, blues):
+            result *= len(set(int(x) for x in values)) + 1
+        return result
+
+    def sum_possible(self, limits: Limits) -> int:
+        return int(self._table[self._locate(to_limits(limits))])
+
+    def _locate(self, values: Sequence[int]) -> int:
+        return sum(bisect.bisect_right(axis, value) * stride for axis, value, stride in zip(self._axes, values, self._strides))
+
+    def _build_numpy(self, numpy, game_ids, reds, greens, blues):
+        positions = [numpy.searchsorted(axis, numpy.asarray(values), side='right') for axis, values in zip(self._axes, (reds, greens, blues))]
+        table = numpy.zeros([len(x) + 1 for x in self._axes], dtype=numpy.int64)
+        numpy.add.at(table, tuple(positions), numpy.asarray(game_ids, dtype=numpy.int64))
+        for axis in range(3):
+            numpy.cumsum(table, axis=axis, out=table)
+        return table.ravel()
+
+    @staticmethod
+    def _get_strides(axes):
+        green, blue = len(axes[1]) + 1, len(axes[2]) + 1
+        return green * blue, blue, 1
@@ -0,0 +1,28 @@
+import importlib
+import random
+
+from typing import Iterator
+
+days = list(range(1, 21))
+
+
+def get_generator(day: int):
+    return importlib.import_module(f'aoc.generators.day{day:02}')
+
+
+def generate(day: int, size: int = None, density: float = None, seed: int = 0) -> Iterator[str]:
+    generator = get_generator(day)
+    size = generator.default_size if size is None else size
+    density = generator.default_density if density is None else density
+    if size < 1:
+        raise ValueError(f'size must be positive: {size}')
+    if not 0 <= density <= 1:
+        raise ValueError(f'density must be between 0 and 1: {density}')
+    return generator.generate(random.Random(seed), size, density)
+
+
+def write(path: str, day: int, size: int = None, density: float = None, seed: int = 0):
+    with open(path, 'w') as file:
+        for line in generate(day, size, density, seed):
+            file.write(line)
+            file.write('\n')
@@ -0,0 +1,24 @@
+import random
+import string
+
+from typing import Iterator
+
+# size: number of calibration lines
+# density: chance that any position holds a digit or a spelled-out digit
+default_size = 1000
+default_density = 0.2
+
+number_words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+digits = [str(x) for x in range(1, 10)]
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(4, 40)):
+            if rng.random() < density:
+                parts.append(rng.choice(digits if rng.random() < 0.5 else number_words))
+            else:
+                parts.append(rng.choice(string.ascii_lowercase))
+        parts.insert(rng.randint(0, len(parts)), rng.choice(digits))
+        yield ''.join(parts)
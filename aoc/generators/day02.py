@@ -0,0 +1,20 @@
+import random
+
+from typing import Iterator
+
+# size: number of games
+# density: chance that a color shows up in a draw
+default_size = 1000
+default_density = 0.7
+
+colors = ['red', 'green', 'blue']
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            shown = [c for c in colors if rng.random() < density] or [rng.choice(colors)]
+            rng.shuffle(shown)
+            draws.append(', '.join(f'{rng.randint(1, 20)} {c}' for c in shown))
+        yield f'Game {game_id}: ' + '; '.join(draws)
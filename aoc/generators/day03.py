@@ -0,0 +1,26 @@
+import random
+
+from typing import Iterator
+
+# size: width and height of the schematic
+# density: chance that a cell starts a number or holds a symbol
+default_size = 140
+default_density = 0.15
+
+symbols = '*#+$/@=%&-'
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            if rng.random() >= density:
+                row.append('.')
+            elif rng.random() < 0.3:
+                row.append('*' if rng.random() < 0.5 else rng.choice(symbols))
+            else:
+                number = str(rng.randint(1, 999))[:size - len(row)]
+                row.extend(number)
+                if len(row) < size:
+                    row.append('.')
+        yield ''.join(row)
@@ -0,0 +1,23 @@
+import random
+
+from typing import Iterator
+
+# size: number of cards
+# density: share of the held numbers that are also winning numbers
+default_size = 200
+default_density = 0.2
+
+winning_count, held_count = 10, 25
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    width = len(str(size))
+    for card_id in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), winning_count + held_count)
+        winning, others = numbers[:winning_count], numbers[winning_count:]
+        # part 2 copies the next cards, so matches may not run past the last card
+        matches = min(winning_count, size - card_id, sum(1 for _ in range(winning_count) if rng.random() < density))
+        held = winning[:matches] + others[:held_count - matches]
+        rng.shuffle(held)
+        yield (f'Card {card_id:>{width}}: ' + ' '.join(f'{x:>2}' for x in winning)
+               + ' | ' + ' '.join(f'{x:>2}' for x in held))
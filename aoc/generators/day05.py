@@ -0,0 +1,38 @@
+import random
+
+from typing import Iterator
+
+# size: number of seed ranges, and of rules in each map
+# density: share of the number line that the rules of a map cover
+default_size = 20
+default_density = 0.8
+
+categories = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+limit = 2 ** 32
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    seeds = []
+    for _ in range(size):
+        start = rng.randrange(limit // 2)
+        seeds.extend([start, rng.randint(1, limit // (2 * size))])
+    yield 'seeds: ' + ' '.join(str(x) for x in seeds)
+    for source, destination in zip(categories, categories[1:]):
+        yield ''
+        yield f'{source}-to-{destination} map:'
+        for destination_start, source_start, length in build_rules(rng, size, density):
+            yield f'{destination_start} {source_start} {length}'
+
+
+def build_rules(rng: random.Random, size: int, density: float):
+    # Source ranges must not overlap, so cut the number line into slots and
+    # give each rule part of one slot.
+    slot = limit // size
+    result = []
+    for i in range(size):
+        length = max(1, int(slot * density * rng.uniform(0.5, 1)))
+        source_start = i * slot + rng.randrange(slot - length + 1)
+        destination_start = rng.randrange(limit - length)
+        result.append((destination_start, source_start, length))
+    rng.shuffle(result)
+    return result
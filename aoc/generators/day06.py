@@ -0,0 +1,19 @@
+import random
+
+from typing import Iterator
+
+# size: number of races
+# density: how close the record is to the best possible distance
+default_size = 4
+default_density = 0.5
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    durations, records = [], []
+    for _ in range(size):
+        duration = rng.randint(7, 99)
+        best = (duration // 2) * (duration - duration // 2)
+        durations.append(duration)
+        records.append(min(best - 1, int(best * density * rng.uniform(0.8, 1))))
+    yield 'Time:     ' + ' '.join(f'{x:>4}' for x in durations)
+    yield 'Distance: ' + ' '.join(f'{x:>4}' for x in records)
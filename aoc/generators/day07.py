@@ -0,0 +1,19 @@
+import random
+
+from typing import Iterator
+
+# size: number of hands
+# density: chance that a card repeats one already in the hand
+default_size = 1000
+default_density = 0.3
+
+card_labels = 'AKQJT98765432'
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    for _ in range(size):
+        cards = [rng.choice(card_labels)]
+        while len(cards) < 5:
+            cards.append(rng.choice(cards) if rng.random() < density else rng.choice(card_labels))
+        rng.shuffle(cards)
+        yield f"{''.join(cards)} {rng.randint(1, 1000)}"
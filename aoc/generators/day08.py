@@ -0,0 +1,64 @@
+import itertools
+import random
+import string
+
+from typing import Iterator
+
+# size: number of nodes in the network
+# density: share of the steps where left and right lead to different nodes
+default_size = 750
+default_density = 0.5
+
+ghost_count = 6
+middle_letters = string.ascii_uppercase.replace('A', '').replace('Z', '')
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    yield ''.join(rng.choice('LR') for _ in range(rng.randint(10, 300)))
+    yield ''
+    nodes = build_network(rng, size, density)
+    rng.shuffle(nodes)
+    for node, left, right in nodes:
+        yield f'{node} = ({left}, {right})'
+
+
+def build_network(rng: random.Random, size: int, density: float):
+    # Every ghost walks its own track from a node ending in A to a node ending
+    # in Z and then around again. Where a step forks, both branches meet up on
+    # the next step, so the Z node is reached after the same number of steps
+    # whatever the instructions are.
+    ghosts = max(1, min(ghost_count, size // 8))
+    names, prefixes = get_names(rng, size), get_prefixes(rng, ghosts)
+    result = []
+    for ghost in range(ghosts):
+        if ghost == 0:
+            start, stop = 'AAA', 'ZZZ'
+        else:
+            start, stop = prefixes[ghost] + 'A', prefixes[ghost] + 'Z'
+        length = max(2, int(size / ghosts / (1 + density)))
+        steps = []
+        for _ in range(length - 1):
+            name = names.pop()
+            fork = names.pop() if rng.random() < density else name
+            steps.append((name, fork))
+        steps.append((stop, stop))
+        first = steps[0]
+        result.append((start, *first))
+        for (name, fork), (left, right) in zip(steps, steps[1:]):
+            result.append((name, left, right))
+            if fork != name:
+                result.append((fork, left, right))
+        result.append((stop, *first))
+    return result
+
+
+def get_names(rng: random.Random, size: int):
+    names = [''.join(x) for x in itertools.product(string.ascii_uppercase, string.ascii_uppercase, middle_letters)]
+    if size > len(names):
+        raise ValueError(f'at most {len(names)} nodes fit in three letter names')
+    return rng.sample(names, min(len(names), 2 * size))
+
+
+def get_prefixes(rng: random.Random, count: int):
+    prefixes = [''.join(x) for x in itertools.product(string.ascii_uppercase, repeat=2) if x not in [('A', 'A'), ('Z', 'Z')]]
+    return rng.sample(prefixes, count)
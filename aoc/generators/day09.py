@@ -0,0 +1,22 @@
+import random
+
+from typing import Iterator
+
+# size: number of sequences
+# density: how likely each higher polynomial degree is used
+default_size = 200
+default_density = 0.5
+
+sequence_length = 21
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    for _ in range(size):
+        degree = 0
+        while degree < 6 and rng.random() < density:
+            degree += 1
+        coefficients = [rng.randint(-9, 9) for _ in range(degree + 1)]
+        values = []
+        for x in range(sequence_length):
+            values.append(sum(c * x ** i for i, c in enumerate(coefficients)))
+        yield ' '.join(str(x) for x in values)
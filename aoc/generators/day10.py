@@ -0,0 +1,93 @@
+import random
+
+from typing import Iterator
+
+# size: width and height of the field
+# density: share of the field that the main loop covers
+default_size = 140
+default_density = 0.5
+
+north, east, south, west = 1, 2, 4, 8
+pipe_chars = {north | south: '|', east | west: '-', north | east: 'L', north | west: 'J', south | west: '7', south | east: 'F'}
+junk_chars = '|-LJ7F.'
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    openings = build_loop(rng, size, density)
+    start = rng.choice([i for i, x in enumerate(openings) if x])
+    for row in range(size):
+        chars = []
+        for col in range(size):
+            index = row * size + col
+            if index == start:
+                chars.append('S')
+            elif openings[index]:
+                chars.append(pipe_chars[openings[index]])
+            elif is_next_to(index, start, size):
+                # only the two loop tiles next to the start may connect to it
+                chars.append('.')
+            else:
+                chars.append(rng.choice(junk_chars))
+        yield ''.join(chars)
+
+
+def build_loop(rng: random.Random, size: int, density: float) -> bytearray:
+    # Grow a random tree over 3x3 blocks of tiles. Each block starts out as a
+    # small loop around its middle tile and every tree edge splices two loops
+    # together, which leaves one loop that never touches itself.
+    blocks = size // 3
+    if blocks == 0:
+        raise ValueError(f'size must be at least 3: {size}')
+    target = max(1, int(density * blocks * blocks))
+    root = (rng.randrange(blocks), rng.randrange(blocks))
+    tree, edges = {root}, []
+    frontier = [(root, x) for x in get_block_neighbors(root, blocks)]
+    while frontier and len(tree) < target:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        parent, child = frontier.pop()
+        if child not in tree:
+            tree.add(child)
+            edges.append((parent, child))
+            frontier.extend((child, x) for x in get_block_neighbors(child, blocks) if x not in tree)
+    result = bytearray(size * size)
+    for block in tree:
+        top = get_corner(block, size)
+        middle, bottom = top + size, top + 2 * size
+        result[top:top + 3] = bytes([south | east, east | west, south | west])
+        result[middle] = result[middle + 2] = north | south
+        result[bottom:bottom + 3] = bytes([north | east, east | west, north | west])
+    for first, second in edges:
+        first, second = sorted([first, second])
+        corner, other = get_corner(first, size), get_corner(second, size)
+        if first[0] == second[0]:
+            # swap the top right edge of the first block for links to the second
+            result[corner + 2] ^= south | east
+            result[corner + size + 2] ^= north | east
+            result[other] ^= south | west
+            result[other + size] ^= north | west
+        else:
+            # swap the bottom left edge of the first block for links to the second
+            result[corner + 2 * size] ^= east | south
+            result[corner + 2 * size + 1] ^= west | south
+            result[other] ^= east | north
+            result[other + 1] ^= west | north
+    return result
+
+
+def get_corner(block, size):
+    row, col = block
+    return 3 * row * size + 3 * col
+
+
+def get_block_neighbors(block, blocks):
+    row, col = block
+    for r, c in [(row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)]:
+        if 0 <= r < blocks and 0 <= c < blocks:
+            yield r, c
+
+
+def is_next_to(index: int, other: int, size: int):
+    row, col = divmod(index, size)
+    other_row, other_col = divmod(other, size)
+    return abs(row - other_row) + abs(col - other_col) == 1
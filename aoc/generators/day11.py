@@ -0,0 +1,16 @@
+import random
+
+from typing import Iterator
+
+# size: width and height of the image
+# density: chance that a cell holds a galaxy
+default_size = 140
+default_density = 0.02
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    rows = [rng.choices('#.', [density, 1 - density], k=size) for _ in range(size)]
+    # the solvers need at least two galaxies to measure anything
+    rows[0][0] = rows[-1][-1] = '#'
+    for row in rows:
+        yield ''.join(row)
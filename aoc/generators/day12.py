@@ -0,0 +1,17 @@
+import random
+
+from typing import Iterator
+
+# size: number of condition records
+# density: chance that a spring's condition is unknown
+default_size = 1000
+default_density = 0.4
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    for _ in range(size):
+        springs = [rng.choice('#.') for _ in range(rng.randint(3, 18))]
+        springs[rng.randrange(len(springs))] = '#'
+        groups = [len(x) for x in ''.join(springs).split('.') if x]
+        record = ''.join('?' if rng.random() < density else x for x in springs)
+        yield f"{record} {','.join(str(x) for x in groups)}"
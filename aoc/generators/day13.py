@@ -0,0 +1,55 @@
+import random
+
+from typing import Iterator, List
+
+# size: number of patterns
+# density: chance that a cell is rock (#) rather than ash (.)
+default_size = 100
+default_density = 0.5
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    density = min(max(density, 0.05), 0.95)
+    for i in range(size):
+        if i:
+            yield ''
+        yield from build_pattern(rng, density)
+
+
+def build_pattern(rng: random.Random, density: float) -> List[str]:
+    # Mirror the pattern across one line exactly and across another line with
+    # a single smudge, then keep it only if no other line is a reflection with
+    # zero or one smudges, so both parts have exactly one answer.
+    while True:
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        rows = [['#' if rng.random() < density else '.' for _ in range(width)] for _ in range(height)]
+        col = rng.randrange(width - 1)
+        col_reach = min(col + 1, width - col - 1)
+        for row in rows:
+            for offset in range(col_reach):
+                row[col + 1 + offset] = row[col - offset]
+        row = rng.choice([x for x in range(height - 1) if x < height // 2 - 1 or x >= (height + 1) // 2])
+        reach = min(row + 1, height - row - 1)
+        for offset in range(reach):
+            rows[row + 1 + offset] = rows[row - offset][:]
+        unmirrored = [x for x in range(height) if not row - reach < x <= row + reach]
+        smudge_row = rng.choice(unmirrored)
+        smudge_col = rng.randrange(col - col_reach + 1, col + col_reach + 1)
+        rows[smudge_row][smudge_col] = '.' if rows[smudge_row][smudge_col] == '#' else '#'
+        result = [''.join(x) for x in rows]
+        if rng.random() < 0.5:
+            result = [''.join(x) for x in zip(*result)]
+        if sorted(count_smudges(result)) == [0, 1]:
+            return result
+
+
+def count_smudges(rows: List[str]) -> Iterator[int]:
+    # yields the number of differences for every line that is off by at most one
+    for grid in [rows, [''.join(x) for x in zip(*rows)]]:
+        for i in range(len(grid) - 1):
+            differences = 0
+            for offset in range(min(i + 1, len(grid) - i - 1)):
+                a, b = grid[i - offset], grid[i + 1 + offset]
+                differences += sum(1 for x, y in zip(a, b) if x != y)
+            if differences <= 1:
+                yield differences
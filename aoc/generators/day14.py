@@ -0,0 +1,14 @@
+import random
+
+from typing import Iterator
+
+# size: width and height of the platform
+# density: chance that a cell holds a rock, split between round and cube rocks
+default_size = 100
+default_density = 0.35
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    weights = [0.6 * density, 0.4 * density, 1 - density]
+    for _ in range(size):
+        yield ''.join(rng.choices('O#.', weights, k=size))
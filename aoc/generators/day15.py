@@ -0,0 +1,18 @@
+import random
+import string
+
+from typing import Iterator
+
+# size: number of steps in the initialization sequence
+# density: share of the steps that remove a lens
+default_size = 4000
+default_density = 0.3
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    labels = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(max(1, size // 5))]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(f'{label}-' if rng.random() < density else f'{label}={rng.randint(1, 9)}')
+    yield ','.join(steps)
@@ -0,0 +1,16 @@
+import random
+
+from typing import Iterator
+
+# size: width and height of the contraption
+# density: chance that a tile holds a mirror or splitter
+default_size = 110
+default_density = 0.1
+
+devices = '|-/\\'
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    weights = [density / len(devices)] * len(devices) + [1 - density]
+    for _ in range(size):
+        yield ''.join(rng.choices(devices + '.', weights, k=size))
@@ -0,0 +1,14 @@
+import random
+
+from typing import Iterator
+
+# size: width and height of the city map
+# density: chance that a block loses a lot of heat (7-9) rather than a little (1-6)
+default_size = 141
+default_density = 0.3
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    weights = [(1 - density) / 6] * 6 + [density / 3] * 3
+    for _ in range(size):
+        yield ''.join(rng.choices('123456789', weights, k=size))
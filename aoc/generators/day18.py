@@ -0,0 +1,40 @@
+import random
+
+from typing import Iterator, List, Tuple
+
+# size: number of dig steps in the plan (rounded down to an even number)
+# density: share of the lagoon's bounding box that gets dug out
+default_size = 700
+default_density = 0.5
+
+hex_limit = 0xFFFFF
+direction_digits = {'R': 0, 'D': 1, 'L': 2, 'U': 3}
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    columns = max(1, (size - 2) // 2)
+    small = build_trench(rng, columns, 10, 20, density)
+    large = build_trench(rng, columns, max(1, hex_limit // columns), hex_limit, density)
+    for (direction, distance), (color_direction, color_distance) in zip(small, large):
+        yield f'{direction} {distance} (#{color_distance:05x}{direction_digits[color_direction]})'
+
+
+def build_trench(rng: random.Random, columns: int, max_width: int, max_depth: int, density: float) -> List[Tuple[str, int]]:
+    # The lagoon hangs down from a straight top edge as a row of columns with
+    # different depths, so the trench never crosses itself. Like the real
+    # plans, no step is shorter than two metres and the trench never turns
+    # back up at the left edge, which day 18 part 2 relies on.
+    min_depth = min(max_depth - 2, max(2, int(max_depth * density)))
+    result, total_width, depth = [], 0, 0
+    for i in range(columns):
+        next_depth = depth
+        while abs(next_depth - depth) < 2:
+            next_depth = min_depth if i == 0 else rng.randint(min_depth, max_depth)
+        result.append(('D' if next_depth > depth else 'U', abs(next_depth - depth)))
+        width = rng.randint(2, max(2, max_width))
+        result.append(('R', width))
+        total_width += width
+        depth = next_depth
+    result.append(('U', depth))
+    result.append(('L', total_width))
+    return result
@@ -0,0 +1,49 @@
+import itertools
+import random
+import string
+
+from typing import Iterator
+
+# size: number of workflows, and of parts to sort
+# density: chance that a rule which ends the sorting accepts the part
+default_size = 550
+default_density = 0.5
+
+categories = 'xmas'
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    # The workflows form a tree under 'in', the way they do in the real puzzle,
+    # so part 2 never visits a workflow twice.
+    names = get_names(rng, size - 1)
+    queue, remaining = ['in'], size - 1
+    while queue:
+        name = queue.pop(0)
+        destinations = []
+        for _ in range(rng.randint(2, 4)):
+            if remaining > 0 and (rng.random() < 0.6 or not queue and not destinations):
+                destinations.append(names.pop())
+                queue.append(destinations[-1])
+                remaining -= 1
+            else:
+                destinations.append('A' if rng.random() < density else 'R')
+        rules = [f'{get_comparison(rng)}:{x}' for x in destinations[:-1]] + destinations[-1:]
+        yield f"{name}{{{','.join(rules)}}}"
+    yield ''
+    for _ in range(size):
+        yield '{' + ','.join(f'{x}={rng.randint(1, 4000)}' for x in categories) + '}'
+
+
+def get_comparison(rng: random.Random):
+    if rng.random() < 0.5:
+        return f'{rng.choice(categories)}<{rng.randint(2, 4000)}'
+    return f'{rng.choice(categories)}>{rng.randint(1, 3999)}'
+
+
+def get_names(rng: random.Random, count: int):
+    names = []
+    for length in itertools.count(2):
+        if len(names) >= count:
+            break
+        names.extend(''.join(x) for x in itertools.product(string.ascii_lowercase, repeat=length) if x != ('i', 'n'))
+    return rng.sample(names, count)
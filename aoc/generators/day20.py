@@ -0,0 +1,51 @@
+import itertools
+import random
+import string
+
+from typing import Iterator
+
+# size: number of modules
+# density: share of each counter's flip-flops that report to its conjunction
+default_size = 58
+default_density = 0.6
+
+counter_bits = 12
+
+
+def generate(rng: random.Random, size: int, density: float) -> Iterator[str]:
+    # Like the real puzzle, the broadcaster drives a set of binary counters. A
+    # conjunction watches each counter, resets it when it reaches its number
+    # and reports through an inverter to the conjunction in front of rx.
+    bits = max(2, min(counter_bits, size - 5))
+    counters = max(1, (size - 2) // (bits + 2))
+    names = get_names(rng, counters * (bits + 2) + 1)
+    final = names.pop()
+    modules, starts = [], []
+    for _ in range(counters):
+        flip_flops = [names.pop() for _ in range(bits)]
+        hub, inverter = names.pop(), names.pop()
+        hub_outputs = [flip_flops[0]]
+        for i, flip_flop in enumerate(flip_flops):
+            outputs = flip_flops[i + 1:i + 2]
+            if i in (0, bits - 1) or rng.random() < density:
+                outputs.append(hub)
+            elif i > 0:
+                hub_outputs.append(flip_flop)
+            modules.append(f"%{flip_flop} -> {', '.join(outputs)}")
+        rng.shuffle(hub_outputs)
+        modules.append(f"&{hub} -> {', '.join(hub_outputs + [inverter])}")
+        modules.append(f'&{inverter} -> {final}')
+        starts.append(flip_flops[0])
+    modules.append(f'&{final} -> rx')
+    modules.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(modules)
+    yield from modules
+
+
+def get_names(rng: random.Random, count: int):
+    names = []
+    for length in itertools.count(2):
+        if len(names) >= count:
+            break
+        names.extend(''.join(x) for x in itertools.product(string.ascii_lowercase, repeat=length) if x != ('r', 'x'))
+    return rng.sample(names, count)
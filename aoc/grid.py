@@ -0,0 +1,129 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from aoc import inputs
+
+north, east, south, west = (-1, 0), (0, 1), (1, 0), (0, -1)
+orthogonal = (north, east, south, west)
+diagonal = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+adjacent = orthogonal + diagonal
+
+Value = Union[int, str]
+
+
+class Grid:
+    # One byte per cell, stored row after row in a single bytearray.
+
+    def __init__(self, height: int, width: int, fill: Value = 0, data: bytearray = None):
+        if data is None:
+            data = bytearray([_to_byte(fill)]) * (height * width)
+        elif len(data) != height * width:
+            raise ValueError(f'{len(data)} bytes do not make a {height}x{width} grid')
+        self.height, self.width = height, width
+        self.data = data
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Union[str, bytes]]) -> 'Grid':
+        rows = [x.encode('ascii') if isinstance(x, str) else bytes(x) for x in lines]
+        width = len(rows[0]) if rows else 0
+        for i, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f'row {i} is {len(row)} wide instead of {width}')
+        return cls(len(rows), width, data=bytearray().join(rows))
+
+    @classmethod
+    def from_input(cls, source: inputs.Input) -> 'Grid':
+        byte_grid = source.grid()
+        return cls(byte_grid.height, byte_grid.width, data=bytearray().join(byte_grid))
+
+    def __getitem__(self, key: Tuple[int, int]) -> int:
+        row, col = key
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f'{key} is outside the grid')
+        return self.data[row * self.width + col]
+
+    def __setitem__(self, key: Tuple[int, int], value: int):
+        row, col = key
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise IndexError(f'{key} is outside the grid')
+        self.data[row * self.width + col] = value
+
+    def __eq__(self, other):
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.height, self.width, self.data) == (other.height, other.width, other.data)
+
+    def __repr__(self):
+        return f'Grid(height={self.height}, width={self.width})'
+
+    def get(self, row: int, col: int, default: Optional[int] = None) -> Optional[int]:
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.data[row * self.width + col]
+        return default
+
+    def contains(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.width + col
+
+    def position(self, index: int) -> Tuple[int, int]:
+        return divmod(index, self.width)
+
+    def row(self, row: int) -> memoryview:
+        return memoryview(self.data)[row * self.width:(row + 1) * self.width]
+
+    def column(self, col: int) -> memoryview:
+        return memoryview(self.data)[col::self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        for row in range(self.height):
+            yield self.row(row)
+
+    def columns(self) -> Iterator[memoryview]:
+        for col in range(self.width):
+            yield self.column(col)
+
+    def lines(self) -> List[str]:
+        return [str(x, 'ascii') for x in self.rows()]
+
+    def neighbors(self, row: int, col: int, offsets=orthogonal) -> Iterator[Tuple[int, int]]:
+        for row_offset, col_offset in offsets:
+            r, c = row + row_offset, col + col_offset
+            if 0 <= r < self.height and 0 <= c < self.width:
+                yield r, c
+
+    def index_offsets(self, offsets=orthogonal) -> Tuple[int, ...]:
+        # for walking self.data directly; the caller has to keep away from the edges
+        return tuple(row * self.width + col for row, col in offsets)
+
+    def find(self, value: Value) -> Optional[Tuple[int, int]]:
+        index = self.data.find(_to_byte(value))
+        return None if index == -1 else self.position(index)
+
+    def find_all(self, value: Value) -> Iterator[Tuple[int, int]]:
+        needle = _to_byte(value)
+        index = self.data.find(needle)
+        while index != -1:
+            yield self.position(index)
+            index = self.data.find(needle, index + 1)
+
+    def count(self, value: Value) -> int:
+        return self.data.count(_to_byte(value))
+
+    def copy(self) -> 'Grid':
+        return Grid(self.height, self.width, data=self.data[:])
+
+    def transpose(self) -> 'Grid':
+        result = bytearray(len(self.data))
+        for col in range(self.width):
+            result[col * self.height:(col + 1) * self.height] = self.data[col::self.width]
+        return Grid(self.width, self.height, data=result)
+
+    def to_numpy(self):
+        # shares memory with the grid, so writes show up on both sides
+        import numpy
+        return numpy.frombuffer(self.data, dtype=numpy.uint8).reshape(self.height, self.width)
+
+
+def _to_byte(value: Value) -> int:
+    return ord(value) if isinstance(value, str) else value
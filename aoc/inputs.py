@@ -0,0 +1,201 @@
+import itertools
+import mmap
+import operator
+import os
+
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+whitespace = b' \t\r\n'
+newline = b'\n'
+
+
+class ByteGrid:
+
+    def __init__(self, source, offset: int, height: int, width: int, stride: int):
+        self._source, self._offset = source, offset
+        self._height, self._width, self._stride = height, width, stride
+        self._data = memoryview(source)
+
+    def __getitem__(self, key: Tuple[int, int]) -> int:
+        row, col = key
+        if not (0 <= row < self._height and 0 <= col < self._width):
+            raise IndexError(f'{key} is outside the grid')
+        return self._source[self._offset + row * self._stride + col]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for row in range(self._height):
+            yield self.row(row)
+
+    @property
+    def height(self):
+        return self._height
+
+    @property
+    def width(self):
+        return self._width
+
+    def row(self, row: int) -> memoryview:
+        start = self._offset + row * self._stride
+        return self._data[start:start + self._width]
+
+    def find_all(self, value: int) -> Iterator[Tuple[int, int]]:
+        needle = bytes([value])
+        for row in range(self._height):
+            start = self._offset + row * self._stride
+            end = start + self._width
+            col = self._source.find(needle, start, end)
+            while col != -1:
+                yield row, col - start
+                col = self._source.find(needle, col + 1, end)
+
+
+class Input:
+
+    def __init__(self, path: str):
+        self.path = path
+        self._source = b''
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size > 0:
+                self._source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._source)
+        self._starts = self._ends = None
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def data(self) -> memoryview:
+        return self._data
+
+    def lines(self) -> Iterator[memoryview]:
+        starts, ends = self._get_offsets()
+        data = self._data
+        for start, end in zip(starts, ends):
+            yield data[start:end]
+
+    def text_lines(self) -> Iterator[str]:
+        starts, ends = self._get_offsets()
+        data = self._data
+        for start, end in zip(starts, ends):
+            yield str(data[start:end], 'ascii')
+
+    def blocks(self) -> List[List[memoryview]]:
+        return self._split_blocks(self.lines())
+
+    def text_blocks(self) -> List[List[str]]:
+        return self._split_blocks(self.text_lines())
+
+    def grid(self) -> ByteGrid:
+        starts, ends = self._get_offsets()
+        height = len(starts)
+        while height > 0 and starts[height - 1] == ends[height - 1]:
+            height -= 1
+        if height == 0:
+            return ByteGrid(self._source, 0, 0, 0, 1)
+        width = ends[0] - starts[0]
+        stride = starts[1] - starts[0] if height > 1 else width
+        for row in range(height):
+            if starts[row] != row * stride + starts[0] or ends[row] - starts[row] != width:
+                raise ValueError(f'{self.path} is not a rectangular grid (row {row})')
+        return ByteGrid(self._source, starts[0], height, width, stride)
+
+    def close(self):
+        # Unmaps the file now, unless lines or grids taken from it are still
+        # in use; then it goes when the last of them does. Either way load
+        # no longer hands this Input out.
+        for key in [k for k, v in _loaded.items() if v is self]:
+            del _loaded[key]
+        self._data.release()
+        if isinstance(self._source, mmap.mmap):
+            try:
+                self._source.close()
+            except BufferError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get_offsets(self):
+        if self._starts is None:
+            self._starts, self._ends = find_line_offsets(self._source)
+        return self._starts, self._ends
+
+    @staticmethod
+    def _split_blocks(lines):
+        result, block = [], []
+        for line in lines:
+            if len(line) == 0:
+                if block:
+                    result.append(block)
+                block = []
+            else:
+                block.append(line)
+        if block:
+            result.append(block)
+        return result
+
+
+def find_line_offsets(source) -> Tuple[array, array]:
+    # Lines are trimmed the way str.strip() trimmed them, but by moving the
+    # offsets instead of copying the bytes. A chunk at a time, the lines are
+    # split off and measured by mapping builtins over them, so no Python code
+    # runs per line: a line starts after the lines before it and what
+    # lstrip() drops, and ends strip()'s length later.
+    starts, ends = array('q'), array('q')
+    position = 0
+    for chunk in line_chunks(source):
+        lines = chunk.split(newline)
+        if chunk.endswith(newline):
+            lines.pop()
+        lengths = list(map(len, lines))
+        positions = itertools.accumulate(map(operator.add, lengths, itertools.repeat(1)), initial=position)
+        leading = map(operator.sub, lengths, map(len, map(bytes.lstrip, lines, itertools.repeat(whitespace))))
+        chunk_starts = array('q', map(operator.add, positions, leading))
+        starts.extend(chunk_starts)
+        ends.extend(map(operator.add, chunk_starts, map(len, map(bytes.strip, lines, itertools.repeat(whitespace)))))
+        position += len(chunk)
+    return starts, ends
+
+
+def line_chunks(data, size: int = 2 ** 24) -> Iterator[bytes]:
+    # Copies of about size bytes that always end at a line break, for work
+    # that is done a buffer at a time rather than a line at a time.
+    position, length = 0, len(data)
+    while position < length:
+        end = min(position + size, length)
+        chunk = bytes(data[position:end])
+        while end < length and not chunk.endswith(newline):
+            cut = chunk.rfind(newline) + 1
+            if cut:
+                chunk, end = chunk[:cut], position + cut
+                break
+            # a line longer than size, so keep reading until it ends
+            end = min(end + size, length)
+            chunk = bytes(data[position:end])
+        yield chunk
+        position = end
+
+
+_loaded: Dict[Tuple[str, int, int], Input] = {}
+
+
+def load(path: str) -> Input:
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _loaded:
+        # an older version of the file is not going to be asked for again
+        release(path)
+        _loaded[key] = Input(path)
+    return _loaded[key]
+
+
+def release(path: str):
+    # closes whatever load kept of path, for callers that go through many
+    # inputs one after another
+    path = os.path.abspath(path)
+    for source in [v for k, v in _loaded.items() if k[0] == path]:
+        source.close()
@@ -0,0 +1,160 @@
+import collections
+import contextlib
+import cProfile
+import functools
+import os
+import pstats
+import signal
+import time
+
+from typing import Callable, Counter, Dict, List
+
+# Counters and timers only do anything once enable() has been called. Timers
+# are attached when a function is defined, so the runner turns them on before
+# it loads the solver; a solver loaded without them gets its own functions
+# back from timed() and pays nothing at all.
+enabled = False
+counters: Counter[str] = collections.Counter()
+timers: Dict[str, List[int]] = {}
+
+profilers = ['cprofile', 'sample']
+default_interval = 0.001
+
+
+def enable():
+    global enabled
+    enabled = True
+    reset()
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    counters.clear()
+    timers.clear()
+
+
+def count(name: str, n: int = 1):
+    if enabled:
+        counters[name] += n
+
+
+def timed(function: Callable = None, name: str = None):
+    if function is None:
+        return functools.partial(timed, name=name)
+    if not enabled:
+        return function
+    name = name or function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timer = timers.setdefault(name, [0, 0])
+            timer[0] += 1
+            timer[1] += time.perf_counter_ns() - start
+    return wrapper
+
+
+def format_report(counters: Dict[str, int], timers: Dict[str, List[int]]):
+    lines = [f'    {name}: {value}' for name, value in sorted(counters.items())]
+    for name, (calls, ns) in sorted(timers.items(), key=lambda x: -x[1][1]):
+        lines.append(f'    {name}: {calls} calls, {ns / 1e6:.3f} ms')
+    return '\n'.join(lines)
+
+
+class Sampler:
+    # Samples the Python stack on a CPU-time timer, so only time spent running
+    # counts. Only works in the main thread of a process that has setitimer.
+
+    def __init__(self, interval: float = default_interval):
+        self.interval = interval
+        self.stacks: Counter[str] = collections.Counter()
+        self._previous = None
+
+    def start(self):
+        if not hasattr(signal, 'setitimer'):
+            raise RuntimeError('sampling needs signal.setitimer')
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+    def _sample(self, signum, frame):
+        names = []
+        while frame is not None:
+            names.append(_frame_name(frame.f_code))
+            frame = frame.f_back
+        self.stacks[';'.join(reversed(names))] += 1
+
+
+def folded_from_stats(stats: pstats.Stats) -> Counter[str]:
+    # cProfile only knows the direct callers of each function, so each
+    # function's own time is hung under its most expensive chain of callers.
+    # Good enough to see the hot spots, not an exact call tree.
+    entries = stats.stats
+    result = collections.Counter()
+    for function, (_, _, own_time, _, callers) in entries.items():
+        microseconds = int(own_time * 1e6)
+        if microseconds == 0:
+            continue
+        names, seen = [], set()
+        while function is not None and function not in seen:
+            seen.add(function)
+            names.append(_stats_name(function))
+            callers = entries[function][4] if function in entries else {}
+            function = max(callers, key=lambda x: callers[x][3]) if callers else None
+        result[';'.join(reversed(names))] += microseconds
+    return result
+
+
+def write_folded(path: str, stacks: Counter[str]):
+    # one "frame;frame;frame weight" line per stack, the input flamegraph.pl
+    # and speedscope both read
+    with open(path, 'w') as file:
+        for stack, weight in sorted(stacks.items()):
+            file.write(f'{stack} {weight}\n')
+
+
+@contextlib.contextmanager
+def profile(kind: str, path: str, interval: float = default_interval):
+    # Writes path + '.folded'; cProfile runs also keep their stats in
+    # path + '.prof' for pstats and snakeviz.
+    if kind not in profilers:
+        raise ValueError(f'unknown profiler {kind!r}')
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    if kind == 'sample':
+        sampler = Sampler(interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            write_folded(path + '.folded', sampler.stacks)
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path + '.prof')
+        write_folded(path + '.folded', folded_from_stats(pstats.Stats(profiler)))
+
+
+def _frame_name(code) -> str:
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+def _stats_name(function) -> str:
+    filename, line, name = function
+    if filename == '~':
+        return name
+    return f'{name} ({os.path.basename(filename)}:{line})'
@@ -0,0 +1,180 @@
+import bisect
+import itertools
+
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from aoc import lazy
+
+Rule = Tuple[int, int, int]
+
+
+class PiecewiseMap:
+    # A function on the non-negative integers that adds a constant to every
+    # value in a piece: piece i covers starts[i] up to starts[i + 1] (the
+    # last one goes on forever) and adds offsets[i]. Pieces are sorted by
+    # start, so finding the piece of a value is one bisect, and two maps can
+    # be chained into one whose pieces are worked out ahead of time.
+
+    def __init__(self, starts: Sequence[int], offsets: Sequence[int]):
+        if not starts or starts[0] != 0:
+            raise ValueError('the first piece must start at 0')
+        if len(starts) != len(offsets):
+            raise ValueError('every piece needs a start and an offset')
+        self.starts: List[int] = []
+        self.offsets: List[int] = []
+        for start, offset in zip(starts, offsets):
+            if self.starts and start <= self.starts[-1]:
+                raise ValueError(f'pieces are not in order at {start}')
+            # neighbors that add the same amount are one piece
+            if not self.offsets or offset != self.offsets[-1]:
+                self.starts.append(start)
+                self.offsets.append(offset)
+
+    @classmethod
+    def identity(cls) -> 'PiecewiseMap':
+        return cls([0], [0])
+
+    @classmethod
+    def _from_lists(cls, starts: List[int], offsets: List[int]) -> 'PiecewiseMap':
+        # for pieces already known to be in order and merged
+        result = cls.__new__(cls)
+        result.starts, result.offsets = starts, offsets
+        return result
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[Rule]) -> 'PiecewiseMap':
+        # rules as written in the almanac: (destination start, source start,
+        # length); values no rule covers are left as they are
+        starts, offsets = [0], [0]
+        end = 0
+        for destination, source, length in sorted(rules, key=lambda x: x[1]):
+            if length <= 0:
+                continue
+            if source < end:
+                raise ValueError(f'rules overlap at {source}')
+            if source > end:
+                starts.append(end)
+                offsets.append(0)
+            starts.append(source)
+            offsets.append(destination - source)
+            end = source + length
+        starts.append(end)
+        offsets.append(0)
+        # the rule at 0, if there is one, replaces the leading identity piece
+        if len(starts) > 1 and starts[1] == 0:
+            starts, offsets = starts[1:], offsets[1:]
+        return cls(starts, offsets)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect.bisect_right(self.starts, value) - 1]
+
+    def __eq__(self, other):
+        return isinstance(other, PiecewiseMap) and self.starts == other.starts and self.offsets == other.offsets
+
+    def __repr__(self):
+        return f'PiecewiseMap({self.starts}, {self.offsets})'
+
+    def pieces(self) -> Iterator[Tuple[int, int, int]]:
+        # (start, stop, offset) for every piece, stop None for the last one
+        for i, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            yield start, self.starts[i + 1] if i + 1 < len(self.starts) else None, offset
+
+    def then(self, other: 'PiecewiseMap') -> 'PiecewiseMap':
+        # The map of other(self(x)). Each piece of self is cut where its image
+        # crosses a start of other, so the result has at most
+        # len(self) + len(other) pieces per piece of self, usually far fewer.
+        # numpy saves about 1 us a piece
+        numpy = lazy.numpy_for(len(self) + len(other), 1e-6)
+        if numpy:
+            return self._numpy_then(numpy, other)
+        starts, offsets = [], []
+        for start, stop, offset in self.pieces():
+            j = bisect.bisect_right(other.starts, start + offset) - 1
+            while True:
+                starts.append(max(start, other.starts[j] - offset))
+                offsets.append(offset + other.offsets[j])
+                j += 1
+                if j == len(other.starts) or (stop is not None and other.starts[j] >= stop + offset):
+                    break
+        return PiecewiseMap(starts, offsets)
+
+    def _numpy_then(self, numpy, other):
+        starts = numpy.array(self.starts, dtype=numpy.int64)
+        offsets = numpy.array(self.offsets, dtype=numpy.int64)
+        other_starts = numpy.array(other.starts, dtype=numpy.int64)
+        other_offsets = numpy.array(other.offsets, dtype=numpy.int64)
+        # the pieces of other that each image runs from and to; the image of
+        # the last piece runs on to the last piece of other
+        first = numpy.searchsorted(other_starts, starts + offsets, side='right') - 1
+        last = numpy.append(numpy.searchsorted(other_starts, starts[1:] + offsets[:-1] - 1, side='right') - 1, len(other_starts) - 1)
+        counts = last - first + 1
+        owners = numpy.repeat(numpy.arange(len(starts)), counts)
+        pieces = numpy.arange(len(owners)) - numpy.repeat(numpy.cumsum(counts) - counts, counts) + first[owners]
+        result_starts = numpy.maximum(starts[owners], other_starts[pieces] - offsets[owners])
+        result_offsets = offsets[owners] + other_offsets[pieces]
+        keep = numpy.append(True, result_offsets[1:] != result_offsets[:-1])
+        return PiecewiseMap._from_lists(result_starts[keep].tolist(), result_offsets[keep].tolist())
+
+    def apply_ranges(self, ranges: Iterable[range]) -> Iterator[range]:
+        # The image of every range, as one range per piece it touches. The
+        # ranges are sorted first so the pieces are walked once for all of
+        # them rather than searched for each.
+        starts, offsets = self.starts, self.offsets
+        j = 0
+        for r in sorted((x for x in ranges if len(x)), key=lambda x: x.start):
+            while j + 1 < len(starts) and starts[j + 1] <= r.start:
+                j += 1
+            k, start = j, r.start
+            while start < r.stop:
+                stop = r.stop if k + 1 == len(starts) else min(r.stop, starts[k + 1])
+                yield range(start + offsets[k], stop + offsets[k])
+                start, k = stop, k + 1
+
+    def minimum(self, ranges: Iterable[range]) -> int:
+        # The smallest value the map gives any value in the ranges. Within a
+        # range only its own start and the starts of the pieces inside it can
+        # give the smallest value, so no range has to be cut up.
+        ranges = [x for x in ranges if len(x)]
+        if not ranges:
+            raise ValueError('no values to map')
+        # numpy saves about 2.5 us a range
+        numpy = lazy.numpy_for(len(ranges), 2.5e-6)
+        if numpy:
+            return self._numpy_minimum(numpy, ranges)
+        starts, offsets = self.starts, self.offsets
+        lowest = [start + offset for start, offset in zip(starts, offsets)]
+        result = None
+        for r in ranges:
+            first = bisect.bisect_right(starts, r.start) - 1
+            last = bisect.bisect_right(starts, r.stop - 1) - 1
+            value = min(itertools.chain([r.start + offsets[first]], lowest[first + 1:last + 1]))
+            result = value if result is None else min(result, value)
+        return result
+
+    def _numpy_minimum(self, numpy, ranges):
+        starts = numpy.array(self.starts, dtype=numpy.int64)
+        offsets = numpy.array(self.offsets, dtype=numpy.int64)
+        begins = numpy.fromiter((x.start for x in ranges), dtype=numpy.int64, count=len(ranges))
+        ends = numpy.fromiter((x.stop for x in ranges), dtype=numpy.int64, count=len(ranges))
+        first = numpy.searchsorted(starts, begins, side='right') - 1
+        last = numpy.searchsorted(starts, ends - 1, side='right') - 1
+        result = (begins + offsets[first]).min()
+        # only the overall minimum is wanted, so mark every piece that starts
+        # inside some range with a difference array and look at those once
+        marks = numpy.zeros(len(starts) + 1, dtype=numpy.int64)
+        numpy.add.at(marks, first + 1, 1)
+        numpy.add.at(marks, last + 1, -1)
+        inside = numpy.cumsum(marks[:-1]) > 0
+        if inside.any():
+            result = min(result, (starts + offsets)[inside].min())
+        return int(result)
+
+
+def chain(maps: Iterable[PiecewiseMap]) -> PiecewiseMap:
+    result = PiecewiseMap.identity()
+    for x in maps:
+        result = result.then(x)
+    return result
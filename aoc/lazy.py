@@ -0,0 +1,77 @@
+import importlib
+import re
+
+from typing import Callable
+
+_unset = object()
+
+
+class Lazy:
+    # Stands in for a value that is only built the first time it is used.
+    # Attributes are copied onto the proxy as they are looked up, so after the
+    # first call pattern.fullmatch costs the same as on the real pattern.
+
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._value = _unset
+
+    def get(self):
+        if self._value is _unset:
+            self._value = self._factory()
+        return self._value
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        value = getattr(self.get(), name)
+        setattr(self, name, value)
+        return value
+
+    def __iter__(self):
+        return iter(self.get())
+
+    def __len__(self):
+        return len(self.get())
+
+    def __getitem__(self, key):
+        return self.get()[key]
+
+    def __contains__(self, item):
+        return item in self.get()
+
+    def __repr__(self):
+        return repr(self.get()) if self._value is not _unset else f'<lazy {self._factory.__name__}>'
+
+
+def compile(pattern: str, flags: int = 0) -> Lazy:
+    return Lazy(lambda: re.compile(pattern, flags))
+
+
+def table(factory: Callable) -> Lazy:
+    return Lazy(factory)
+
+
+_modules = {}
+# What loading numpy costs, measured here at about 0.12 s. A numpy path is only
+# taken when the time it saves on the records in hand pays that back; the
+# saving per record is measured against the plain loop where each path is.
+numpy_import_seconds = 0.12
+
+
+def optional_import(name: str):
+    # The module, or None if it is not installed. Only tried when first asked
+    # for, so a solver that never needs numpy never pays for loading it.
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError:
+            _modules[name] = None
+    return _modules[name]
+
+
+def numpy_for(records: int, saving: float, setup: float = 0.0):
+    # numpy, if it is installed and a path that runs saving seconds a record
+    # faster than the loop, plus setup seconds once, is worth loading it for
+    if records * saving < numpy_import_seconds + setup:
+        return None
+    return optional_import('numpy')
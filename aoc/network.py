@@ -0,0 +1,216 @@
+import math
+
+from array import array
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
+
+from aoc import inputs, lazy
+
+node_pattern = lazy.compile(r'(\w+) = \((\w+), (\w+)\)')
+
+
+@dataclass(frozen=True)
+class Cycle:
+    # Where a walk ends up going round for ever. The state (node, position in
+    # the instructions) first repeats after offset + length steps, back to
+    # where it was after offset steps. hits are the steps before that on a
+    # target node; those from offset on come round again every length steps.
+    start: str
+    offset: int
+    length: int
+    hits: Tuple[int, ...]
+
+    def is_hit(self, step: int) -> bool:
+        if step >= self.offset:
+            step = self.offset + (step - self.offset) % self.length
+        return step in self.hits
+
+    def repeating_hits(self) -> Tuple[int, ...]:
+        return tuple(x for x in self.hits if x >= self.offset)
+
+
+class Network:
+    # The nodes as ids 0..n-1 with their left and right neighbors in two flat
+    # arrays, and the instructions as 0 (left) or 1 (right), so a step is two
+    # index lookups instead of hashing names.
+
+    def __init__(self, instructions: str, nodes: Dict[str, Tuple[str, str]]):
+        if not instructions or set(instructions) - set('LR'):
+            raise ValueError(f'instructions must be L and R: {instructions!r}')
+        self.instructions = instructions
+        self.names: List[str] = list(nodes)
+        self.ids = {x: i for i, x in enumerate(self.names)}
+        self.left = array('l', [self.ids[left] for left, _ in nodes.values()])
+        self.right = array('l', [self.ids[right] for _, right in nodes.values()])
+        self.turns = bytes(x == 'R' for x in instructions)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> 'Network':
+        lines = iter(lines)
+        instructions = next(lines).strip()
+        nodes = {}
+        for line in lines:
+            match = node_pattern.fullmatch(line)
+            if match:
+                nodes[match.group(1)] = match.group(2), match.group(3)
+        return cls(instructions, nodes)
+
+    @classmethod
+    def from_input(cls, source: inputs.Input) -> 'Network':
+        return cls.from_lines(source.text_lines())
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, suffix: str) -> List[str]:
+        return [x for x in self.names if x.endswith(suffix)]
+
+    def step(self, node: int, position: int) -> int:
+        return (self.right if self.turns[position % len(self.turns)] else self.left)[node]
+
+    def first_hit(self, start: str, targets: Collection[str]) -> Optional[int]:
+        # steps from start to the first target, or None if the walk goes
+        # round for ever without reaching one
+        moves, turns = (self.left, self.right), self.turns
+        size = len(turns)
+        targets = {self.ids[x] for x in targets if x in self.ids}
+        # a walk that has not hit a target after visiting every state never will
+        limit = len(self.names) * size
+        node, step = self.ids[start], 0
+        while node not in targets:
+            if step == limit:
+                return None
+            node = moves[turns[step % size]][node]
+            step += 1
+        return step
+
+    def blocks(self, targets: Collection[str]) -> 'BlockJumps':
+        return BlockJumps(self, targets)
+
+    def analyze(self, start: str, targets: Collection[str]) -> Cycle:
+        # Walks from start until a (node, position) state comes round again,
+        # remembering the step each state was first seen at. There are only
+        # len(self) * len(instructions) states, so this always ends.
+        moves, turns = (self.left, self.right), self.turns
+        size = len(turns)
+        is_target = bytes(x in targets for x in self.names)
+        seen = array('l', [-1]) * (len(self.names) * size)
+        node, position, step = self.ids[start], 0, 0
+        hits = []
+        while seen[node * size + position] == -1:
+            seen[node * size + position] = step
+            if is_target[node]:
+                hits.append(step)
+            node = moves[turns[position]][node]
+            position = position + 1 if position + 1 < size else 0
+            step += 1
+        offset = seen[node * size + position]
+        return Cycle(start, offset, step - offset, tuple(hits))
+
+
+class BlockJumps:
+    # Jump tables over blocks, one block being a full pass of the
+    # instructions. ends[node] is where a block from node finishes and
+    # first_hits[node] the first step of it on a target (-1 if none). On top
+    # of those, level k of the doubling tables holds where 2^k blocks lead
+    # and whether they pass a target, so any number of steps is walked in
+    # O(log steps) lookups.
+
+    def __init__(self, network: Network, targets: Collection[str]):
+        self.network = network
+        self.size = len(network.turns)
+        is_target = bytes(x in targets for x in network.names)
+        moves = (network.left, network.right)
+        nodes = list(range(len(network)))
+        first_hits = array('l', [-1]) * len(nodes)
+        for position, turn in enumerate(network.turns):
+            for start, node in enumerate(nodes):
+                if is_target[node] and first_hits[start] == -1:
+                    first_hits[start] = position
+            move = moves[turn]
+            nodes = [move[x] for x in nodes]
+        self.ends = array('l', nodes)
+        self.first_hits = first_hits
+        self._is_target = is_target
+        self._jumps = [self.ends]
+        self._passes = [bytes(x != -1 for x in first_hits)]
+
+    def _level(self, k: int):
+        while len(self._jumps) <= k:
+            jumps, passes = self._jumps[-1], self._passes[-1]
+            self._jumps.append(array('l', [jumps[x] for x in jumps]))
+            self._passes.append(bytes(a or passes[b] for a, b in zip(passes, jumps)))
+        return self._jumps[k], self._passes[k]
+
+    def node_after(self, start: str, steps: int) -> int:
+        # the id of the node steps steps from start
+        blocks, rest = divmod(steps, self.size)
+        node = self.network.ids[start]
+        k = 0
+        while blocks:
+            if blocks & 1:
+                node = self._level(k)[0][node]
+            blocks >>= 1
+            k += 1
+        for position in range(rest):
+            node = self.network.step(node, position)
+        return node
+
+    def all_hit(self, starts: Iterable[str], steps: int) -> bool:
+        # whether every walk is on a target after steps steps
+        return all(self._is_target[self.node_after(x, steps)] for x in starts)
+
+    def first_hit(self, start: str) -> Optional[int]:
+        # Steps from start to the first target, found by skipping the largest
+        # runs of blocks that pass none. Blocks lead from node to node, so a
+        # walk that passes no target in len(network) blocks never will.
+        node = self.network.ids[start]
+        if self.first_hits[node] != -1:
+            return self.first_hits[node]
+        top = max(len(self.network), 1).bit_length()
+        self._level(top)
+        blocks = 0
+        for k in range(top, -1, -1):
+            if not self._passes[k][node]:
+                node = self._jumps[k][node]
+                blocks += 1 << k
+        if self.first_hits[node] == -1:
+            return None
+        return blocks * self.size + self.first_hits[node]
+
+
+def combine(cycles: List[Cycle]) -> Optional[int]:
+    # The first step on which every walk is on a target, or None if there is
+    # none. A step before some walk has started going round must be one of
+    # that walk's early hits, so those are tried one by one. After that each
+    # walk is on a target at its repeating hits plus any multiple of its
+    # length, and the Chinese remainder theorem joins those conditions.
+    if not cycles:
+        return None
+    if any(not x.hits for x in cycles):
+        return None
+    settled = max(x.offset for x in cycles)
+    early = sorted({hit for x in cycles for hit in x.hits if hit < settled})
+    for step in early:
+        if all(x.is_hit(step) for x in cycles):
+            return step
+    residues = [(0, 1)]
+    for cycle in cycles:
+        residues = [joined for remainder, modulus in residues for hit in cycle.repeating_hits()
+                    for joined in [crt(remainder, modulus, hit, cycle.length)] if joined is not None]
+        # only the remainders differ, so the same ones can be merged
+        residues = sorted(set(residues))
+        if not residues:
+            return None
+    return min(remainder + max(settled - remainder + modulus - 1, 0) // modulus * modulus for remainder, modulus in residues)
+
+
+def crt(remainder1: int, modulus1: int, remainder2: int, modulus2: int) -> Optional[Tuple[int, int]]:
+    # (r, m) such that x = r (mod m) exactly when x = remainder1 (mod
+    # modulus1) and x = remainder2 (mod modulus2), or None if no x is both
+    g = math.gcd(modulus1, modulus2)
+    if (remainder2 - remainder1) % g:
+        return None
+    modulus = modulus1 // g * modulus2
+    t = (remainder2 - remainder1) // g * pow(modulus1 // g, -1, modulus2 // g) % (modulus2 // g)
+    return (remainder1 + modulus1 * t) % modulus, modulus
@@ -0,0 +1,45 @@
+import concurrent.futures
+import multiprocessing
+import os
+
+from typing import Callable, Iterable, Iterator
+
+# Work is only sent to other processes when there is enough of it to pay for
+# starting them.
+min_items = 64
+chunks_per_worker = 4
+
+
+def get_workers() -> int:
+    if 'AOC_WORKERS' in os.environ:
+        return int(os.environ['AOC_WORKERS'])
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def set_workers(workers: int):
+    # kept in the environment so that it also applies to worker processes
+    os.environ['AOC_WORKERS'] = str(workers)
+
+
+def map(function: Callable, items: Iterable, chunk_size: int = None, workers: int = None) -> Iterator:
+    # Like the builtin map, results come back in the order of the items, so
+    # reducing them (sum, max, ...) gives the same answer as a plain loop.
+    items = items if isinstance(items, list) else list(items)
+    workers = min(workers or get_workers(), len(items))
+    if workers <= 1 or len(items) < min_items and chunk_size is None or not _can_fork():
+        yield from (function(x) for x in items)
+        return
+    chunk_size = chunk_size or max(1, -(-len(items) // (workers * chunks_per_worker)))
+    executor = concurrent.futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork'))
+    try:
+        yield from executor.map(function, items, chunksize=chunk_size)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _can_fork():
+    # Solvers are loaded from files rather than imported, so worker processes
+    # only know their functions if they are forked from this one.
+    return 'fork' in multiprocessing.get_all_start_methods()
@@ -0,0 +1,53 @@
+import math
+
+from typing import List, Sequence
+
+from aoc import lazy
+
+# below these, duration * duration - 4 * record fits in an int64
+numpy_max_duration = 2 ** 31
+numpy_max_record = 2 ** 60
+
+
+def count_ways_to_win(duration: int, record: int) -> int:
+    # Holding the button for x travels x * (duration - x), so the winning
+    # presses are the integers strictly between the roots of
+    # x^2 - duration * x + record. isqrt puts the lower root within one of
+    # the answer and the loops settle the boundary exactly; the winners are
+    # symmetric around duration / 2.
+    discriminant = duration * duration - 4 * record
+    if discriminant < 0:
+        return 0
+    low = max((duration - math.isqrt(discriminant)) // 2, 0)
+    while low * (duration - low) <= record and 2 * low <= duration:
+        low += 1
+    while low > 0 and (low - 1) * (duration - low + 1) > record:
+        low -= 1
+    high = duration - low
+    return max(min(high, duration - 1) - low + 1, 0)
+
+
+def count_ways_batch(durations: Sequence[int], records: Sequence[int]) -> List[int]:
+    # count_ways_to_win for every race, with numpy for many short races
+    if len(durations) != len(records):
+        raise ValueError('every race needs a duration and a record')
+    # numpy saves about 1.5 us a race
+    numpy = lazy.numpy_for(len(durations), 1.5e-6)
+    if numpy and max(durations) < numpy_max_duration and 0 <= min(records) and max(records) < numpy_max_record:
+        return _numpy_count_ways(numpy, durations, records).tolist()
+    return [count_ways_to_win(duration, record) for duration, record in zip(durations, records)]
+
+
+def _numpy_count_ways(numpy, durations, records):
+    durations = numpy.asarray(durations, dtype=numpy.int64)
+    records = numpy.asarray(records, dtype=numpy.int64)
+    discriminants = durations * durations - 4 * records
+    roots = numpy.sqrt(numpy.maximum(discriminants, 0).astype(numpy.float64)).astype(numpy.int64)
+    # the float root can be off by one either way near 2^53
+    roots -= roots * roots > discriminants
+    roots += (roots + 1) * (roots + 1) <= discriminants
+    low = numpy.maximum((durations - roots) // 2, 0)
+    low += (low * (durations - low) <= records) & (2 * low <= durations)
+    low -= (low > 0) & ((low - 1) * (durations - low + 1) > records)
+    counts = numpy.minimum(durations - low, durations - 1) - low + 1
+    return numpy.where(discriminants < 0, 0, numpy.maximum(counts, 0))
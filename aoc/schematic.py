@@ -0,0 +1,124 @@
+import itertools
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from aoc import inputs, lazy
+from aoc.grid import Grid
+
+number_pattern = lazy.compile(rb'[1-9][0-9]*')
+symbol_pattern = lazy.compile(rb'[^0-9.]')
+gear = ord('*')
+no_number = -1
+
+
+class Schematic:
+    # Every cell of the grid is labelled with the index of the number written
+    # over it, or no_number, so finding the numbers around a symbol means
+    # looking at its eight neighbors rather than searching the number list.
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.values: List[int] = []
+        self.labels = array('i', [no_number]) * len(grid.data)
+        for row in range(grid.height):
+            offset = row * grid.width
+            for match in number_pattern.finditer(grid.row(row)):
+                label = len(self.values)
+                self.values.append(int(match.group()))
+                self.labels[offset + match.start():offset + match.end()] = array('i', [label]) * (match.end() - match.start())
+
+    @classmethod
+    def from_input(cls, source: inputs.Input) -> 'Schematic':
+        return cls(Grid.from_input(source))
+
+    def find_symbols(self, symbol: int = None) -> Iterator[int]:
+        # cell indexes of every symbol, or only of the given one
+        if symbol is None:
+            for match in symbol_pattern.finditer(self.grid.data):
+                yield match.start()
+            return
+        data = self.grid.data
+        index = data.find(symbol)
+        while index != -1:
+            yield index
+            index = data.find(symbol, index + 1)
+
+    def get_adjacent_numbers(self, index: int) -> Set[int]:
+        height, width, labels = self.grid.height, self.grid.width, self.labels
+        row, col = divmod(index, width)
+        result = set()
+        for r in range(max(row - 1, 0), min(row + 2, height)):
+            start = r * width
+            for label in labels[start + max(col - 1, 0):start + min(col + 2, width)]:
+                if label != no_number:
+                    result.add(label)
+        return result
+
+    def sum_part_numbers(self) -> int:
+        parts = set()
+        for index in self.find_symbols():
+            parts |= self.get_adjacent_numbers(index)
+        return sum(self.values[x] for x in parts)
+
+    def sum_gear_ratios(self) -> int:
+        total = 0
+        for index in self.find_symbols(gear):
+            numbers = self.get_adjacent_numbers(index)
+            if len(numbers) == 2:
+                a, b = numbers
+                total += self.values[a] * self.values[b]
+        return total
+
+
+class _Row:
+    # one row of the rolling window in scan, labelled like a Schematic row
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.numbers = []
+        self.labels = array('i', [no_number]) * len(data)
+        for match in number_pattern.finditer(data):
+            self.labels[match.start():match.end()] = array('i', [len(self.numbers)]) * (match.end() - match.start())
+            self.numbers.append((int(match.group()), match.start(), match.end()))
+
+
+def scan(lines: Iterable[bytes]) -> Tuple[int, int]:
+    # Both answers, (part number sum, gear ratio sum), in one pass over the
+    # rows. A row is finished once the row below it has been read, so only
+    # three rows are ever held and memory depends on the width alone.
+    part_total = gear_total = 0
+    above: Optional[_Row] = None
+    row: Optional[_Row] = None
+    for line in itertools.chain(lines, [None]):
+        below = None if line is None else _Row(line)
+        if row is not None:
+            window = [x for x in (above, row, below) if x is not None]
+            part_total += _sum_row_parts(row, window)
+            gear_total += _sum_row_gears(row, window)
+        above, row = row, below
+    return part_total, gear_total
+
+
+def _sum_row_parts(row: _Row, window: List[_Row]) -> int:
+    total = 0
+    for value, start, end in row.numbers:
+        if any(symbol_pattern.search(x.data, max(start - 1, 0), end + 1) for x in window):
+            total += value
+    return total
+
+
+def _sum_row_gears(row: _Row, window: List[_Row]) -> int:
+    total = 0
+    col = row.data.find(gear)
+    while col != -1:
+        numbers = set()
+        for position, x in enumerate(window):
+            for label in x.labels[max(col - 1, 0):col + 2]:
+                if label != no_number:
+                    numbers.add((position, label))
+        if len(numbers) == 2:
+            (a, i), (b, j) = numbers
+            total += window[a].numbers[i][0] * window[b].numbers[j][0]
+        col = row.data.find(gear, col + 1)
+    return total
@@ -0,0 +1,220 @@
+import contextlib
+import glob
+import importlib.util
+import json
+import os
+import platform
+import re
+import signal
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, TextIO
+
+from aoc import inputs, instrument
+from aoc.cache import ResultCache
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+solver_pattern = re.compile(r'day([0-9]{2})/main([0-9])\.py')
+default_inputs = ['input.txt', 'input_full.txt']
+default_profile_directory = os.path.join(root, '.aoc_profiles')
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: int
+    part: int
+    path: str
+
+    @property
+    def name(self):
+        return f'day{self.day:02}/main{self.part}'
+
+    @property
+    def directory(self):
+        return os.path.dirname(self.path)
+
+    def input_path(self, input_names: List[str] = None):
+        paths = [x if os.path.isabs(x) else os.path.join(self.directory, x) for x in input_names or default_inputs]
+        for path in paths:
+            if os.path.exists(path):
+                return path
+        return paths[0]
+
+
+@dataclass
+class SolverResult:
+    solver: str
+    input: str
+    answer: Any = None
+    import_ns: int = None
+    parse_ns: int = None
+    solve_ns: int = None
+    output_ns: int = None
+    peak_memory: int = None
+    error: str = None
+    cached: bool = False
+    parse_cached: bool = False
+    counters: Dict[str, int] = None
+    timers: Dict[str, List[int]] = None
+
+    @property
+    def total_ns(self):
+        return sum(x for x in [self.import_ns, self.parse_ns, self.solve_ns, self.output_ns] if x is not None)
+
+
+def discover(selections: List[str] = None) -> List[Solver]:
+    result = []
+    for path in sorted(glob.glob(os.path.join(root, 'day[0-9][0-9]', 'main[0-9].py'))):
+        match = solver_pattern.fullmatch(os.path.relpath(path, root).replace(os.sep, '/'))
+        if match:
+            result.append(Solver(int(match.group(1)), int(match.group(2)), path))
+    if selections:
+        selections = [x.removesuffix('.py').strip('/') for x in selections]
+        result = [x for x in result if any(x.name == s or x.name.startswith(s + '/') for s in selections)]
+    return result
+
+
+def load_module(solver: Solver):
+    spec = importlib.util.spec_from_file_location(f'day{solver.day:02}_main{solver.part}', solver.path)
+    module = importlib.util.module_from_spec(spec)
+    # registered so that functions handed to aoc.parallel can be pickled
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(solver: Solver, input_names: List[str] = None, out: TextIO = None, trace_memory=True, verbose=False, timeout=None,
+        cache: ResultCache = None, instrumented=False, profiler: str = None, profile_directory: str = None) -> SolverResult:
+    out = out or sys.stdout
+    path = solver.input_path(input_names)
+    result = SolverResult(solver.name, os.path.relpath(path, root))
+    if not os.path.exists(path):
+        result.error = 'FileNotFoundError: missing input'
+        return result
+    if instrumented or profiler:
+        # the point is to watch the solver run, so a cached answer is no use
+        cache = None
+    if trace_memory:
+        tracemalloc.start()
+    if instrumented:
+        instrument.enable()
+    try:
+        key = cache.key(solver.path, path) if cache else None
+        entry = cache.get(key) if cache else None
+        if entry is not None:
+            answer, result.cached = entry['answer'], True
+        else:
+            with _quiet(not verbose), _deadline(timeout):
+                start = time.perf_counter_ns()
+                module = load_module(solver)
+                result.import_ns = time.perf_counter_ns() - start
+                # The parsed input is kept under the answer's key plus 'parse',
+                # so a run that fails or times out in solve still saves the
+                # next one from parsing again. It is stored before solve runs,
+                # since solve may change it.
+                parse_key = cache.key(solver.path, path, 'parse') if cache else None
+                parsed_entry = cache.get(parse_key) if cache else None
+                with _profiled(profiler, os.path.join(profile_directory or default_profile_directory, solver.name.replace('/', '_'))):
+                    start = time.perf_counter_ns()
+                    if parsed_entry is not None:
+                        parsed, result.parse_cached = parsed_entry['parsed'], True
+                    else:
+                        parsed = module.parse(inputs.load(path))
+                    result.parse_ns = time.perf_counter_ns() - start
+                    if cache and parsed_entry is None:
+                        cache.put(parse_key, {'parsed': parsed})
+                    start = time.perf_counter_ns()
+                    answer = module.solve(parsed)
+                    result.solve_ns = time.perf_counter_ns() - start
+            if cache:
+                cache.put(key, {'answer': answer})
+        start = time.perf_counter_ns()
+        out.write(f'{solver.name}: {answer}\n')
+        out.flush()
+        result.output_ns = time.perf_counter_ns() - start
+        result.answer = answer if isinstance(answer, (int, str)) else str(answer)
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+    finally:
+        inputs.release(path)
+        if instrumented:
+            result.counters, result.timers = dict(instrument.counters), {k: list(v) for k, v in instrument.timers.items()}
+            instrument.disable()
+        if trace_memory:
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return result
+
+
+@contextlib.contextmanager
+def _quiet(enabled):
+    if not enabled:
+        yield
+        return
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _profiled(profiler, path):
+    return instrument.profile(profiler, path) if profiler else contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _deadline(seconds):
+    if not seconds or not hasattr(signal, 'setitimer'):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise TimeoutError(f'gave up after {seconds} seconds')
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def format_result(result: SolverResult):
+    report = instrument.format_report(result.counters or {}, result.timers or {})
+    if result.error:
+        return f'    failed: {result.error}' + (f'\n{report}' if report else '')
+    if result.cached:
+        return '    cached'
+    memory = '' if result.peak_memory is None else f', peak {result.peak_memory / 2 ** 20:.1f} MiB'
+    parse = f'parse {result.parse_ns / 1e6:.3f} ms' + (' (cached)' if result.parse_cached else '')
+    text = (f'    import {result.import_ns / 1e6:.3f} ms, {parse}, solve {result.solve_ns / 1e6:.3f} ms, '
+            f'output {result.output_ns / 1e6:.3f} ms{memory}')
+    return text + (f'\n{report}' if report else '')
+
+
+def write_report(path: str, results: List[SolverResult]):
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': _get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': [dict(asdict(x), total_ns=x.total_ns) for x in results],
+    }
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+def read_report(path: str) -> List[SolverResult]:
+    with open(path) as file:
+        report = json.load(file)
+    fields = SolverResult.__dataclass_fields__
+    return [SolverResult(**{k: v for k, v in x.items() if k in fields}) for x in report['results']]
+
+
+def _get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
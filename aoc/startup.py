@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+from dataclasses import dataclass, field
+from typing import List
+
+from aoc import solvers
+
+marker = '-- loading solver --'
+script = '''
+import sys
+import time
+sys.path.insert(0, {root!r})
+from aoc import solvers
+solver = solvers.discover([{name!r}])[0]
+sys.stderr.write({marker!r} + '\\n')
+sys.stderr.flush()
+start = time.perf_counter_ns()
+solvers.load_module(solver)
+print(time.perf_counter_ns() - start)
+'''
+
+
+@dataclass
+class ImportCost:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class StartupProfile:
+    solver: str
+    load_ns: int = None
+    imports: List[ImportCost] = field(default_factory=list)
+    error: str = None
+
+
+def profile(solver: solvers.Solver) -> StartupProfile:
+    # Loads the solver in a fresh interpreter with -X importtime, so that the
+    # numbers are cold-start costs rather than whatever this process has
+    # already imported. Only the imports made by the solver module are kept.
+    result = StartupProfile(solver.name)
+    code = script.format(root=solvers.root, name=solver.name, marker=marker)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True)
+    if process.returncode != 0:
+        result.error = process.stderr.strip().splitlines()[-1]
+        return result
+    result.load_ns = int(process.stdout.split()[-1])
+    lines = process.stderr.splitlines()
+    for line in lines[lines.index(marker) + 1:]:
+        parts = line.removeprefix('import time:').split('|')
+        if len(parts) == 3 and parts[0].strip().isdigit():
+            result.imports.append(ImportCost(parts[2].strip(), int(parts[0]), int(parts[1])))
+    return result
+
+
+def format_profile(result: StartupProfile, limit: int = 5):
+    if result.error:
+        return f'    failed: {result.error}'
+    lines = [f'    load {result.load_ns / 1e6:.3f} ms, {len(result.imports)} new imports']
+    for cost in sorted(result.imports, key=lambda x: x.self_us, reverse=True)[:limit]:
+        lines.append(f'        {cost.module}: {cost.self_us / 1e3:.3f} ms ({cost.cumulative_us / 1e3:.3f} ms with its imports)')
+    return '\n'.join(lines)
@@ -0,0 +1,42 @@
+import sys
+
+from typing import BinaryIO, Iterable, Iterator, TextIO
+
+whitespace = b' \t\r\n'
+chunk_size = 2 ** 16
+
+
+def lines(file: BinaryIO = None) -> Iterator[str]:
+    # One line in memory at a time. Blank lines are dropped; none of the
+    # streamed days have empty records.
+    for line in file or sys.stdin.buffer:
+        line = line.strip(whitespace)
+        if line:
+            yield str(line, 'ascii')
+
+
+def tokens(separator: bytes, file: BinaryIO = None) -> Iterator[str]:
+    # For inputs that are one huge line, like day 15: read fixed-size chunks and
+    # split them on separator, carrying the unfinished token over.
+    file = file or sys.stdin.buffer
+    rest = b''
+    while chunk := file.read(chunk_size):
+        parts = (rest + chunk).split(separator)
+        rest = parts.pop()
+        for part in parts:
+            part = part.strip(whitespace)
+            if part:
+                yield str(part, 'ascii')
+    rest = rest.strip(whitespace)
+    if rest:
+        yield str(rest, 'ascii')
+
+
+def total(values: Iterable[int], progress: int = None, out: TextIO = None) -> int:
+    # With progress, the running total goes to stderr every progress records.
+    result = 0
+    for count, value in enumerate(values, start=1):
+        result += value
+        if progress and count % progress == 0:
+            (out or sys.stderr).write(f'{count}: {result}\n')
+    return result
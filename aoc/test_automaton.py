@@ -0,0 +1,33 @@
+import unittest
+
+from aoc.automaton import Automaton
+
+
+class TestAutomaton(unittest.TestCase):
+
+    def setUp(self):
+        words = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+        patterns = {word: i for i, word in enumerate(words, start=1)}
+        patterns.update({str(i): i for i in range(1, 10)})
+        self.automaton = Automaton(patterns)
+
+    def test_overlapping_matches(self):
+        self.assertEqual([(3, 2), (5, 1)], list(self.automaton.scan(b'twone')))
+        self.assertEqual((2, 1), self.automaton.first_and_last(b'xtwone'))
+        self.assertEqual((8, 3), self.automaton.first_and_last(b'eighthree'))
+
+    def test_match_through_failed_prefix(self):
+        automaton = Automaton({'abcd': 'long', 'bc': 'short', 'c': 'c'})
+        self.assertEqual([(3, 'short'), (3, 'c')], list(automaton.scan(b'abce')))
+        self.assertEqual([(3, 'short'), (3, 'c'), (4, 'long')], list(automaton.scan(b'abcd')))
+
+    def test_no_match(self):
+        self.assertIsNone(self.automaton.first_and_last(b'abc'))
+
+    def test_per_line(self):
+        data = b'two1nine\nabcone2threexyz\n\nnothing\n7pqrstsixteen'
+        self.assertEqual([(2, 9), (1, 3), None, (7, 6)], list(self.automaton.first_and_last_per_line(memoryview(data))))
+
+    def test_bad_pattern(self):
+        with self.assertRaises(ValueError):
+            Automaton({'a\nb': 1})
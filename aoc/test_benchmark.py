@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from aoc import benchmark, solvers
+
+
+def make_run(commit, created, **timings):
+    return benchmark.Run(commit, created, '3.12.0', 'test', timings={k.replace('_', '/'): v for k, v in timings.items()})
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.directory = self._dir.name
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_compare_flags_slowdowns_and_failures(self):
+        before = make_run('a', '1', day01_main1=0.1, day01_main2=0.1, day02_main1=0.001, day02_main2=0.1)
+        after = make_run('b', '2', day01_main1=0.2, day01_main2=0.11, day02_main1=0.002, day02_main2=None)
+        changes = benchmark.compare(before, after, threshold=0.2)
+        self.assertEqual(['day01/main1', 'day02/main2'], [x.name for x in changes])
+        self.assertAlmostEqual(2.0, changes[0].ratio)
+        self.assertIn('failed', benchmark.format_change(changes[1]))
+
+    def test_history_and_baseline(self):
+        benchmark.save(make_run('a', '1', day01_main1=0.1), self.directory)
+        benchmark.save(make_run('b', '2', day01_main1=0.2), self.directory)
+        benchmark.save(make_run('b', '2', day01_main2=0.3), self.directory)
+        runs = benchmark.history('test', self.directory)
+        self.assertEqual(['a', 'b'], [x.commit for x in runs])
+        self.assertEqual({'day01/main1': 0.2, 'day01/main2': 0.3}, runs[1].timings)
+        self.assertEqual('a', benchmark.find_baseline(runs, 'a').commit)
+        self.assertEqual('b', benchmark.find_baseline(runs, 'b').commit)
+        # a later run of another commit is not the baseline of b
+        benchmark.save(make_run('c', '3', day01_main1=0.1), self.directory)
+        self.assertEqual('b', benchmark.find_baseline(benchmark.history('test', self.directory), 'b').commit)
+        self.assertIsNone(benchmark.find_baseline(runs, 'd'))
+        self.assertIsNone(benchmark.find_baseline(runs, None))
+
+    def test_parent_commit(self):
+        head = benchmark._git('rev-parse', 'HEAD')
+        if head is None:
+            self.skipTest('not a git checkout')
+        self.assertEqual(benchmark._git('rev-parse', 'HEAD~1'), benchmark.parent_commit(head))
+        self.assertNotEqual(head, benchmark.parent_commit())
+
+    def test_time_solver(self):
+        solver = solvers.discover(['day06/main1'])[0]
+        self.assertEqual([1, 2, 4], benchmark.get_sizes(6, [0.25, 0.5, 1]))
+        path = benchmark.get_input(6, 2, self.directory)
+        with open(path) as file:
+            content = file.read()
+        self.assertEqual(path, benchmark.get_input(6, 2, self.directory))
+        with open(path) as file:
+            self.assertEqual(content, file.read())
+        self.assertIn(benchmark.hash_generator(6)[:12], os.path.basename(path))
+        self.assertNotEqual(benchmark.hash_generator(6), benchmark.hash_generator(7))
+        seconds, error = benchmark.time_solver(solver, path, repeat=2)
+        self.assertIsNone(error)
+        self.assertGreater(seconds, 0)
+        self.assertTrue(os.path.exists(path))
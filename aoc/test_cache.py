@@ -0,0 +1,76 @@
+import io
+import os
+import tempfile
+import time
+import unittest
+
+from aoc import solvers
+from aoc.cache import ResultCache
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self._dir.name, 'cache'))
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def write(self, name, content: bytes):
+        path = os.path.join(self._dir.name, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_put_and_get(self):
+        self.cache.put('abc', {'answer': 42})
+        self.assertEqual({'answer': 42}, self.cache.get('abc'))
+        self.assertIsNone(self.cache.get('def'))
+        self.assertFalse(self.cache.put('gen', (x for x in [])))
+        self.assertIsNone(self.cache.get('gen'))
+
+    def test_key_follows_input_content(self):
+        solver = self.write('main1.py', b'pass\n')
+        first = self.cache.key(solver, self.write('input.txt', b'1\n'))
+        self.assertEqual(first, self.cache.key(solver, self.write('copy.txt', b'1\n')))
+        self.assertNotEqual(first, self.cache.key(solver, self.write('input.txt', b'22\n')))
+        self.assertNotEqual(first, self.cache.key(solver, self.write('copy.txt', b'1\n'), 'parse'))
+
+    def test_key_follows_solver_source(self):
+        path = self.write('input.txt', b'1\n')
+        first = self.cache.key(self.write('main1.py', b'pass\n'), path)
+        self.assertNotEqual(first, self.cache.key(self.write('main1.py', b'print()\n'), path))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put('a', 'x' * 100)
+        self.cache.put('b', 'x' * 100)
+        time.sleep(0.01)
+        self.cache.get('a')
+        self.cache.max_bytes = self.cache.size() + 50
+        self.cache.put('c', 'x' * 100)
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertIsNotNone(self.cache.get('c'))
+
+    def test_run_reuses_answer(self):
+        solver = solvers.discover(['day06/main1'])[0]
+        first = solvers.run(solver, ['input_small.txt'], out=io.StringIO(), cache=self.cache)
+        out = io.StringIO()
+        second = solvers.run(solver, ['input_small.txt'], out=out, cache=self.cache)
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(288, second.answer)
+        self.assertEqual('day06/main1: 288\n', out.getvalue())
+
+    def test_run_reuses_parsed_input(self):
+        solver = solvers.discover(['day06/main1'])[0]
+        first = solvers.run(solver, ['input_small.txt'], out=io.StringIO(), cache=self.cache)
+        # without the answer, the next run solves again from the parsed input
+        path = solver.input_path(['input_small.txt'])
+        os.remove(self.cache._get_path(self.cache.key(solver.path, path)))
+        second = solvers.run(solver, ['input_small.txt'], out=io.StringIO(), cache=self.cache)
+        self.assertFalse(first.parse_cached)
+        self.assertFalse(second.cached)
+        self.assertTrue(second.parse_cached)
+        self.assertEqual(288, second.answer)
@@ -0,0 +1,43 @@
+import random
+import unittest
+
+from aoc import camel, lazy
+
+example = [('32T3K', 765), ('T55J5', 684), ('KK677', 28), ('KTJJT', 220), ('QQQJA', 483)]
+
+
+class TestCamel(unittest.TestCase):
+
+    def test_classify(self):
+        self.assertEqual(['one_pair', 'three_of_a_kind', 'two_pair', 'two_pair', 'three_of_a_kind'],
+                         [camel.hand_types[camel.classify(x)] for x, _ in example])
+        self.assertEqual(['one_pair', 'four_of_a_kind', 'two_pair', 'four_of_a_kind', 'four_of_a_kind'],
+                         [camel.hand_types[camel.classify(x, jokers=True)] for x, _ in example])
+        self.assertEqual('five_of_a_kind', camel.hand_types[camel.classify(b'JJJJJ', jokers=True)])
+        self.assertEqual('full_house', camel.hand_types[camel.classify('2J323', jokers=True)])
+        with self.assertRaises(ValueError):
+            camel.classify('AAAA')
+
+    def test_get_sort_key(self):
+        self.assertLess(camel.get_sort_key('2AAAA'), camel.get_sort_key('33332'))
+        self.assertLess(camel.get_sort_key('JKKK2', jokers=True), camel.get_sort_key('QQQQ2', jokers=True))
+        self.assertEqual(camel.get_sort_key('KTJJT'), camel.get_sort_key(b'KTJJT'))
+
+    def test_total_winnings(self):
+        hands, bids = [x for x, _ in example], [x for _, x in example]
+        self.assertEqual(6440, camel.total_winnings(hands, bids))
+        self.assertEqual(5905, camel.total_winnings(hands, bids, jokers=True))
+        self.assertEqual(([b'32T3K', b'T55J5'], [765, 684]), camel.read_hands([b'32T3K 765\n', b'T55J5 684\n']))
+
+    @unittest.skipUnless(lazy.optional_import('numpy'), 'numpy is not installed')
+    def test_numpy_sort_keys(self):
+        numpy = lazy.optional_import('numpy')
+        rng = random.Random(0)
+        for jokers in [False, True]:
+            hands = [''.join(rng.choices(camel.card_labels[jokers][:rng.randint(2, 13)], k=5)) for _ in range(2000)]
+            expected = [camel.get_sort_key(x, jokers) for x in hands]
+            self.assertEqual(expected, camel._numpy_sort_keys(numpy, hands, jokers).tolist())
+        with self.assertRaises(ValueError):
+            camel._numpy_sort_keys(numpy, ['AAAAX'], False)
+        with self.assertRaises(ValueError):
+            camel._numpy_sort_keys(numpy, ['AAAA', 'AAAAAA'], False)
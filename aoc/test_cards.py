@@ -0,0 +1,70 @@
+import os
+import random
+import tempfile
+import unittest
+
+from aoc import cards, inputs, lazy
+
+example = [
+    'Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53',
+    'Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19',
+    'Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1',
+    'Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83',
+    'Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36',
+    'Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11',
+]
+
+
+class TestCards(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, 'input.txt')
+        with open(self.path, 'w') as file:
+            file.write('\n'.join(example) + '\n')
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_parse_card(self):
+        card_id, winning, held = cards.parse_card(example[2])
+        self.assertEqual(3, card_id)
+        self.assertEqual(1 << 1 | 1 << 21 | 1 << 53 | 1 << 59 | 1 << 44, winning)
+        self.assertEqual(2, cards.count_matches(winning, held))
+        self.assertEqual(cards.parse_card(example[2]), cards.parse_card(example[2].encode('ascii')))
+        # a number written twice on one side still counts once
+        self.assertEqual((7, 1 << 5, 1 << 5 | 1 << 6), cards.parse_card('Card 7: 5 5 | 5 6 6'))
+
+    def test_scores(self):
+        self.assertEqual([8, 2, 2, 1, 0, 0], [cards.get_score(x) for x in cards.read_match_counts(inputs.Input(self.path))])
+
+    def test_count_copies(self):
+        self.assertEqual([1, 2, 4, 8, 14, 1], cards.count_copies([4, 2, 2, 1, 0, 0]))
+        self.assertEqual([1, 2, 4], cards.count_copies([5, 5, 5]))
+        rng = random.Random(0)
+        match_counts = [rng.randint(0, 10) for _ in range(300)]
+        expected = [1] * len(match_counts)
+        for i, matches in enumerate(match_counts):
+            for j in range(i + 1, min(i + 1 + matches, len(match_counts))):
+                expected[j] += expected[i]
+        self.assertEqual(expected, cards.count_copies(match_counts))
+
+    def test_counter_grows_with_the_deck(self):
+        match_counts = [4, 2, 2, 1, 0, 0]
+        counter = cards.CardCounter()
+        self.assertEqual(3, counter.extend(match_counts[:2]))
+        self.assertEqual(30, counter.extend(match_counts[2:]))
+        self.assertEqual(6, counter.cards)
+        self.assertEqual(sum(cards.count_copies(match_counts + [3, 0])), counter.extend([3, 0]))
+
+    def test_fixed_width_matches_line_by_line(self):
+        numpy = lazy.optional_import('numpy')
+        if numpy is None:
+            self.skipTest('numpy is not installed')
+        source = inputs.Input(self.path)
+        self.assertEqual([4, 2, 2, 1, 0, 0], cards._read_fixed_width(numpy, source.data))
+        self.assertEqual([4, 2, 2, 1, 0, 0], cards._read_fixed_width(numpy, source.data[:-1]))
+        self.assertIsNone(cards._read_fixed_width(numpy, b'Card 1: 1 | 1\nCard 10: 1 | 2\n'))
+        # a three-digit number in a two-digit field does not match the layout
+        self.assertIsNone(cards._read_fixed_width(numpy, b'Card 1:  5 |  5\nCard 2:  5 | 105\n'))
+        self.assertEqual([1, 0], cards._read_fixed_width(numpy, b'Card 1:  5 |  5\nCard 2:  5 |  6\n'))
@@ -0,0 +1,54 @@
+import random
+import unittest
+
+from aoc import cubes
+
+games = [
+    'Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green',
+    'Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue',
+    'Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red',
+    'Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red',
+    'Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green',
+]
+
+
+class TestCubes(unittest.TestCase):
+
+    def setUp(self):
+        self.log = cubes.GameLog.from_lines(games)
+
+    def test_parse_game(self):
+        self.assertEqual((1, [(4, 0, 3), (1, 2, 6), (0, 2, 0)]), cubes.parse_game(games[0]))
+
+    def test_columns(self):
+        self.assertEqual(14, len(self.log))
+        self.assertEqual([1, 1, 1, 2], list(self.log.game_ids[:4]))
+        self.assertEqual([0, 1, 2, 0], list(self.log.draws[:4]))
+        self.assertEqual([4, 1, 0, 0], list(self.log.red[:4]))
+
+    def test_queries(self):
+        self.assertEqual(8, self.log.sum_possible({'red': 12, 'green': 13, 'blue': 14}))
+        self.assertEqual(15, self.log.sum_possible((20, 13, 15)))
+        self.assertEqual(2286, self.log.sum_powers())
+
+    def test_batch_matches_single_queries(self):
+        rng = random.Random(0)
+        log = cubes.GameLog()
+        for game_id in range(1, 200):
+            log.add(game_id, [tuple(rng.randint(0, 30) for _ in range(3)) for _ in range(rng.randint(1, 4))])
+        limits = [tuple(rng.randint(-1, 32) for _ in range(3)) for _ in range(300)]
+        self.assertEqual([log.sum_possible(x) for x in limits], log.sum_possible_batch(limits))
+        self.assertEqual([8, 0], self.log.sum_possible_batch([{'red': 12, 'green': 13, 'blue': 14}, (0, 0, 0)]))
+
+    def test_numpy_agrees(self):
+        if cubes.lazy.optional_import('numpy') is None:
+            self.skipTest('numpy is not installed')
+        original = cubes.lazy.numpy_import_seconds
+        cubes.lazy.numpy_import_seconds = 0
+        try:
+            log = cubes.GameLog.from_lines(games)
+            self.assertEqual(8, log.sum_possible({'red': 12, 'green': 13, 'blue': 14}))
+            self.assertEqual([8, 15, 12], log.sum_possible_batch([(12, 13, 14), (20, 13, 15), (14, 3, 15)]))
+            self.assertEqual(2286, log.sum_powers())
+        finally:
+            cubes.lazy.numpy_import_seconds = original
@@ -0,0 +1,31 @@
+import io
+import os
+import tempfile
+import unittest
+
+from aoc import generators, solvers
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_same_seed_same_input(self):
+        for day in generators.days:
+            self.assertEqual(list(generators.generate(day, 12, seed=5)), list(generators.generate(day, 12, seed=5)))
+
+    def test_different_seed_different_input(self):
+        self.assertNotEqual(list(generators.generate(7, 12, seed=1)), list(generators.generate(7, 12, seed=2)))
+
+    def test_bad_density(self):
+        with self.assertRaises(ValueError):
+            generators.generate(1, 12, 1.5)
+
+    def test_inputs_are_solvable(self):
+        # day 18 part 1 needs Python 3.12, so check part 2 there
+        parts = {18: 2}
+        with tempfile.TemporaryDirectory() as directory:
+            for day in generators.days:
+                path = os.path.join(directory, f'day{day:02}.txt')
+                generators.write(path, day, 12, seed=day)
+                solver = solvers.discover([f'day{day:02}/main{parts.get(day, 1)}'])[0]
+                result = solvers.run(solver, [path], out=io.StringIO(), trace_memory=False)
+                self.assertIsNone(result.error, solver.name)
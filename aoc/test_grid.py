@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from aoc import grid, inputs
+from aoc.grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = Grid.from_lines(['#..', '.#.', '..*', 'ab#'])
+
+    def test_indexing(self):
+        self.assertEqual((4, 3), (self.grid.height, self.grid.width))
+        self.assertEqual(ord('*'), self.grid[2, 2])
+        self.grid[0, 1] = ord('x')
+        self.assertEqual('#x.', self.grid.lines()[0])
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            self.grid[0, 3]
+        with self.assertRaises(IndexError):
+            self.grid[-1, 0] = 0
+        self.assertIsNone(self.grid.get(4, 0))
+        self.assertFalse(self.grid.contains(0, -1))
+
+    def test_views(self):
+        self.assertEqual(b'.#.', bytes(self.grid.row(1)))
+        self.assertEqual(b'..*#', bytes(self.grid.column(2)))
+        self.assertEqual(['#..a', '.#.b', '..*#'], self.grid.transpose().lines())
+        self.assertEqual(self.grid, self.grid.transpose().transpose())
+
+    def test_copy_is_independent(self):
+        copy = self.grid.copy()
+        copy[0, 0] = ord('.')
+        self.assertEqual(ord('#'), self.grid[0, 0])
+
+    def test_search(self):
+        self.assertEqual((2, 2), self.grid.find('*'))
+        self.assertIsNone(self.grid.find('?'))
+        self.assertEqual([(0, 0), (1, 1), (3, 2)], list(self.grid.find_all('#')))
+        self.assertEqual(3, self.grid.count(ord('#')))
+
+    def test_neighbors(self):
+        self.assertEqual([(0, 1), (1, 0)], sorted(self.grid.neighbors(0, 0)))
+        self.assertEqual(8, len(list(self.grid.neighbors(1, 1, grid.adjacent))))
+        self.assertEqual((-3, 1, 3, -1), self.grid.index_offsets())
+
+    def test_ragged_lines(self):
+        with self.assertRaises(ValueError):
+            Grid.from_lines(['ab', 'c'])
+
+    def test_from_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'input.txt')
+            with open(path, 'wb') as file:
+                file.write(b'12\n34\n')
+            self.assertEqual(Grid.from_lines(['12', '34']), Grid.from_input(inputs.Input(path)))
+
+    def test_fill(self):
+        self.assertEqual(['..', '..'], Grid(2, 2, '.').lines())
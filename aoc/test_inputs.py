@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from aoc import inputs
+
+
+class TestInputs(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def write(self, content: bytes):
+        path = os.path.join(self._dir.name, 'input.txt')
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_text_lines_are_stripped(self):
+        path = self.write(b'abc \r\n\n  def\n')
+        self.assertEqual(['abc', '', 'def'], list(inputs.Input(path).text_lines()))
+
+    def test_line_offsets(self):
+        for data in [b'', b'\n', b'a', b' a \n\n b', b'\n\n', b'a\n ', b'  \n', b' \t\r x y \r\nz']:
+            lines = data.split(b'\n') if data else []
+            if data.endswith(b'\n'):
+                lines.pop()
+            starts, ends = inputs.find_line_offsets(data)
+            self.assertEqual([x.strip() for x in lines], [data[a:b] for a, b in zip(starts, ends)])
+            position = 0
+            for line, start, end in zip(lines, starts, ends):
+                # a blank line is where its whitespace ends
+                self.assertEqual(position + len(line) - len(line.lstrip()), start)
+                position += len(line) + 1
+
+    def test_lines_are_views(self):
+        path = self.write(b'abc\ndef')
+        lines = list(inputs.Input(path).lines())
+        self.assertIsInstance(lines[0], memoryview)
+        self.assertEqual([b'abc', b'def'], [bytes(x) for x in lines])
+
+    def test_blocks(self):
+        path = self.write(b'a\nb\n\nc\n\n\nd\n\n')
+        self.assertEqual([['a', 'b'], ['c'], ['d']], inputs.Input(path).text_blocks())
+
+    def test_grid(self):
+        path = self.write(b'#..\n.#.\n..*\n')
+        grid = inputs.Input(path).grid()
+        self.assertEqual((3, 3), (grid.height, grid.width))
+        self.assertEqual(ord('*'), grid[2, 2])
+        self.assertEqual(b'.#.', bytes(grid.row(1)))
+        self.assertEqual([(0, 0), (1, 1)], list(grid.find_all(ord('#'))))
+
+    def test_grid_out_of_bounds(self):
+        grid = inputs.Input(self.write(b'ab\ncd')).grid()
+        with self.assertRaises(IndexError):
+            grid[0, 2]
+
+    def test_ragged_grid(self):
+        with self.assertRaises(ValueError):
+            inputs.Input(self.write(b'abc\nde\n')).grid()
+
+    def test_empty_file(self):
+        source = inputs.Input(self.write(b''))
+        self.assertEqual([], list(source.text_lines()))
+        self.assertEqual(0, source.grid().height)
+
+    def test_line_chunks(self):
+        data = b'abc\ndefghij\nk\n\nlm'
+        chunks = list(inputs.line_chunks(data, 5))
+        self.assertEqual(data, b''.join(chunks))
+        self.assertTrue(all(x.endswith(b'\n') for x in chunks[:-1]))
+        self.assertIn(b'defghij\n', chunks[1])
+
+    def test_load_is_memoized(self):
+        path = self.write(b'abc\n')
+        self.assertIs(inputs.load(path), inputs.load(path))
+
+    def test_release(self):
+        path = self.write(b'abc\ndef\n')
+        source = inputs.load(path)
+        line = next(source.lines())
+        inputs.release(path)
+        # a line still in use keeps the mapping alive
+        self.assertEqual(b'abc', bytes(line))
+        self.assertIsNot(source, inputs.load(path))
+        with inputs.load(path) as other:
+            self.assertEqual(['abc', 'def'], list(other.text_lines()))
+        self.assertIsNot(other, inputs.load(path))
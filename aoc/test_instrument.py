@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from aoc import instrument
+
+
+def spin(n):
+    return sum(i * i for i in range(n))
+
+
+class TestInstrument(unittest.TestCase):
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_disabled_hooks_do_nothing(self):
+        self.assertIs(spin, instrument.timed(spin))
+        instrument.count('calls')
+        self.assertEqual({}, dict(instrument.counters))
+
+    def test_counters_and_timers(self):
+        instrument.enable()
+        timed_spin = instrument.timed(name='spin')(spin)
+        self.assertEqual(spin(10), timed_spin(10))
+        timed_spin(10)
+        instrument.count('calls', 2)
+        self.assertEqual({'calls': 2}, dict(instrument.counters))
+        self.assertEqual(2, instrument.timers['spin'][0])
+        self.assertIn('spin: 2 calls', instrument.format_report(instrument.counters, instrument.timers))
+
+    def test_profiles_are_folded_stacks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for kind in instrument.profilers:
+                path = os.path.join(directory, kind)
+                with instrument.profile(kind, path, interval=0.0005):
+                    spin(300000)
+                with open(path + '.folded') as file:
+                    lines = file.read().splitlines()
+                self.assertTrue(lines, kind)
+                for line in lines:
+                    stack, weight = line.rsplit(' ', 1)
+                    self.assertGreater(int(weight), 0)
+                self.assertTrue(any('spin (test_instrument.py' in x for x in lines), kind)
+            self.assertTrue(os.path.exists(os.path.join(directory, 'cprofile.prof')))
+
+    def test_unknown_profiler(self):
+        with self.assertRaises(ValueError):
+            with instrument.profile('perf', 'unused'):
+                pass
@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from aoc import intervals, lazy
+from aoc.intervals import PiecewiseMap
+
+# seed-to-soil and soil-to-fertilizer from the puzzle example
+seed_to_soil = [(50, 98, 2), (52, 50, 48)]
+soil_to_fertilizer = [(0, 15, 37), (37, 52, 2), (39, 0, 15)]
+
+
+def apply_rules(rules, value):
+    for destination, source, length in rules:
+        if source <= value < source + length:
+            return destination + value - source
+    return value
+
+
+def random_rules(rng, limit=200):
+    result = []
+    end = 0
+    while True:
+        source = end + rng.randrange(10)
+        length = rng.randrange(1, 30)
+        if source + length > limit:
+            return result
+        result.append((rng.randrange(limit), source, length))
+        end = source + length
+
+
+class TestIntervals(unittest.TestCase):
+
+    def test_from_rules(self):
+        map = PiecewiseMap.from_rules(seed_to_soil)
+        self.assertEqual(map.starts, [0, 50, 98, 100])
+        self.assertEqual(map.offsets, [0, 2, -48, 0])
+        self.assertEqual([map(x) for x in [0, 49, 50, 79, 97, 98, 99, 100]], [0, 49, 52, 81, 99, 50, 51, 100])
+        self.assertEqual(PiecewiseMap.from_rules([]), PiecewiseMap.identity())
+        with self.assertRaises(ValueError):
+            PiecewiseMap.from_rules([(0, 10, 5), (0, 12, 5)])
+
+    def test_then(self):
+        first, second = PiecewiseMap.from_rules(seed_to_soil), PiecewiseMap.from_rules(soil_to_fertilizer)
+        both = first.then(second)
+        for x in range(120):
+            self.assertEqual(both(x), second(first(x)))
+
+    def test_chain_random(self):
+        rng = random.Random(0)
+        stages = [random_rules(rng) for _ in range(7)]
+        map = intervals.chain(PiecewiseMap.from_rules(x) for x in stages)
+        for x in range(250):
+            expected = x
+            for rules in stages:
+                expected = apply_rules(rules, expected)
+            self.assertEqual(map(x), expected)
+
+    def test_apply_ranges(self):
+        map = PiecewiseMap.from_rules(seed_to_soil)
+        self.assertEqual(list(map.apply_ranges([range(79, 93), range(55, 68)])), [range(57, 70), range(81, 95)])
+        self.assertEqual(list(map.apply_ranges([range(95, 105)])), [range(97, 100), range(50, 52), range(100, 105)])
+        images = sorted(x for r in map.apply_ranges([range(0, 120), range(10, 10)]) for x in r)
+        self.assertEqual(images, sorted(map(x) for x in range(120)))
+
+    def test_minimum(self):
+        rng = random.Random(1)
+        map = intervals.chain(PiecewiseMap.from_rules(random_rules(rng)) for _ in range(7))
+        for _ in range(50):
+            start = rng.randrange(250)
+            ranges = [range(start, start + rng.randrange(1, 40)) for _ in range(3)]
+            self.assertEqual(map.minimum(ranges), min(map(x) for r in ranges for x in r))
+        with self.assertRaises(ValueError):
+            map.minimum([range(5, 5)])
+
+    @unittest.skipUnless(lazy.optional_import('numpy'), 'numpy is not installed')
+    def test_numpy_minimum(self):
+        rng = random.Random(2)
+        map = intervals.chain(PiecewiseMap.from_rules(random_rules(rng)) for _ in range(7))
+        starts = [rng.randrange(250) for _ in range(200)]
+        ranges = [range(x, x + rng.randrange(1, 40)) for x in starts]
+        expected = min(min(map(x) for x in r) for r in ranges)
+        self.assertEqual(map.minimum(ranges), expected)
+        self.assertEqual(map._numpy_minimum(lazy.optional_import('numpy'), ranges), expected)
+
+    @unittest.skipUnless(lazy.optional_import('numpy'), 'numpy is not installed')
+    def test_numpy_then(self):
+        rng = random.Random(3)
+        numpy = lazy.optional_import('numpy')
+        for _ in range(20):
+            first, second = PiecewiseMap.from_rules(random_rules(rng)), PiecewiseMap.from_rules(random_rules(rng))
+            self.assertEqual(first._numpy_then(numpy, second), first.then(second))
@@ -0,0 +1,42 @@
+import unittest
+
+from aoc import lazy, solvers, startup
+
+
+class TestLazy(unittest.TestCase):
+
+    def test_pattern_is_compiled_on_first_use(self):
+        pattern = lazy.compile('[0-9]+')
+        self.assertIn('lazy', repr(pattern))
+        self.assertEqual(['1', '23'], pattern.findall('a1b23'))
+        self.assertIn('findall', vars(pattern))
+
+    def test_table_is_built_once(self):
+        calls = []
+
+        @lazy.table
+        def squares():
+            calls.append(1)
+            return [x * x for x in range(5)]
+
+        self.assertEqual([], calls)
+        self.assertEqual(16, squares[4])
+        self.assertEqual(5, len(squares))
+        self.assertIn(9, squares)
+        self.assertEqual([0, 1, 4, 9, 16], list(squares))
+        self.assertEqual([1], calls)
+
+    def test_numpy_for(self):
+        numpy = lazy.optional_import('numpy')
+        self.assertIsNone(lazy.numpy_for(1000, 1e-6))
+        self.assertIs(numpy, lazy.numpy_for(10 ** 6, 1e-6))
+        self.assertIsNone(lazy.numpy_for(10 ** 6, 1e-6, setup=10))
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_profile(self):
+        result = startup.profile(solvers.discover(['day06/main1'])[0])
+        self.assertIsNone(result.error)
+        self.assertGreater(result.load_ns, 0)
+        self.assertIn('aoc.lazy', [x.module for x in result.imports])
@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from aoc.network import Network, combine, crt
+
+example = ['LR', '', '11A = (11B, XXX)', '11B = (XXX, 11Z)', '11Z = (11B, XXX)', '22A = (22B, XXX)',
+           '22B = (22C, 22C)', '22C = (22Z, 22Z)', '22Z = (22B, 22B)', 'XXX = (XXX, XXX)']
+
+
+def random_network(rng, size):
+    names = [f'{i:02}{"AZ"[i % 2] if i < 6 else "X"}' for i in range(size)]
+    nodes = {x: (rng.choice(names), rng.choice(names)) for x in names}
+    return Network(''.join(rng.choices('LR', k=rng.randint(1, 5))), nodes)
+
+
+def walk_together(network, starts, targets, limit):
+    nodes = [network.ids[x] for x in starts]
+    targets = {network.ids[x] for x in targets}
+    for step in range(limit):
+        if all(x in targets for x in nodes):
+            return step
+        nodes = [network.step(x, step) for x in nodes]
+    return None
+
+
+class TestNetwork(unittest.TestCase):
+
+    def test_analyze(self):
+        network = Network.from_lines(example)
+        cycles = [network.analyze(x, network.find('Z')) for x in network.find('A')]
+        self.assertEqual([(1, 2, (2,)), (1, 6, (3, 6))], [(x.offset, x.length, x.hits) for x in cycles])
+        self.assertTrue(cycles[1].is_hit(9))
+        self.assertFalse(cycles[1].is_hit(10))
+        self.assertEqual(6, combine(cycles))
+        self.assertEqual(2, network.first_hit('11A', ['11Z']))
+        self.assertIsNone(network.first_hit('XXX', ['11Z']))
+
+    def test_crt(self):
+        self.assertEqual((23, 60), crt(3, 4, 8, 15))
+        self.assertEqual((5, 12), crt(1, 4, 5, 6))
+        self.assertIsNone(crt(0, 4, 1, 6))
+
+    def test_block_jumps(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            network = random_network(rng, rng.randint(6, 12))
+            targets = network.find('Z')
+            blocks = network.blocks(targets)
+            for start in network.names:
+                self.assertEqual(network.first_hit(start, targets), blocks.first_hit(start))
+                steps = rng.randrange(200)
+                node = network.ids[start]
+                for step in range(steps):
+                    node = network.step(node, step)
+                self.assertEqual(node, blocks.node_after(start, steps))
+        network = Network.from_lines(example)
+        blocks = network.blocks(network.find('Z'))
+        self.assertTrue(blocks.all_hit(network.find('A'), 6 + 6 * 10 ** 12))
+        self.assertFalse(blocks.all_hit(network.find('A'), 7 + 6 * 10 ** 12))
+
+    def test_combine_random(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            network = random_network(rng, rng.randint(6, 12))
+            starts, targets = network.find('A'), network.find('Z')
+            cycles = [network.analyze(x, targets) for x in starts]
+            # every state of every walk repeats within this many steps
+            limit = 1
+            for cycle in cycles:
+                limit *= cycle.offset + cycle.length
+            self.assertEqual(walk_together(network, starts, targets, limit + 1), combine(cycles))
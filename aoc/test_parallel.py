@@ -0,0 +1,35 @@
+import os
+import unittest
+
+from aoc import parallel, solvers
+
+
+def square(x):
+    return x * x
+
+
+def get_pid(x):
+    return os.getpid()
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_results_keep_their_order(self):
+        items = list(range(500))
+        self.assertEqual([x * x for x in items], list(parallel.map(square, items, workers=3)))
+
+    def test_chunk_size(self):
+        self.assertEqual([0, 1, 4, 9], list(parallel.map(square, range(4), chunk_size=1, workers=2)))
+
+    def test_few_items_stay_in_process(self):
+        self.assertEqual({os.getpid()}, set(parallel.map(get_pid, range(10), workers=4)))
+
+    def test_many_items_use_workers(self):
+        self.assertNotIn(os.getpid(), set(parallel.map(get_pid, range(200), workers=2)))
+
+    def test_solver_functions_can_be_sent_to_workers(self):
+        solver = solvers.discover(['day09/main1'])[0]
+        module = solvers.load_module(solver)
+        sequences = [[x * i for x in range(10)] for i in range(100)]
+        expected = [module.predicate_next_value(x) for x in sequences]
+        self.assertEqual(expected, list(parallel.map(module.predicate_next_value, sequences, workers=2)))
@@ -0,0 +1,39 @@
+import random
+import unittest
+
+from aoc import lazy, races
+
+
+def count_by_trying(duration, record):
+    return sum(1 for x in range(duration) if x * (duration - x) > record)
+
+
+class TestRaces(unittest.TestCase):
+
+    def test_count_ways_to_win(self):
+        self.assertEqual([4, 8, 9, 71503], [races.count_ways_to_win(*x) for x in [(7, 9), (15, 40), (30, 200), (71530, 940200)]])
+        for duration in range(40):
+            for record in range(duration * duration // 4 + 2):
+                self.assertEqual(count_by_trying(duration, record), races.count_ways_to_win(duration, record))
+
+    def test_count_ways_batch(self):
+        self.assertEqual([4, 8, 9], races.count_ways_batch([7, 15, 30], [9, 40, 200]))
+        with self.assertRaises(ValueError):
+            races.count_ways_batch([7], [])
+        # too big for int64 arithmetic, so the exact path is taken
+        original = lazy.numpy_import_seconds
+        lazy.numpy_import_seconds = 0
+        try:
+            self.assertEqual([0] * 10, races.count_ways_batch([10] * 10, [2 ** 62] * 10))
+            self.assertEqual([1] * 10, races.count_ways_batch([2 ** 40] * 10, [2 ** 78 - 1] * 10))
+        finally:
+            lazy.numpy_import_seconds = original
+
+    @unittest.skipUnless(lazy.optional_import('numpy'), 'numpy is not installed')
+    def test_numpy_count_ways(self):
+        rng = random.Random(0)
+        durations = [rng.randrange(races.numpy_max_duration) for _ in range(1000)]
+        # records from anywhere up to just past the best distance
+        records = [rng.randrange(x * x // 4 + 2) for x in durations]
+        expected = [races.count_ways_to_win(*x) for x in zip(durations, records)]
+        self.assertEqual(expected, races._numpy_count_ways(lazy.optional_import('numpy'), durations, records).tolist())
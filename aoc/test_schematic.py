@@ -0,0 +1,48 @@
+import unittest
+
+from aoc.grid import Grid
+from aoc.schematic import Schematic, scan
+
+example = [
+    '467..114..',
+    '...*......',
+    '..35..633.',
+    '......#...',
+    '617*......',
+    '.....+.58.',
+    '..592.....',
+    '......755.',
+    '...$.*....',
+    '.664.598..',
+]
+
+
+class TestSchematic(unittest.TestCase):
+
+    def setUp(self):
+        self.schematic = Schematic(Grid.from_lines(example))
+
+    def test_labels(self):
+        self.assertEqual(10, len(self.schematic.values))
+        self.assertEqual([0, 0, 0, -1], list(self.schematic.labels[:4]))
+        self.assertEqual({0, 2}, {self.schematic.values.index(x) for x in (467, 35)})
+
+    def test_adjacent_numbers(self):
+        star = self.schematic.grid.index(1, 3)
+        self.assertEqual({467, 35}, {self.schematic.values[x] for x in self.schematic.get_adjacent_numbers(star)})
+        corner = self.schematic.grid.index(0, 0)
+        self.assertEqual({0}, self.schematic.get_adjacent_numbers(corner))
+
+    def test_sums(self):
+        self.assertEqual(4361, self.schematic.sum_part_numbers())
+        self.assertEqual(467835, self.schematic.sum_gear_ratios())
+
+    def test_scan(self):
+        self.assertEqual((4361, 467835), scan(x.encode('ascii') for x in example))
+        self.assertEqual((0, 0), scan([]))
+        self.assertEqual((5, 6), scan([b'3*2', b'..', b'9.$']))
+
+    def test_number_on_the_right_edge(self):
+        schematic = Schematic(Grid.from_lines(['..12', '...*', '3*..']))
+        self.assertEqual(15, schematic.sum_part_numbers())
+        self.assertEqual(0, schematic.sum_gear_ratios())
@@ -0,0 +1,33 @@
+import io
+import unittest
+
+from aoc import solvers
+
+
+class TestSolvers(unittest.TestCase):
+
+    def test_discover_all(self):
+        names = [x.name for x in solvers.discover()]
+        self.assertIn('day01/main1', names)
+        self.assertIn('day20/main2', names)
+        self.assertEqual(sorted(names), names)
+
+    def test_discover_selection(self):
+        names = [x.name for x in solvers.discover(['day03', 'day05/main2.py'])]
+        self.assertEqual(['day03/main1', 'day03/main2', 'day05/main2'], names)
+
+    def test_run(self):
+        solver = solvers.discover(['day06/main1'])[0]
+        out = io.StringIO()
+        result = solvers.run(solver, ['input_small.txt'], out=out)
+        self.assertIsNone(result.error)
+        self.assertEqual(288, result.answer)
+        self.assertEqual('day06/main1: 288\n', out.getvalue())
+        self.assertGreater(result.parse_ns, 0)
+        self.assertGreater(result.solve_ns, 0)
+        self.assertGreater(result.peak_memory, 0)
+
+    def test_run_missing_input(self):
+        solver = solvers.discover(['day06/main1'])[0]
+        result = solvers.run(solver, ['no_such_input.txt'], out=io.StringIO())
+        self.assertIn('missing input', result.error)
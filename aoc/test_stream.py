@@ -0,0 +1,25 @@
+import io
+import unittest
+
+from aoc import stream
+
+
+class TestStream(unittest.TestCase):
+
+    def test_lines(self):
+        file = io.BytesIO(b'abc \r\n\n  def\n')
+        self.assertEqual(['abc', 'def'], list(stream.lines(file)))
+
+    def test_tokens_across_chunks(self):
+        tokens = ['rn=1', 'cm-', 'qp=3', 'cm=2', 'qp-', 'pc=4']
+        file = io.BytesIO((','.join(tokens) + '\n').encode('ascii'))
+        original, stream.chunk_size = stream.chunk_size, 3
+        try:
+            self.assertEqual(tokens, list(stream.tokens(b',', file)))
+        finally:
+            stream.chunk_size = original
+
+    def test_total_reports_progress(self):
+        out = io.StringIO()
+        self.assertEqual(15, stream.total(range(1, 6), progress=2, out=out))
+        self.assertEqual('2: 3\n4: 10\n', out.getvalue())
@@ -0,0 +1,75 @@
+import argparse
+import sys
+import time
+
+from aoc import benchmark, solvers
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('solvers', nargs='*', help='solvers to benchmark, e.g. day03 or day03/main1 (default: all)')
+argparser.add_argument('--scales', type=float, nargs='+', default=benchmark.default_scales,
+                       help="input sizes as fractions of each day's default generator size (default: %(default)s)")
+argparser.add_argument('--repeat', type=int, default=3, help='runs per benchmark; the best one counts (default: %(default)s)')
+argparser.add_argument('--timeout', type=float, default=30, help='seconds allowed per run (default: %(default)s)')
+argparser.add_argument('--threshold', type=float, default=benchmark.default_threshold,
+                       help='flag benchmarks that got slower by more than this fraction (default: %(default)s)')
+argparser.add_argument('--against', help='commit to compare with (default: the parent of the current commit)')
+argparser.add_argument('--directory', default=benchmark.default_directory, help='where inputs and history are kept (default: %(default)s)')
+argparser.add_argument('--no-save', action='store_true', help='do not record this run in the history')
+argparser.add_argument('--show', action='store_true', help='print the recorded history of the selected solvers instead of running them')
+
+start_time = time.perf_counter()
+
+
+def main():
+    init()
+    process()
+    wrapup()
+
+
+def init():
+    global args, selected
+    args = argparser.parse_args()
+    selected = solvers.discover(args.solvers)
+
+
+def process():
+    global run
+    if args.show:
+        runs = benchmark.history(directory=args.directory)
+        names = {x for r in runs for x in r.timings if any(x.startswith(s.name + '@') for s in selected)}
+        names = sorted(names, key=lambda x: (x.split('@')[0], int(x.split('@')[1])))
+        print(benchmark.format_history(runs, names))
+        return
+    run = benchmark.new_run()
+    for solver in selected:
+        for size in benchmark.get_sizes(solver.day, args.scales):
+            name = benchmark.benchmark_name(solver, size)
+            path = benchmark.get_input(solver.day, size, args.directory)
+            seconds, error = benchmark.time_solver(solver, path, args.repeat, args.timeout)
+            run.timings[name] = seconds
+            if error:
+                run.errors[name] = error
+            print(f'{name}: {"failed: " + error if error else f"{seconds:.4f} s"}')
+
+
+def wrapup():
+    if args.show:
+        return
+    against = args.against or benchmark.parent_commit(run.commit)
+    baseline = benchmark.find_baseline(benchmark.history(run.machine, args.directory), against)
+    if not args.no_save:
+        benchmark.save(run, args.directory)
+    if baseline is None:
+        print(f'no run of {against[:10]} to compare with' if against else 'nothing to compare with yet')
+        return
+    changes = benchmark.compare(baseline, run, args.threshold)
+    print(f'compared with {baseline.commit[:10]}: {len(changes)} slower')
+    for change in changes:
+        print(f'    {benchmark.format_change(change)}')
+    if changes:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,30 +1,93 @@
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
 ascii_zero = ord('0')
 ascii_nine = ord('9')
+newline = ord('\n')
+# everything but the digits and the line breaks between them
+non_digits = bytes(x for x in range(256) if not ascii_zero <= x <= ascii_nine and x != newline)
 
 
 def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(get_calibration_value, stream.lines()), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return source.data
+
+
+def solve(data):
+    total = 0
+    # The bytes path is already mostly C, so numpy only saves about 4 ns a
+    # byte and needs some 30 MB to pay for itself.
+    sum_chunk = sum_chunk_numpy if lazy.numpy_for(len(data), 4e-9) else sum_chunk_bytes
+    for chunk in inputs.line_chunks(data):
+        total += sum_chunk(chunk)
+    return total
+
+
+def sum_chunk_bytes(chunk: bytes):
+    # Dropping everything but digits and newlines leaves each line as just
+    # its digits, so only the first and last byte of each is looked at.
     total = 0
-    with open('input.txt') as file:
-        for line in file:
-            line = line.strip()
-            first, last = get_first_and_last_digits(line)
-            calibration_value = first * 10 + last
-            total += calibration_value
-    print(total)
+    empty = False
+    for digits in chunk.translate(None, non_digits).split(b'\n'):
+        if digits:
+            total += (digits[0] - ascii_zero) * 10 + digits[-1] - ascii_zero
+        else:
+            empty = True
+    if empty:
+        check_digits(chunk)
+    return total
+
+
+def check_digits(chunk: bytes):
+    # Blank lines are skipped, as when streaming, but a line without a digit
+    # has no calibration value.
+    for line in chunk.split(b'\n'):
+        if line.strip() and not line.translate(None, non_digits):
+            raise ValueError(f'no digit in line {str(line.strip(), "ascii")!r}')
 
 
-def get_first_and_last_digits(line):
-    temp = [int(x) for x in list(line) if is_digit(x)]
-    return temp[0], temp[-1]
+def sum_chunk_numpy(chunk: bytes):
+    # The same reduction as sum_chunk_bytes, but the first and last digit of
+    # every line are gathered with the line breaks as indexes.
+    numpy = lazy.optional_import('numpy')
+    digits = numpy.frombuffer(chunk.translate(None, non_digits), dtype=numpy.uint8)
+    breaks = numpy.flatnonzero(digits == newline)
+    starts = numpy.concatenate(([0], breaks + 1))
+    ends = numpy.concatenate((breaks, [len(digits)]))
+    filled = starts < ends
+    if not filled.all():
+        check_digits(chunk)
+    first_digits = digits[starts[filled]].astype(numpy.int64) - ascii_zero
+    last_digits = digits[ends[filled] - 1].astype(numpy.int64) - ascii_zero
+    return int((first_digits * 10 + last_digits).sum())
 
 
-def is_digit(char):
-    return ord(char) >= ascii_zero and ord(char) <= ascii_nine
+def get_calibration_value(line):
+    digits = line.encode('ascii').translate(None, non_digits)
+    if not digits:
+        raise ValueError(f'no digit in line {line!r}')
+    return (digits[0] - ascii_zero) * 10 + digits[-1] - ascii_zero
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,37 +1,68 @@
-import re
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, stream
+from aoc.automaton import Automaton
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
 number_words = ['one', 'two', 'three', 'four',
                 'five', 'six', 'seven', 'eight', 'nine']
 digits = [str(x) for x in range(1, 10)]
 
-forward_pattern = '|'.join(number_words + digits)
-backward_pattern = forward_pattern[::-1]
 
-forward_pattern = re.compile(forward_pattern)
-backward_pattern = re.compile(backward_pattern)
+@lazy.table
+def scanner():
+    values = {word: i for i, word in enumerate(number_words, start=1)}
+    values.update({digit: int(digit) for digit in digits})
+    return Automaton(values)
 
 
 def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(get_calibration_value, stream.lines()), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return source.data
+
+
+def solve(data):
     total = 0
-    with open('input.txt') as file:
-        for line in file:
-            line = line.strip()
-            first = forward_pattern.search(line).group(0)
-            last = backward_pattern.search(line[::-1]).group(0)[::-1]
-            first, last = get_value(first), get_value(last)
-            calibration_value = first * 10 + last
-            total += calibration_value
-    print(total)
+    for digits in scanner.first_and_last_per_line(data):
+        if digits is None:
+            check_digits(data)
+        first, last = digits
+        total += first * 10 + last
+    return total
+
+
+def check_digits(data):
+    # finds the line with no digit to name it in the error
+    for line in bytes(data).split(b'\n'):
+        if line.strip():
+            get_calibration_value(str(line.strip(), 'ascii'))
 
 
-def get_value(string):
-    if len(string) == 1:
-        return int(string)
-    return number_words.index(string) + 1
+def get_calibration_value(line):
+    digits = scanner.first_and_last(line.encode('ascii'))
+    if digits is None:
+        raise ValueError(f'no digit in line {line!r}')
+    first, last = digits
+    return first * 10 + last
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -0,0 +1,28 @@
+import unittest
+
+import main1
+
+from aoc import lazy
+
+chunk = b'1abc2\npqr3stu8vwx\n\na1b2c3d4e5f\ntreb7uchet\n'
+no_digits = b'1abc2\nnone\n'
+
+
+class Test1(unittest.TestCase):
+
+    def test_sum_chunk_bytes(self):
+        self.assertEqual(142, main1.sum_chunk_bytes(chunk))
+        with self.assertRaises(ValueError):
+            main1.sum_chunk_bytes(no_digits)
+
+    @unittest.skipUnless(lazy.optional_import('numpy'), 'numpy is not installed')
+    def test_sum_chunk_numpy(self):
+        self.assertEqual(142, main1.sum_chunk_numpy(chunk))
+        self.assertEqual(0, main1.sum_chunk_numpy(b''))
+        with self.assertRaises(ValueError):
+            main1.sum_chunk_numpy(no_digits)
+
+    def test_calibration_value(self):
+        self.assertEqual(77, main1.get_calibration_value('treb7uchet'))
+        with self.assertRaises(ValueError):
+            main1.get_calibration_value('none')
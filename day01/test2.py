@@ -0,0 +1,18 @@
+import unittest
+
+import main2
+
+data = b'two1nine\neightwothree\n\nabcone2threexyz\n'
+
+
+class Test2(unittest.TestCase):
+
+    def test_solve(self):
+        self.assertEqual(29 + 83 + 13, main2.solve(data))
+        with self.assertRaises(ValueError):
+            main2.solve(b'abc\nxyz\none')
+
+    def test_calibration_value(self):
+        self.assertEqual(83, main2.get_calibration_value('eightwothree'))
+        with self.assertRaises(ValueError):
+            main2.get_calibration_value('xyz')
@@ -1,8 +1,16 @@
-import re
+import argparse
+import os
+import sys
 import time
 
-game_pattern = re.compile("Game ([1-9][0-9]*): .*")
-color_pattern = re.compile("([1-9][0-9]*) (blue|red|green)")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import cubes, inputs, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+argparser.add_argument('--limits', nargs='+', metavar='RED,GREEN,BLUE', help='answer for each of these limits instead of 12,13,14')
 
 max_cubes = {
     'red': 12,
@@ -12,24 +20,37 @@ max_cubes = {
 
 
 def main():
-    total = 0
-    with open('input.txt') as file:
-        for line in file:
-            line = line.strip()
-            game_id = int(game_pattern.match(line).group(1))
-            if was_possible(line):
-                total += game_id
-    print(total)
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(score_game, map(cubes.parse_game, stream.lines())), args.progress))
+    elif args.limits:
+        limits = [[int(x) for x in text.split(',')] for text in args.limits]
+        for text, total in zip(args.limits, parse(inputs.load(args.file)).sum_possible_batch(limits)):
+            print(f'{text}: {total}')
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return cubes.GameLog.from_input(source)
+
+
+def solve(log: cubes.GameLog):
+    return log.sum_possible(max_cubes)
+
+
+def score_game(game):
+    game_id, draws = game
+    return game_id if was_possible(draws) else 0
 
 
-def was_possible(line):
-    for count, color in color_pattern.findall(line):
-        if int(count) > max_cubes[color]:
-            return False
-    return True
+def was_possible(draws):
+    limits = cubes.to_limits(max_cubes)
+    return all(count <= limit for count, limit in zip(cubes.get_maximums(draws), limits))
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
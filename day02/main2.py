@@ -1,42 +1,41 @@
-import re
+import argparse
+import os
+import sys
 import time
 
-game_pattern = re.compile("Game ([1-9][0-9]*): .*")
-color_pattern = re.compile("([1-9][0-9]*) (blue|red|green)")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import cubes, inputs, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
 
 
 def main():
-    total = 0
-    with open('input.txt') as file:
-        for line in file:
-            line = line.strip()
-            minimums = get_minimum_cubes(line)
-            power = get_power(minimums)
-            total += power
-    print(total)
-
-
-def get_minimum_cubes(line):
-    minimums = {
-        'red': 0,
-        'green': 0,
-        'blue': 0,
-    }
-    for count, color in color_pattern.findall(line):
-        count = int(count)
-        if minimums[color] < count:
-            minimums[color] = count
-    return minimums
-
-
-def get_power(minimums):
-    result = 1
-    for v in minimums.values():
-        result *= v
-    return result
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(get_game_power, map(cubes.parse_game, stream.lines())), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return cubes.GameLog.from_input(source)
+
+
+def solve(log: cubes.GameLog):
+    return log.sum_powers()
+
+
+def get_game_power(game):
+    game_id, draws = game
+    red, green, blue = cubes.get_maximums(draws)
+    return red * green * blue
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
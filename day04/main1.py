@@ -1,29 +1,43 @@
-import re
+import argparse
+import os
+import sys
 import time
 
-card_pattern = re.compile("Card[ ]+[1-9][0-9]*: ([0-9 ]+)\|([0-9 ]+)")
-number_pattern = re.compile("[1-9][0-9]*")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import cards, inputs, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
 
 
 def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(score_line, stream.lines()), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return cards.read_match_counts(source)
+
+
+def solve(match_counts):
     total = 0
-    for line in get_lines():
-        match = card_pattern.fullmatch(line)
-        winning_numbers = set(number_pattern.findall(match.group(1)))
-        my_numbers = set(number_pattern.findall(match.group(2)))
-        my_winning_numbers = len(winning_numbers & my_numbers)
-        card_score = 2 ** (my_winning_numbers - 1) if my_winning_numbers else 0
-        total += card_score
-    print(total)
+    for matches in match_counts:
+        total += cards.get_score(matches)
+    return total
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def score_line(line):
+    card_id, winning, held = cards.parse_card(line)
+    return cards.get_score(cards.count_matches(winning, held))
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
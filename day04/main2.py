@@ -1,39 +1,40 @@
-import re
+import argparse
+import os
+import sys
 import time
 
-card_pattern = re.compile("Card[ ]+([1-9][0-9]*): ([0-9 ]+)\|([0-9 ]+)")
-number_pattern = re.compile("[1-9][0-9]*")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import cards, inputs, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
 
 def main():
-    cards = {}
-    for line in get_lines():
-        match = card_pattern.fullmatch(line)
-        card_id = int(match.group(1))
-        winning_number_list = set(number_pattern.findall(match.group(2)))
-        guessed_number_list = set(number_pattern.findall(match.group(3)))
-        winning_guesses_count = len(winning_number_list & guessed_number_list)
-        cards[card_id] = {
-            'winning_guesses_count': winning_guesses_count,
-            'count': 1
-        }
-    for card_id, card in cards.items():
-        winning_guesses_count = card['winning_guesses_count']
-        card_count = card['count']
-        for i in range(winning_guesses_count):
-            cards[card_id + i + 1]['count'] += card_count
-    total = 0
-    for card in cards.values():
-        total += card['count']
-    print(total)
-
-
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(cards.CardCounter().add, map(count_line_matches, stream.lines())), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return cards.read_match_counts(source)
+
+
+def solve(match_counts):
+    return sum(cards.count_copies(match_counts))
+
+
+def count_line_matches(line):
+    card_id, winning, held = cards.parse_card(line)
+    return cards.count_matches(winning, held)
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
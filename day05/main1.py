@@ -1,11 +1,21 @@
-import re
+import argparse
+import bisect
+import os
+import sys
 import time
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
 
-integers_pattern = re.compile('[0-9]+')
-map_start_pattern = re.compile('([a-z]+)-to-([a-z]+) map:')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
+integers_pattern = lazy.compile('[0-9]+')
+map_start_pattern = lazy.compile('([a-z]+)-to-([a-z]+) map:')
 
 
 @dataclass(frozen=True)
@@ -26,64 +36,101 @@ class Map:
     source_category: str
     destination_category: str
     transformation_rules: List[TransformationRule]
+    # the rules sorted by source, and where each of them starts
+    _sorted_rules: List[TransformationRule] = field(init=False, repr=False, compare=False)
+    _source_starts: List[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        rules = sorted(self.transformation_rules, key=lambda x: x.source_range_start)
+        object.__setattr__(self, '_sorted_rules', rules)
+        object.__setattr__(self, '_source_starts', [x.source_range_start for x in rules])
 
     def transform(self, value):
-        for rule in self.transformation_rules:
-            if rule.can_transform(value):
-                return rule.transform(value)
+        # source ranges do not overlap, so only the last rule starting at or
+        # before the value can cover it
+        i = bisect.bisect_right(self._source_starts, value) - 1
+        if i >= 0 and self._sorted_rules[i].can_transform(value):
+            return self._sorted_rules[i].transform(value)
         return value
 
+    def transform_array(self, numpy, values):
+        rules = self._sorted_rules
+        starts = numpy.array(self._source_starts, dtype=numpy.int64)
+        ends = numpy.array([x.source_range_start + x.range_length for x in rules], dtype=numpy.int64)
+        adjustments = numpy.array([x.destination_range_start - x.source_range_start for x in rules], dtype=numpy.int64)
+        i = numpy.searchsorted(starts, values, side='right') - 1
+        covered = (i >= 0) & (values < ends[i])
+        return values + numpy.where(covered, adjustments[i], 0)
+
 
 @dataclass(frozen=True)
 class MapManager:
     maps: List[Map]
+    _maps_by_source: Dict[str, Map] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_maps_by_source', {x.source_category: x for x in self.maps})
+
+    def get_map(self, source_category) -> Map:
+        if source_category not in self._maps_by_source:
+            raise Exception(f'No map found for {source_category}')
+        return self._maps_by_source[source_category]
 
     def transform(self, source_category, value):
-        for map in self.maps:
-            if map.source_category == source_category:
-                return map.destination_category, map.transform(value)
-        raise Exception(f'No map found for {source_category}')
+        map = self.get_map(source_category)
+        return map.destination_category, map.transform(value)
+
+    def transform_array(self, source_category, numpy, values):
+        map = self.get_map(source_category)
+        return map.destination_category, map.transform_array(numpy, values)
 
 
 def main():
-    map_manager = build_map_manager()
+    global args
+    args = argparser.parse_args()
+    min_location = solve(parse(inputs.load(args.file)))
+    print(f'Minimum location: {min_location}')
+
+
+def parse(source: inputs.Input):
+    blocks = source.text_blocks()
+    return get_seeds(blocks), build_map_manager(blocks)
+
+
+def solve(almanac):
+    seeds, map_manager = almanac
+    # numpy saves about 13 us a seed
+    numpy = lazy.numpy_for(len(seeds), 1.3e-5)
+    if numpy:
+        return int(get_locations(numpy, seeds, map_manager).min())
     min_location = None
-    for seed in get_seeds():
+    for seed in seeds:
         location = get_location(seed, map_manager)
         if min_location is None or min_location > location:
             min_location = location
-    print(f'Minimum location: {min_location}')
+    return min_location
 
 
-def get_seeds():
-    line = next(get_lines())
+def get_seeds(blocks):
+    line = blocks[0][0]
     return find_all_integers(line)
 
 
-def build_map_manager():
+def build_map_manager(blocks):
     maps = []
-    for source_category, destination_category, rule_values in get_map_input():
+    for source_category, destination_category, rule_values in get_map_input(blocks):
         rules = [TransformationRule(*r) for r in rule_values]
         map = Map(source_category, destination_category, rules)
         maps.append(map)
     return MapManager(maps)
 
 
-def get_map_input():
-    generator = get_lines()
-    for line in generator:
-        match = map_start_pattern.fullmatch(line)
-        if match:
-            source_category, destination_category = match.group(
-                1), match.group(2)
-            rules = []
-            for line in generator:
-                if line != '':
-                    rules.append(find_all_integers(line))
-                else:
-                    yield source_category, destination_category, rules
-                    break
-    yield source_category, destination_category, rules
+def get_map_input(blocks):
+    for block in blocks[1:]:
+        match = map_start_pattern.fullmatch(block[0])
+        source_category, destination_category = match.group(1), match.group(2)
+        rules = [find_all_integers(line) for line in block[1:]]
+        yield source_category, destination_category, rules
 
 
 def get_location(seed, map_manager):
@@ -93,10 +140,12 @@ def get_location(seed, map_manager):
     return value
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def get_locations(numpy, seeds, map_manager):
+    # every seed through every stage at once, one searchsorted per stage
+    category, values = 'seed', numpy.asarray(seeds, dtype=numpy.int64)
+    while category != 'location':
+        category, values = map_manager.transform_array(category, numpy, values)
+    return values
 
 
 def find_all_integers(line):
@@ -104,6 +153,6 @@ def find_all_integers(line):
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -0,0 +1,24 @@
+import random
+import unittest
+
+import main1
+
+from aoc import inputs, lazy
+
+
+class Test1(unittest.TestCase):
+
+    def setUp(self):
+        self.seeds, self.map_manager = main1.parse(inputs.load('input_small.txt'))
+
+    def test_transform(self):
+        map = self.map_manager.get_map('seed')
+        self.assertEqual([map.transform(x) for x in [0, 49, 50, 79, 97, 98, 99, 100]], [0, 49, 52, 81, 99, 50, 51, 100])
+        self.assertEqual(35, main1.solve((self.seeds, self.map_manager)))
+
+    @unittest.skipIf(lazy.optional_import('numpy') is None, 'numpy is not installed')
+    def test_get_locations(self):
+        numpy = lazy.optional_import('numpy')
+        seeds = random.Random(0).choices(range(120), k=500)
+        expected = [main1.get_location(x, self.map_manager) for x in seeds]
+        self.assertEqual(expected, main1.get_locations(numpy, seeds, self.map_manager).tolist())
@@ -1,9 +1,19 @@
-import re
+import argparse
+import math
+import os
+import sys
 import time
 
 from dataclasses import dataclass
 
-integers_pattern = re.compile('[0-9]+')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, races
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
+integers_pattern = lazy.compile('[0-9]+')
 
 
 @dataclass
@@ -13,40 +23,33 @@ class Race:
 
 
 def main():
-    total = 1
-    for race in get_races():
-        total *= count_ways_to_win(race)
-    print(total)
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
 
+def parse(source: inputs.Input):
+    return get_races(source)
 
-def count_ways_to_win(race: Race):
-    result = 0
-    for button_press in range(race.duration):
-        velocity = button_press
-        distance_travelled = velocity * (race.duration - button_press)
-        if distance_travelled > race.distance_to_beat:
-            result += 1
-    return result
 
+def solve(race_list):
+    durations = [x.duration for x in race_list]
+    records = [x.distance_to_beat for x in race_list]
+    return math.prod(races.count_ways_batch(durations, records))
 
-def get_races():
-    lines = get_lines()
+
+def get_races(source: inputs.Input):
+    lines = source.text_lines()
     times = find_all_integers(next(lines))
     distances = find_all_integers(next(lines))
     return [Race(time, distance) for time, distance in zip(times, distances)]
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 def find_all_integers(line):
     return [int(x) for x in integers_pattern.findall(line)]
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,9 +1,18 @@
-import re
+import argparse
+import os
+import sys
 import time
 
 from dataclasses import dataclass
 
-integers_pattern = re.compile('[0-9]+')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, races
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
+integers_pattern = lazy.compile('[0-9]+')
 
 
 @dataclass
@@ -13,39 +22,35 @@ class Race:
 
 
 def main():
-    race = get_race()
-    total = count_ways_to_win(race)
-    print(total)
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return get_race(source)
+
+
+def solve(race):
+    return count_ways_to_win(race)
 
 
 def count_ways_to_win(race: Race):
-    result = 0
-    for button_press in range(race.duration):
-        velocity = button_press
-        distance_travelled = velocity * (race.duration - button_press)
-        if distance_travelled > race.distance_to_beat:
-            result += 1
-    return result
+    return races.count_ways_to_win(race.duration, race.distance_to_beat)
 
 
-def get_race():
-    lines = get_lines()
+def get_race(source: inputs.Input):
+    lines = source.text_lines()
     time = int(''.join([str(x) for x in find_all_integers(next(lines))]))
     distance = int(''.join([str(x) for x in find_all_integers(next(lines))]))
     return Race(time, distance)
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 def find_all_integers(line):
     return [int(x) for x in integers_pattern.findall(line)]
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
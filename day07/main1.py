@@ -1,77 +1,61 @@
-import collections
-import re
+import argparse
+import os
+import sys
 import time
 
-from dataclasses import dataclass
-from typing import List
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-input_pattern = re.compile("(.+) ([0-9]+)")
+from aoc import camel, inputs, lazy, stream
 
-hand_types = ['high_card', 'one_pair', 'two_pair', 'three_of_a_kind', 'full_house', 'four_of_a_kind', 'five_of_a_kind']
-card_labels = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
 
+input_pattern = lazy.compile("(.+) ([0-9]+)")
+jokers = False
 
-def get_hand_type(cards):
-    cardinality = len(set(list(cards)))
-    if cardinality == 1:
-        return 'five_of_a_kind'
-    elif cardinality == 4:
-        return 'one_pair'
-    elif cardinality == 5:
-        return 'high_card'
-    temp = collections.defaultdict(int)
-    for card in list(cards):
-        temp[card] += 1
-    max_occurrence = max(temp.values())
-    if cardinality == 2:
-        return 'four_of_a_kind' if max_occurrence == 4 else 'full_house'
-    if cardinality == 3:
-        return 'three_of_a_kind' if max_occurrence == 3 else 'two_pair'
-    raise Exception('wtf')
 
+def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(solve_stream(map(parse_line, stream.lines())))
+    else:
+        print(solve(parse(inputs.load(args.file))))
 
-class Hand:
-
-    def __init__(self, cards, bid):
-        self.cards = cards
-        self.bid = bid
-        self.type = get_hand_type(self.cards)
 
-    def __repr__(self):
-        return f"Hand({self.cards}, {self.type}, {self.bid})"
+def parse(source: inputs.Input):
+    return camel.read_hands(inputs.line_chunks(source.data))
 
-    def __lt__(self, other):
-        a, b = hand_types.index(self.type), hand_types.index(other.type)
-        if a != b:
-            return a < b
-        for a, b in zip(self.cards, other.cards):
-            a, b = card_labels.index(a), card_labels.index(b)
-            if a != b:
-                return a < b
-        return False
 
+def parse_line(line):
+    match = input_pattern.fullmatch(line)
+    return match.group(1), int(match.group(2))
 
-def main():
-    hands: List[Hand] = []
-    for line in get_lines():
-        match = input_pattern.fullmatch(line)
-        cards, bid = match.group(1), int(match.group(2))
-        hands.append(Hand(cards, bid))
-    hands.sort()
-    total = 0
-    for rank, hand in enumerate(hands, start=1):
-        total += (rank * hand.bid)
-    print(total)
 
+def solve(game):
+    hands, bids = game
+    return camel.total_winnings(hands, bids, jokers)
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def solve_stream(records):
+    # Memory grows with the number of different hands (at most 13 ** 5), not
+    # with the number of records. Equal hands keep their input order, so the
+    # i-th copy of a hand is ranked i places after the first one.
+    tallies = {}
+    for cards, bid in records:
+        tally = tallies.setdefault(cards, [0, 0, 0])
+        tally[2] += tally[0] * bid
+        tally[0] += 1
+        tally[1] += bid
+    total, rank = 0, 1
+    for cards in sorted(tallies, key=lambda x: camel.get_sort_key(x, jokers)):
+        count, bids, offsets = tallies[cards]
+        total += rank * bids + offsets
+        rank += count
+    return total
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
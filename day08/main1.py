@@ -1,45 +1,35 @@
-import re
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-node_pattern = re.compile('([A-Z]{3}) = \(([A-Z]{3}), ([A-Z]{3})\)')
+from aoc import inputs
+from aoc.network import Network
 
-
-def main():
-    generator = get_move_generator()
-    network = get_network()
-    current_position = 'AAA'
-    total = 0
-    while current_position != 'ZZZ':
-        next_move = next(generator)
-        current_position = network[current_position][0 if next_move == 'L' else 1]
-        total += 1
-    print(total)
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
 
 
-def get_move_generator():
-    moves = next(get_lines())
-    while True:
-        for x in moves:
-            yield x
+def main():
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
 
 
-def get_network():
-    result = {}
-    for line in get_lines():
-        match = node_pattern.fullmatch(line)
-        if match:
-            result[match.group(1)] = (match.group(2), match.group(3))
-    return result
+def parse(source: inputs.Input):
+    return Network.from_input(source)
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def solve(network: Network):
+    steps = network.first_hit('AAA', ['ZZZ'])
+    if steps is None:
+        raise Exception('ZZZ cannot be reached from AAA')
+    return steps
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
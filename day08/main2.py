@@ -1,89 +1,48 @@
-import functools
-import re
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-node_pattern = re.compile('([A-Z0-9]{3}) = \(([A-Z0-9]{3}), ([A-Z0-9]{3})\)')
+from aoc import inputs
+from aoc.network import Network, combine
 
-
-class Map:
-
-    def __init__(self, current_position, network):
-        self.current_position = current_position
-        self.network = network
-
-    def move(self, direction):
-        current_node = self.network[self.current_position]
-        next_position = current_node[0 if direction == 'L' else 1]
-        self.current_position = next_position
-        return self.current_position
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+argparser.add_argument('--cycles', action='store_true', help='print the cycle each ghost ends up in')
 
 
 def main():
-    network = get_network()
-    start_nodes = [x for x in network.keys() if x.endswith('A')]
-    stop_node_step_numbers = []
-    for a_node in start_nodes:
-        map = Map(a_node, network)
-        journey = find_cycle(map)
-        cycle_start_item = journey[-1]
-        pre_cycle_length = journey.index(cycle_start_item)
-        cycle = journey[pre_cycle_length:]
-        stop_node_step_numbers.append([i + pre_cycle_length for i, (x, _) in enumerate(cycle) if x.endswith('Z')][0])
-    print(stop_node_step_numbers)
-    print(lcm_list(stop_node_step_numbers))
-
-
-def get_network():
-    result = {}
-    for line in get_lines():
-        match = node_pattern.fullmatch(line)
-        if match:
-            result[match.group(1)] = (match.group(2), match.group(3))
-    return result
-
-
-def find_cycle(map: Map):
-    move_generator = get_move_generator()
-    journey = []
-    while True:
-        move_id, left_or_right = next(move_generator)
-        journey_item = (map.current_position, move_id)
-        journey.append(journey_item)
-        if journey.count(journey_item) == 2:
-            break
-        map.move(left_or_right)
-    return journey
-
-
-def lcm_list(list):
-    return functools.reduce(lcm, list)
-
-
-def lcm(a, b):
-    return a * (b // gcd(a, b))
+    global args
+    args = argparser.parse_args()
+    network = parse(inputs.load(args.file))
+    if args.cycles:
+        for cycle in get_cycles(network):
+            print(f'{cycle.start}: offset {cycle.offset}, length {cycle.length}, hits {list(cycle.hits)}')
+    print(solve(network))
 
 
-def gcd(a, b):
-    if b == 0:
-        return a
-    return gcd(b, a % b)
+def parse(source: inputs.Input):
+    return Network.from_input(source)
 
 
-def get_move_generator():
-    moves = next(get_lines())
-    while True:
-        for id, move in enumerate(moves):
-            yield id, move
+def solve(network: Network):
+    steps = combine(get_cycles(network))
+    if steps is None:
+        raise Exception('the ghosts are never all on Z nodes at once')
+    # walk every ghost that far with the block jump tables to make sure
+    if not network.blocks(network.find('Z')).all_hit(network.find('A'), steps):
+        raise Exception(f'the ghosts are not all on Z nodes after {steps} steps')
+    return steps
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def get_cycles(network: Network):
+    targets = network.find('Z')
+    return [network.analyze(x, targets) for x in network.find('A')]
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,20 +1,42 @@
-import re
+import argparse
+import os
+import sys
 import time
 
 from typing import List
 
-integers_pattern = re.compile('-?[0-9]+')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, parallel, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
+integers_pattern = lazy.compile('-?[0-9]+')
 
 def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(predicate_next_value, map(find_all_integers, stream.lines())), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return list(read_sequences(source))
+
+
+def solve(sequences):
     total = 0
-    for sequence in read_sequences():
-        next_value = predicate_next_value(sequence)
+    for next_value in parallel.map(predicate_next_value, sequences):
         total += next_value
-    print(total)
+    return total
 
 
-def read_sequences():
-    for line in get_lines():
+def read_sequences(source: inputs.Input):
+    for line in source.text_lines():
         yield find_all_integers(line)
 
 
@@ -48,13 +70,7 @@ def find_all_integers(line):
     return [int(x) for x in integers_pattern.findall(line)]
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
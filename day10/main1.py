@@ -1,9 +1,19 @@
+import argparse
 import collections
+import os
+import sys
 import time
 
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
 
 @dataclass
 class Pipe:
@@ -70,28 +80,40 @@ class Landscape:
         return self._max_col + 1
 
 
-pipes = [
-    Pipe('|', ['north', 'south']),
-    Pipe('-', ['east', 'west']),
-    Pipe('L', ['north', 'east']),
-    Pipe('J', ['north', 'west']),
-    Pipe('7', ['south', 'west']),
-    Pipe('F', ['south', 'east']),
-    Pipe('.', []),
-    Pipe('S', ['north', 'south', 'east', 'west'])
-]
+@lazy.table
+def pipes():
+    return [
+        Pipe('|', ['north', 'south']),
+        Pipe('-', ['east', 'west']),
+        Pipe('L', ['north', 'east']),
+        Pipe('J', ['north', 'west']),
+        Pipe('7', ['south', 'west']),
+        Pipe('F', ['south', 'east']),
+        Pipe('.', []),
+        Pipe('S', ['north', 'south', 'east', 'west'])
+    ]
 
 
 def main():
-    landscape = build_landscape()
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return build_landscape(source)
+
+
+def solve(landscape: Landscape):
     start_tile = find_start_location(landscape)
     start_tile.distance = 0
     process_tile(start_tile, landscape)
-    print_result(landscape)
+    return calculate_result(landscape)
+
 
-def build_landscape():
+def build_landscape(source: inputs.Input):
     result = Landscape()
-    for row, line in enumerate(get_lines()):
+    for row, line in enumerate(source.text_lines()):
         for col, char in (enumerate(list(line))):
             result.add(Tile(row, col, [pipe for pipe in pipes if pipe.char == char][0]))
     return result
@@ -126,21 +148,15 @@ def print_distances(landscape: Landscape):
                 print(tile.distance, end="")
         print()
 
-def print_result(landscape: Landscape):
+def calculate_result(landscape: Landscape):
     max_distance = 0
     for tile in landscape.get_tiles():
         if tile.distance and max_distance < tile.distance:
             max_distance = tile.distance
-    print(max_distance)
-
-
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+    return max_distance
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
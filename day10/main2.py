@@ -1,11 +1,24 @@
+import argparse
 import collections
+import os
+import sys
 import time
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Generic, Tuple, TypeVar
+from dataclasses import dataclass
+from typing import List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+from aoc.grid import Grid, east, north, south, west
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
 
 directions = ['north', 'south', 'east', 'west']
+direction_offsets = {'north': north, 'south': south, 'east': east, 'west': west}
+unknown_mark, pipe_mark, link_mark = ord(' '), ord('#'), ord('+')
+outside_mark, inside_mark = ord('O'), ord('I')
 
 
 def get_opposite_direction(direction: str):
@@ -21,223 +34,153 @@ class Pipe:
     openings: List[str]
 
 
-pipes = [
-    Pipe('|', ['north', 'south']),
-    Pipe('-', ['east', 'west']),
-    Pipe('L', ['north', 'east']),
-    Pipe('J', ['north', 'west']),
-    Pipe('7', ['south', 'west']),
-    Pipe('F', ['south', 'east']),
-    Pipe('.', []),
-    Pipe('S', ['north', 'south', 'east', 'west'])
-]
+@lazy.table
+def pipes():
+    return [
+        Pipe('|', ['north', 'south']),
+        Pipe('-', ['east', 'west']),
+        Pipe('L', ['north', 'east']),
+        Pipe('J', ['north', 'west']),
+        Pipe('7', ['south', 'west']),
+        Pipe('F', ['south', 'east']),
+        Pipe('.', []),
+        Pipe('S', ['north', 'south', 'east', 'west'])
+    ]
 
 
 def find_pipe(char: str):
-    return [pipe for pipe in pipes if pipe.char == char][0]
-
-
-def can_connect(pipe_from: Pipe, pipe_to: Pipe, direction_from: str):
-    return get_opposite_direction(direction_from) in pipe_from.openings and direction_from in pipe_to.openings
-
-
-@dataclass
-class PipeTile:
-    row: int
-    col: int
-    pipe: Pipe
-    distance: int = None
-
+    return pipes_by_char[char]
 
-T = TypeVar("T")
 
+@lazy.table
+def pipes_by_char():
+    return {pipe.char: pipe for pipe in pipes}
 
-class CompassGrid(Generic[T]):
 
-    def __init__(self):
-        self._dict = {}
-        self._max_row = self._max_col = None
-
-    def put_item(self, row, col, item: T):
-        self._dict[(row, col)] = item
-        if self._max_row is None or self._max_row < row:
-            self._max_row = row
-        if self._max_col is None or self._max_col < col:
-            self._max_col = col
-
-    def get_item(self, row, col) -> T:
-        return self._dict.get((row, col), None)
-
-    def get_items(self) -> List[T]:
-        return [tile for tile in self._dict.values()]
+def can_connect(pipe_from: Pipe, pipe_to: Pipe, direction_from: str):
+    return get_opposite_direction(direction_from) in pipe_from.openings and direction_from in pipe_to.openings
 
-    def get_neighbor(self, row, col, direction) -> T:
-        if direction == 'north':
-            row -= 1
-        elif direction == 'south':
-            row += 1
-        elif direction == 'east':
-            col += 1
-        elif direction == 'west':
-            col -= 1
-        else:
-            raise Exception('Invalid direction')
-        return self.get_item(row, col)
 
-    def get_neighbors(self, row, col) -> List[T]:
-        result = [self.get_neighbor(row, col, direction) for direction in directions]
-        return [x for x in result if x]
+def main():
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
 
-    @property
-    def height(self):
-        return self._max_row + 1
 
-    @property
-    def width(self):
-        return self._max_col + 1
+def parse(source: inputs.Input):
+    return Grid.from_input(source)
 
 
-def main():
-    landscape = build_landscape()
-    start_tile = find_start_location(landscape)
-    start_tile.distance = 0
-    process_tile(start_tile, landscape)
+def solve(landscape: Grid):
+    start_location = landscape.find('S')
+    loop = find_loop(start_location, landscape)
     #print_landscape(landscape)
-    #print_distances(landscape)
-    working_grid = build_working_grid(landscape)
+    #print_loop(loop)
+    working_grid = build_working_grid(landscape, loop)
     mark_outside(working_grid)
     mark_inside(working_grid)
     #print_string_grid(working_grid)
     results_grid = build_results_grid(landscape, working_grid)
     print_string_grid(results_grid)
-    print_result(results_grid)
+    return calculate_result(results_grid)
 
 
-def build_landscape():
-    result = CompassGrid[PipeTile]()
-    for row, line in enumerate(get_lines()):
-        for col, char in (enumerate(list(line))):
-            result.put_item(row, col, PipeTile(row, col, find_pipe(char)))
-    return result
+def get_pipe(landscape: Grid, row, col) -> Pipe:
+    return find_pipe(chr(landscape[row, col]))
 
 
-def find_start_location(landscape: CompassGrid[PipeTile]) -> PipeTile:
-    for tile in landscape.get_items():
-        if tile.pipe.char == 'S':
-            return tile
-    return None
+def get_neighbor(grid: Grid, row, col, direction):
+    row_offset, col_offset = direction_offsets[direction]
+    row, col = row + row_offset, col + col_offset
+    return (row, col) if grid.contains(row, col) else None
 
 
-def process_tile(tile: PipeTile, landscape: CompassGrid[PipeTile]):
+def find_loop(start_location, landscape: Grid) -> Grid:
+    result = Grid(landscape.height, landscape.width)
+    result[start_location] = 1
     queue = collections.deque()
-    queue.append(tile)
+    queue.append(start_location)
     while len(queue) > 0:
-        tile = queue.popleft()
+        row, col = queue.popleft()
         for direction in directions:
-            neighbor = landscape.get_neighbor(tile.row, tile.col, direction)
-            if neighbor and neighbor.distance is None and can_connect(neighbor.pipe, tile.pipe, direction):
-                neighbor.distance = tile.distance + 1
+            neighbor = get_neighbor(landscape, row, col, direction)
+            if neighbor and not result[neighbor] and can_connect(get_pipe(landscape, *neighbor), get_pipe(landscape, row, col), direction):
+                result[neighbor] = 1
                 queue.append(neighbor)
+    return result
 
 
-def build_working_grid(landscape: CompassGrid[str]):
-    result = CompassGrid[str]()
-    for row in range(landscape.height * 2 + 1):
-        for col in range(landscape.width * 2 + 1):
-            result.put_item(row, col, ' ')
+def build_working_grid(landscape: Grid, loop: Grid):
+    result = Grid(landscape.height * 2 + 1, landscape.width * 2 + 1, ' ')
     for row in range(landscape.height):
         for col in range(landscape.width):
-            tile: PipeTile = landscape.get_item(row, col)
-            if tile.pipe.char != '.' and tile.distance is not None:
-                result.put_item(row * 2 + 1, col * 2 + 1, '#')
-            south = landscape.get_neighbor(row, col, 'south')
-            if south and can_connect(tile.pipe, south.pipe, 'north'):
-                result.put_item(row * 2 + 2, col * 2 + 1, '+')
-            east = landscape.get_neighbor(row, col, 'east')
-            if east and can_connect(tile.pipe, east.pipe, 'west'):
-                result.put_item(row * 2 + 1, col * 2 + 2, '+')
+            pipe = get_pipe(landscape, row, col)
+            if pipe.char != '.' and loop[row, col]:
+                result[row * 2 + 1, col * 2 + 1] = pipe_mark
+            south = get_neighbor(landscape, row, col, 'south')
+            if south and can_connect(pipe, get_pipe(landscape, *south), 'north'):
+                result[row * 2 + 2, col * 2 + 1] = link_mark
+            east = get_neighbor(landscape, row, col, 'east')
+            if east and can_connect(pipe, get_pipe(landscape, *east), 'west'):
+                result[row * 2 + 1, col * 2 + 2] = link_mark
     return result
 
 
-def mark_outside(grid: CompassGrid[str]):
+def mark_outside(grid: Grid):
+    queue = collections.deque()
     for row in range(grid.height):
         for col in range(grid.width):
             if row == 0 or col == 0:
-                grid.put_item(row, col, 'O')
-    keep_running = True
-    while keep_running:
-        keep_running = False
-        for row in range(grid.height):
-            for col in range(grid.width):
-                if grid.get_item(row, col) == ' ':
-                    is_outside = 'O' in grid.get_neighbors(row, col)
-                    if is_outside:
-                        grid.put_item(row, col, 'O')
-                        keep_running = True
+                grid[row, col] = outside_mark
+                queue.append((row, col))
+    while queue:
+        row, col = queue.popleft()
+        for neighbor in grid.neighbors(row, col):
+            if grid[neighbor] == unknown_mark:
+                grid[neighbor] = outside_mark
+                queue.append(neighbor)
 
 
-def mark_inside(pipe_grid: CompassGrid[str]):
+def mark_inside(pipe_grid: Grid):
     keep_running = True
     while keep_running:
         keep_running = False
         for row in range(pipe_grid.height):
             for col in range(pipe_grid.width):
-                if pipe_grid.get_item(row, col) == ' ':
+                if pipe_grid[row, col] == unknown_mark:
                     keep_running = True
-                    pipe_grid.put_item(row, col, 'I')
+                    pipe_grid[row, col] = inside_mark
 
 
-def build_results_grid(landscape: CompassGrid[PipeTile], working_grid: CompassGrid[str]):
-    result = CompassGrid[str]()
+def build_results_grid(landscape: Grid, working_grid: Grid):
+    result = Grid(landscape.height, landscape.width)
     for row in range(landscape.height):
         for col in range(landscape.width):
             adj_row, adj_col = row * 2 + 1, col * 2 + 1
-            result.put_item(row, col, working_grid.get_item(adj_row, adj_col))
+            result[row, col] = working_grid[adj_row, adj_col]
     return result
 
 
-def print_landscape(landscape: CompassGrid[PipeTile]):
-    for row in range(landscape.height):
-        for col in range(landscape.width):
-            tile = landscape.get_item(row, col)
-            print(tile.pipe.char, end="")
-        print()
-
-
-def print_distances(landscape: CompassGrid[PipeTile]):
-    for row in range(landscape.height):
-        for col in range(landscape.width):
-            tile = landscape.get_item(row, col)
-            if tile is None or tile.distance is None:
-                print('.', end="")
-            else:
-                print(tile.distance, end="")
-        print()
+def print_landscape(landscape: Grid):
+    for line in landscape.lines():
+        print(line)
 
 
-def print_string_grid(grid: CompassGrid[str]):
-    for row in range(grid.height):
-        for col in range(grid.width):
-            print(grid.get_item(row, col), end="")
-        print()
+def print_loop(loop: Grid):
+    for row in loop.rows():
+        print(''.join('#' if x else '.' for x in row))
 
 
-def print_result(grid: CompassGrid[str]):
-    total = 0
-    for row in range(grid.height):
-        for col in range(grid.width):
-            if grid.get_item(row, col) == 'I':
-                total += 1
-    print(total)
+def print_string_grid(grid: Grid):
+    for line in grid.lines():
+        print(line)
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def calculate_result(grid: Grid):
+    return grid.count(inside_mark)
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
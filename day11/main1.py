@@ -1,19 +1,38 @@
+import argparse
+import os
+import sys
 import time
 
 from typing import Set
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
 
 def main():
-    original_galaxies = get_galaxies()
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return get_galaxies(source)
+
+
+def solve(original_galaxies):
     expanding_rows, expanding_columns = get_expanding_rows(original_galaxies), get_expanding_columns(original_galaxies)
     adjusted_galaxies = get_adjusted_galaxies(original_galaxies, expanding_rows, expanding_columns)
     total = calculate_total_distance(adjusted_galaxies)
-    print(total)
+    return total
 
 
-def get_galaxies():
+def get_galaxies(source: inputs.Input):
     result = set()
-    for row, line in enumerate(get_lines()):
+    for row, line in enumerate(source.text_lines()):
         for col, char in enumerate(list(line)):
             if char == '#':
                 result.add((row, col))
@@ -55,13 +74,7 @@ def calculate_manhattan_distance(start, end):
     return abs(start[0] - end[0]) + abs(start[1] - end[1])
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
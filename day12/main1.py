@@ -1,17 +1,39 @@
+import argparse
 import itertools
-import re
+import os
+import sys
 import time
 
-broken_springs_pattern = re.compile("#+")
-integers_pattern = re.compile('[0-9]+')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
+broken_springs_pattern = lazy.compile("#+")
+integers_pattern = lazy.compile('[0-9]+')
 
 
 def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total((count_possible_solutions(*x) for x in map(parse_line, stream.lines())), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return [parse_line(line) for line in source.text_lines()]
+
+
+def solve(records):
     total = 0
-    for line in get_lines():
-        record1, record2 = parse_line(line)
+    for record1, record2 in records:
         total += count_possible_solutions(record1, record2)
-    print(total)
+    return total
 
 
 def parse_line(line: str):
@@ -47,13 +69,7 @@ def find_all_integers(line):
     return [int(x) for x in integers_pattern.findall(line)]
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
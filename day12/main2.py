@@ -1,9 +1,19 @@
+import argparse
 import collections
 import itertools
-import re
+import os
+import sys
 import time
 
-integers_pattern = re.compile('[0-9]+')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, parallel, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
+integers_pattern = lazy.compile('[0-9]+')
 
 
 def find_all_integers(line):
@@ -11,13 +21,31 @@ def find_all_integers(line):
 
 
 def main():
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(count_record_solutions, map(parse_record, stream.lines())), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return [parse_record(line) for line in source.text_lines()]
+
+
+def solve(records):
     total = 0
-    for i, line in enumerate(get_lines(), start=1):
-        record1, record2 = parse_line(line)
-        record1, record2 = quintuple(record1, record2)
-        subtotal = count_solutions(record1, record2)
+    for subtotal in parallel.map(count_record_solutions, records):
         total += subtotal
-    print(total)
+    return total
+
+
+def count_record_solutions(record):
+    return count_solutions(*record)
+
+
+def parse_record(line: str):
+    return quintuple(*parse_line(line))
 
 
 def parse_line(line: str):
@@ -122,13 +150,7 @@ def split_by_range(string, start, end):
     return string[:start], string[end:]
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,29 +1,35 @@
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, parallel
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
 
 def main():
-    total = 0
-    for grid in get_grids():
-        score = process_grid(grid)
-        total += score
-    print(total)
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
 
 
-def get_grids():
-    result = []
-    for line in get_lines():
-        if line == '':
-            yield result
-            result = []
-        else:
-            result.append(line)
-    yield result
+def parse(source: inputs.Input):
+    return get_grids(source)
+
+
+def solve(grids):
+    total = 0
+    for score in parallel.map(process_grid, grids):
+        total += score
+    return total
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def get_grids(source: inputs.Input):
+    return source.text_blocks()
 
 
 def process_grid(grid):
@@ -104,6 +110,6 @@ def get_column(grid, col):
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,47 +1,57 @@
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs
+from aoc.grid import Grid
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
+round_rock = ord('O')
+
 
 def main():
-    map = get_map()
-    tilt_north(map)
-    load = calculate_load(map)
-    print(load)
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
 
 
-def get_map():
-    result = []
-    for line in get_lines():
-        result.append(list(line))
-    return result
+def parse(source: inputs.Input):
+    return Grid.from_input(source)
+
+
+def solve(platform: Grid):
+    map = platform.copy()
+    tilt_north(map)
+    load = calculate_load(map)
+    return load
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def tilt_north(map: Grid):
+    width = map.width
+    for col in range(width):
+        map.data[col::width] = tilt_line(map.data[col::width])
 
 
-def tilt_north(map):
-    run_again = True
-    while run_again:
-        run_again = False
-        for row in range(1, len(map)):
-            for col in range(len(map[0])):
-                if map[row][col] == 'O' and map[row - 1][col] == '.':
-                    map[row][col], map[row - 1][col] = '.', 'O'
-                    run_again = True
+def tilt_line(line: bytes) -> bytes:
+    # the round rocks between two cube rocks all roll to the start of the gap
+    return b'#'.join(b'O' * x.count(b'O') + b'.' * (len(x) - x.count(b'O')) for x in line.split(b'#'))
 
 
-def calculate_load(map):
+def calculate_load(map: Grid):
     result = 0
-    for i, row in enumerate(map):
-        rocks = len([x for x in row if x == 'O'])
-        distance = len(map) - i
+    for i, row in enumerate(map.rows()):
+        rocks = row.tobytes().count(round_rock)
+        distance = map.height - i
         result += (rocks * distance)
     return result
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
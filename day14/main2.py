@@ -1,42 +1,51 @@
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs
+from aoc.grid import Grid
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
+
 stop = 1000000000
+round_rock = ord('O')
 
 
 def main():
-    non_repeating_count, repeating_maps_length = analyze_map_pattern()
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return Grid.from_input(source)
+
+
+def solve(platform: Grid):
+    non_repeating_count, repeating_maps_length = analyze_map_pattern(platform)
     cycles_needed = ((stop - non_repeating_count) % repeating_maps_length) + non_repeating_count
-    map = get_map()
+    map = platform.copy()
     for i in range(cycles_needed):
         perform_cycle(map)
     load = calculate_load(map)
-    print(load)
+    return load
 
 
-def analyze_map_pattern():
-    map = get_map()
+def analyze_map_pattern(platform: Grid):
+    map = platform.copy()
     prior_maps = []
     for i in range(stop):
         perform_cycle(map)
-        s = convert_to_string(map)
+        s = bytes(map.data)
         if s in prior_maps:
             return prior_maps.index(s), i - prior_maps.index(s)
         prior_maps.append(s)
 
 
-def get_map():
-    result = []
-    for line in get_lines():
-        result.append(list(line))
-    return result
-
-
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
-
-
 def perform_cycle(map):
     tilt_north(map)
     tilt_west(map)
@@ -60,50 +69,42 @@ def tilt_west(map):
     tilt(map, 0, -1)
 
 
-def tilt(map, row_adjustment, col_adjustment):
-    run_again = True
-    while run_again:
-        run_again = False
-        for row in range(0, len(map)):
-            for col in range(len(map[0])):
-                neighbor_row, neighbor_col = row + row_adjustment, col + col_adjustment
-                if is_valid_location(map, neighbor_row, neighbor_col) and map[row][col] == 'O' and map[neighbor_row][neighbor_col] == '.':
-                    map[row][col], map[neighbor_row][neighbor_col] = '.', 'O'
-                    run_again = True
+def tilt(map: Grid, row_adjustment, col_adjustment):
+    # Tilts a whole column (or row) at a time: between two cube rocks the
+    # round rocks all end up packed against whichever end they roll to.
+    data, width = map.data, map.width
+    if col_adjustment == 0:
+        for col in range(width):
+            data[col::width] = tilt_line(data[col::width], row_adjustment < 0)
+    else:
+        for start in range(0, len(data), width):
+            data[start:start + width] = tilt_line(data[start:start + width], col_adjustment < 0)
 
 
-def is_valid_location(map, row, col):
-    if row < 0:
-        return False
-    if row >= len(map):
-        return False
-    if col < 0:
-        return False
-    if col >= len(map[0]):
-        return False
-    return True
+def tilt_line(line: bytes, toward_start: bool) -> bytes:
+    segments = []
+    for segment in line.split(b'#'):
+        rocks = segment.count(b'O')
+        round_rocks, spaces = b'O' * rocks, b'.' * (len(segment) - rocks)
+        segments.append(round_rocks + spaces if toward_start else spaces + round_rocks)
+    return b'#'.join(segments)
 
 
-def calculate_load(map):
+def calculate_load(map: Grid):
     result = 0
-    for i, row in enumerate(map):
-        rocks = len([x for x in row if x == 'O'])
-        distance = len(map) - i
+    for i, row in enumerate(map.rows()):
+        rocks = row.tobytes().count(round_rock)
+        distance = map.height - i
         result += (rocks * distance)
     return result
 
 
-def convert_to_string(map):
-    rows = [''.join(row) for row in map]
-    return ''.join(rows)
-
-
-def print_map(map):
-    for row in map:
-        print(''.join(row))
+def print_map(map: Grid):
+    for line in map.lines():
+        print(line)
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
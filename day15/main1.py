@@ -1,18 +1,36 @@
+import argparse
+import os
+import sys
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+argparser.add_argument('--progress', type=int, help='when streaming, print the running total every this many records')
+
 
 def main():
-    commands = next(get_lines()).split(',')
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(stream.total(map(hash, stream.tokens(b',')), args.progress))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return next(source.text_lines()).split(',')
+
+
+def solve(commands):
     total = 0
     for command in commands:
         total += hash(command)
-    print(total)
-
+    return total
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
 
 def hash(str):
     result = 0
@@ -24,6 +42,6 @@ def hash(str):
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,10 +1,37 @@
+import argparse
+import os
+import sys
 import time
 
-boxes = [[] for _ in range(256)]
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy, stream
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt', help='input file, or - to stream records from stdin')
+
+
+@lazy.table
+def boxes():
+    return [[] for _ in range(256)]
 
 
 def main():
-    commands = next(get_lines()).split(',')
+    global args
+    args = argparser.parse_args()
+    if args.file == '-':
+        print(solve(stream.tokens(b',')))
+    else:
+        print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return next(source.text_lines()).split(',')
+
+
+def solve(commands):
+    for box in boxes:
+        box.clear()
     for command in commands:
         if '=' in command:
             lens, focal_length = command.split('=')
@@ -13,13 +40,7 @@ def main():
             lens = command[:-1]
             remove_lens(lens)
     focusing_power = calculate_focusing_power()
-    print(focusing_power)
-
-
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+    return focusing_power
 
 
 def hash(str):
@@ -70,6 +91,6 @@ def print_boxes():
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,26 +1,20 @@
+import argparse
+import os
+import sys
 import time
 
 from dataclasses import dataclass
-from typing import List, Set
+from typing import List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-class Tile:
-    action: str
-    row: int
-    col: int
-    visitors: Set[str]
+from aoc import inputs
+from aoc.grid import Grid
 
-    def __init__(self, action, row, col):
-        self.action = action
-        self.row, self.col = row, col
-        self.visitors = set()
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
 
-    def __repr__(self):
-        return f"Tile(action={self.action}, row={self.row}, col={self.col}, visited={self.visited}, visitors={self.visitors})"
-
-    @property
-    def visited(self):
-        return len(self.visitors) > 0
+visitor_bits = {'n': 1, 'e': 2, 's': 4, 'w': 8}
 
 forward_motion_map = {
     'n': (-1, 0),
@@ -72,41 +66,45 @@ class Cursor:
 
 class Tiles:
 
-    def __init__(self):
-        self._tiles = []
+    def __init__(self, layout: Grid):
+        self._layout = layout
+        self._visitors = Grid(layout.height, layout.width)
 
-    def add(self, tile):
-        self._tiles.append(tile)
+    def contains(self, row, col):
+        return self._layout.contains(row, col)
 
-    def get(self, row, col) -> Tile:
-        temp = [tile for tile in self._tiles if tile.row == row and tile.col == col]
-        return temp[0] if temp else None
+    def get_action(self, row, col) -> str:
+        return chr(self._layout[row, col])
+
+    def is_visited_by(self, cursor: Cursor):
+        return self._visitors[cursor.row, cursor.col] & visitor_bits[cursor.direction] != 0
+
+    def visit(self, cursor: Cursor):
+        self._visitors[cursor.row, cursor.col] |= visitor_bits[cursor.direction]
 
     def count_visited(self):
-        result = 0
-        for tile in self._tiles:
-            if tile.visited:
-                result += 1
-        return result
+        return len(self._visitors.data) - self._visitors.count(0)
 
 
 def main():
-    tiles = get_tiles()
-    tiles.get(0, 0).visitors.add('e')
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return Grid.from_input(source)
+
+
+def solve(layout: Grid):
+    tiles = Tiles(layout)
+    tiles.visit(Cursor('e', 0, 0))
     cursors = [Cursor('e', 0, 0)]
     while len(cursors) > 0:
         cursors = move_cursors(cursors, tiles)
         cursors = prune_cursors(cursors, tiles)
         apply_cursors(cursors, tiles)
-    print(tiles.count_visited())
-
-
-def get_tiles():
-    result = Tiles()
-    for row, line in enumerate(get_lines()):
-        for col, char in enumerate(list(line)):
-            result.add(Tile(char, row, col))
-    return result
+    return tiles.count_visited()
 
 
 def move_cursors(cursors: List[Cursor], tiles: Tiles) -> List[Cursor]:
@@ -131,8 +129,7 @@ movement_map = {
 
 
 def move_cursor(cursor: Cursor, tiles: Tiles) -> List[Cursor]:
-    tile = tiles.get(cursor.row, cursor.col)
-    movements = movement_map[(tile.action, cursor.is_east_west)]
+    movements = movement_map[(tiles.get_action(cursor.row, cursor.col), cursor.is_east_west)]
     result = []
     if 'forward' in movements:
         result.append(cursor.go_forward())
@@ -146,25 +143,17 @@ def move_cursor(cursor: Cursor, tiles: Tiles) -> List[Cursor]:
 def prune_cursors(cursors: List[Cursor], tiles: Tiles) -> List[Cursor]:
     result = []
     for cursor in cursors:
-        tile = tiles.get(cursor.row, cursor.col)
-        if tile is not None and cursor.direction not in tile.visitors:
+        if tiles.contains(cursor.row, cursor.col) and not tiles.is_visited_by(cursor):
             result.append(cursor)
     return result
 
 
 def apply_cursors(cursors: List[Cursor], tiles: Tiles):
     for cursor in cursors:
-        tile = tiles.get(cursor.row, cursor.col)
-        tile.visitors.add(cursor.direction)
-
-
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+        tiles.visit(cursor)
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,27 +1,21 @@
+import argparse
+import functools
+import os
+import sys
 import time
 
 from dataclasses import dataclass
-from typing import List, Set
+from typing import List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-class Tile:
-    action: str
-    row: int
-    col: int
-    visitors: Set[str]
-
-    def __init__(self, action, row, col):
-        self.action = action
-        self.row, self.col = row, col
-        self.visitors = set()
+from aoc import inputs, parallel
+from aoc.grid import Grid
 
-    def __repr__(self):
-        return f"Tile(action={self.action}, row={self.row}, col={self.col}, visited={self.visited}, visitors={self.visitors})"
-
-    @property
-    def visited(self):
-        return len(self.visitors) > 0
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file', nargs='?', default='input.txt')
 
+visitor_bits = {'n': 1, 'e': 2, 's': 4, 'w': 8}
 
 forward_motion_map = {
     'n': (-1, 0),
@@ -72,42 +66,46 @@ class Cursor:
 
 class Tiles:
 
-    def __init__(self):
-        self._tiles = []
+    def __init__(self, layout: Grid):
+        self._layout = layout
+        self._visitors = Grid(layout.height, layout.width)
 
-    def add(self, tile):
-        self._tiles.append(tile)
+    def contains(self, row, col):
+        return self._layout.contains(row, col)
 
-    def get(self, row, col) -> Tile:
-        temp = [tile for tile in self._tiles if tile.row == row and tile.col == col]
-        return temp[0] if temp else None
+    def get_action(self, row, col) -> str:
+        return chr(self._layout[row, col])
+
+    def is_visited_by(self, cursor: Cursor):
+        return self._visitors[cursor.row, cursor.col] & visitor_bits[cursor.direction] != 0
+
+    def visit(self, cursor: Cursor):
+        self._visitors[cursor.row, cursor.col] |= visitor_bits[cursor.direction]
 
     def count_visited(self):
-        result = 0
-        for tile in self._tiles:
-            if tile.visited:
-                result += 1
-        return result
-    
+        return len(self._visitors.data) - self._visitors.count(0)
+
     @property
     def height(self):
-        result = None
-        for tile in self._tiles:
-            if result is None or result < tile.row:
-                result = tile.row
-        return result + 1
+        return self._layout.height
 
     @property
     def width(self):
-        result = None
-        for tile in self._tiles:
-            if result is None or result < tile.col:
-                result = tile.col
-        return result + 1
+        return self._layout.width
 
 
 def main():
-    tiles = get_tiles()
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return Grid.from_input(source)
+
+
+def solve(layout: Grid):
+    tiles = Tiles(layout)
     cursors = []
     for row in range(tiles.height):
         cursors.append(Cursor('e', row, 0))
@@ -116,17 +114,16 @@ def main():
         cursors.append(Cursor('s', 0, col))
         cursors.append(Cursor('w', tiles.height - 1, col))
     max_solution = None
-    for cursor in cursors:
-        solution = process_starting_point(cursor)
+    solutions = parallel.map(functools.partial(process_starting_point, layout=layout), cursors)
+    for cursor, solution in zip(cursors, solutions):
         print(cursor, solution)
         if max_solution is None or max_solution < solution:
             max_solution = solution
-    print(max_solution)
+    return max_solution
 
 
-
-def process_starting_point(cursor: Cursor):
-    tiles = get_tiles()
+def process_starting_point(cursor: Cursor, layout: Grid):
+    tiles = Tiles(layout)
     cursors = [cursor]
     apply_cursors(cursors, tiles)
     while len(cursors) > 0:
@@ -136,14 +133,6 @@ def process_starting_point(cursor: Cursor):
     return tiles.count_visited()
 
 
-def get_tiles():
-    result = Tiles()
-    for row, line in enumerate(get_lines()):
-        for col, char in enumerate(list(line)):
-            result.add(Tile(char, row, col))
-    return result
-
-
 def move_cursors(cursors: List[Cursor], tiles: Tiles) -> List[Cursor]:
     result = []
     for cursor in cursors:
@@ -166,8 +155,7 @@ movement_map = {
 
 
 def move_cursor(cursor: Cursor, tiles: Tiles) -> List[Cursor]:
-    tile = tiles.get(cursor.row, cursor.col)
-    movements = movement_map[(tile.action, cursor.is_east_west)]
+    movements = movement_map[(tiles.get_action(cursor.row, cursor.col), cursor.is_east_west)]
     result = []
     if 'forward' in movements:
         result.append(cursor.go_forward())
@@ -181,25 +169,17 @@ def move_cursor(cursor: Cursor, tiles: Tiles) -> List[Cursor]:
 def prune_cursors(cursors: List[Cursor], tiles: Tiles) -> List[Cursor]:
     result = []
     for cursor in cursors:
-        tile = tiles.get(cursor.row, cursor.col)
-        if tile is not None and cursor.direction not in tile.visitors:
+        if tiles.contains(cursor.row, cursor.col) and not tiles.is_visited_by(cursor):
             result.append(cursor)
     return result
 
 
 def apply_cursors(cursors: List[Cursor], tiles: Tiles):
     for cursor in cursors:
-        tile = tiles.get(cursor.row, cursor.col)
-        tile.visitors.add(cursor.direction)
-
-
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+        tiles.visit(cursor)
 
 
 if __name__ == "__main__":
-    start_time = time.time()
+    start_time = time.perf_counter()
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,10 +1,23 @@
+import argparse
 import collections
+import os
+import sys
 import time
 
 from dataclasses import dataclass, field
 from typing import Dict, Iterator, List, Set
 
-start_time = time.time()
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs
+from aoc.grid import Grid
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('file')
+
+start_time = time.perf_counter()
+
+ascii_zero = ord('0')
 
 
 direction_adjustments = {
@@ -29,20 +42,15 @@ class InputNode:
 
 class InputGrid:
 
-    def __init__(self):
-        self._map = {}
-        self._max_row = self._max_col = -1
+    def __init__(self, weights: Grid):
+        self._weights = weights
 
     def __len__(self):
         return self.height * self.width
 
-    def add(self, node: InputNode):
-        self._max_row = max(node.row, self._max_row)
-        self._max_col = max(node.col, self._max_col)
-        self._map[(node.row, node.col)] = node
-
     def get(self, row, col) -> InputNode:
-        return self._map.get((row, col))
+        weight = self._weights.get(row, col)
+        return None if weight is None else InputNode(row, col, weight - ascii_zero)
 
     def get_nodes(self, row, col, direction, count) -> List[InputNode]:
         result = []
@@ -53,11 +61,11 @@ class InputGrid:
 
     @property
     def height(self):
-        return self._max_row + 1
+        return self._weights.height
 
     @property
     def width(self):
-        return self._max_col + 1
+        return self._weights.width
 
 
 @dataclass(frozen=True)
@@ -167,7 +175,16 @@ class Graph:
 
 
 def main():
-    input_grid = get_input_grid()
+    global args
+    args = argparser.parse_args()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return get_input_grid(source)
+
+
+def solve(input_grid: InputGrid):
     print(f"Input grid: {len(input_grid)}")
     combined_nodes = get_combined_nodes(input_grid)
     combined_node_collection = CombinedNodeCollection(combined_nodes)
@@ -195,21 +212,11 @@ def main():
         current_node = graph.get_minimum_unvisited_node()
     terminal_nodes = find_terminal_nodes(graph, input_grid.height - 1, input_grid.width - 1)
     solution = min(x.distance for x in terminal_nodes) - input_grid.get(0, 0).weight
-    print(solution)
-
-
-def get_input_grid() -> InputGrid:
-    result = InputGrid()
-    for row, line in enumerate(get_lines()):
-        for col, weight in enumerate(list(line)):
-            result.add(InputNode(row, col, int(weight)))
-    return result
+    return solution
 
 
-def get_lines():
-    with open('input.txt') as file:
-        for line in file:
-            yield line.strip()
+def get_input_grid(source: inputs.Input) -> InputGrid:
+    return InputGrid(Grid.from_input(source))
 
 
 def get_combined_nodes(grid: InputGrid):
@@ -260,4 +267,4 @@ def print_grid(grid: InputGrid):
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,14 +1,23 @@
 import argparse
 import collections
+import os
+import sys
 import time
 
 from dataclasses import dataclass, field
 from typing import Dict, Iterator, List, Set
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, instrument
+from aoc.grid import Grid
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
+
+ascii_zero = ord('0')
 
 
 direction_adjustments = {
@@ -33,20 +42,15 @@ class InputNode:
 
 class InputGrid:
 
-    def __init__(self):
-        self._map = {}
-        self._max_row = self._max_col = -1
+    def __init__(self, weights: Grid):
+        self._weights = weights
 
     def __len__(self):
         return self.height * self.width
 
-    def add(self, node: InputNode):
-        self._max_row = max(node.row, self._max_row)
-        self._max_col = max(node.col, self._max_col)
-        self._map[(node.row, node.col)] = node
-
     def get(self, row, col) -> InputNode:
-        return self._map.get((row, col))
+        weight = self._weights.get(row, col)
+        return None if weight is None else InputNode(row, col, weight - ascii_zero)
 
     def get_nodes(self, row, col, direction, count) -> List[InputNode]:
         result = []
@@ -57,11 +61,11 @@ class InputGrid:
 
     @property
     def height(self):
-        return self._max_row + 1
+        return self._weights.height
 
     @property
     def width(self):
-        return self._max_col + 1
+        return self._weights.width
 
 
 @dataclass(frozen=True)
@@ -174,7 +178,14 @@ class Graph:
 def main():
     global args
     args = argparser.parse_args()
-    input_grid = get_input_grid()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return get_input_grid(source)
+
+
+def solve(input_grid: InputGrid):
     print(f"Input grid: {len(input_grid)}")
     combined_nodes = get_combined_nodes(input_grid)
     combined_node_collection = CombinedNodeCollection(combined_nodes)
@@ -193,20 +204,20 @@ def main():
                     neighbor.previous = current_node
         current_node.visited = True
         nodes_visited += 1
-        if nodes_visited % 10000 == 0:
-            print(nodes_visited, int(time.time() - start_time))
         current_node = get_node_with_min_distance(unvisited_nodes)
+    instrument.count('nodes visited', nodes_visited)
     terminal_nodes = find_terminal_nodes(graph, input_grid.height - 1, input_grid.width - 1)
     solution_node: GraphNode = None
     for terminal_node in terminal_nodes:
         if solution_node is None or solution_node.distance > terminal_node.distance:
             solution_node = terminal_node
     solution = solution_node.distance - input_grid.get(0, 0).weight
-    print(solution)
+    return solution
     #print_path(solution_node, input_grid)
     #summarize_solution(solution_node, solution_node)
 
 
+@instrument.timed
 def get_node_with_min_distance(nodes: Set[GraphNode]) -> GraphNode:
     result: GraphNode = None
     for node in nodes:
@@ -218,18 +229,8 @@ def get_node_with_min_distance(nodes: Set[GraphNode]) -> GraphNode:
     return result
 
 
-def get_input_grid() -> InputGrid:
-    result = InputGrid()
-    for row, line in enumerate(get_lines()):
-        for col, weight in enumerate(list(line)):
-            result.add(InputNode(row, col, int(weight)))
-    return result
-
-
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
+def get_input_grid(source: inputs.Input) -> InputGrid:
+    return InputGrid(Grid.from_input(source))
 
 
 def get_combined_nodes(grid: InputGrid):
@@ -245,6 +246,7 @@ def get_combined_nodes(grid: InputGrid):
     return [x for x in temp]
 
 
+@instrument.timed
 def build_graph(combined_node_collection: CombinedNodeCollection):
     mapping: Dict[CombinedNode, GraphNode] = {}
     for combined_node in combined_node_collection:
@@ -310,4 +312,4 @@ def summarize_solution(solution_node: GraphNode, input_grid: InputGrid):
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
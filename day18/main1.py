@@ -1,18 +1,24 @@
 import argparse
 import collections
-import re
+import os
+import sys
 import time
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Set, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+from aoc.grid import Grid
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
-input_pattern = re.compile("([UDLR]) ([1-9][0-9]*) .+")
+input_pattern = lazy.compile("([UDLR]) ([1-9][0-9]*) .+")
 
 
 class Direction(Enum):
@@ -30,10 +36,10 @@ class Direction(Enum):
             raise Exception(f"not found: {str}")
 
 
-class BlockType(Enum):
-    DITCH = "DITCH"
-    OUTSIDE = "OUTSIDE"
-    UNKNOWN = "UNKNOWN"
+class BlockType(IntEnum):
+    DITCH = ord('#')
+    OUTSIDE = ord('.')
+    UNKNOWN = ord(' ')
 
 
 @dataclass(frozen=True)
@@ -46,64 +52,20 @@ class Coordinate:
         col = self.col + (direction.value[1] * units)
         return Coordinate(row, col)
 
-    def translate_to_zero_based(self, row_adjustment, col_adjustment):
-        row = self.row - row_adjustment
-        col = self.col - col_adjustment
-        return Coordinate(row, col)
-
-    def translate_from_zero_based(self, row_adjustment, col_adjustment):
-        row = self.row + row_adjustment
-        col = self.col + col_adjustment
-        return Coordinate(row, col)
-
-
-class Matrix[T]:
-
-    def __init__(self, height, width):
-        self._height, self._width = height, width
-        self._array = []
-        for _ in range(height):
-            self._array.append([None for _ in range(width)])
-
-    @property
-    def height(self):
-        return self._height
-
-    @property
-    def width(self):
-        return self._width
-
-    def get(self, c: Coordinate) -> T:
-        return self._array[c.row][c.col]
-
-    def put(self, c: Coordinate, item: T):
-        self._array[c.row][c.col] = item
-
-    def get_neighbors(self, c: Coordinate) -> List[Tuple[Coordinate, T]]:
-        return [(n, self.get(n)) for n in self._get_neighbor_coordinates(c)]
-
-    def _get_neighbor_coordinates(self, c: Coordinate) -> List[Coordinate]:
-        result = []
-        for direction in Direction:
-            neighbor = c.move(direction)
-            if 0 <= neighbor.row < len(self._array) and 0 <= neighbor.col < len(self._array[0]):
-                result.append(neighbor)
-        return result
-
 
-class NonOriginBasedMatrix[T]:
+class NonOriginBasedMatrix:
 
     def __init__(self, min_row, max_row, min_col, max_col):
-        self._matrix = Matrix(max_row - min_row + 1, max_col - min_col + 1)
+        self._grid = Grid(max_row - min_row + 1, max_col - min_col + 1, BlockType.UNKNOWN)
         self._min_row, self._min_col = min_row, min_col
 
     @property
     def height(self):
-        return self._matrix.height
+        return self._grid.height
 
     @property
     def width(self):
-        return self._matrix.width
+        return self._grid.width
 
     @property
     def min_row(self):
@@ -113,20 +75,16 @@ class NonOriginBasedMatrix[T]:
     def min_col(self):
         return self._min_col
 
-    def get(self, c: Coordinate) -> T:
-        zero_based_coordinate = c.translate_to_zero_based(self._min_row, self._min_col)
-        return self._matrix.get(zero_based_coordinate)
+    def get(self, c: Coordinate) -> int:
+        return self._grid[c.row - self._min_row, c.col - self._min_col]
 
-    def put(self, c: Coordinate, item: T):
-        zero_based_coordinate = c.translate_to_zero_based(self._min_row, self._min_col)
-        self._matrix.put(zero_based_coordinate, item)
+    def put(self, c: Coordinate, item: BlockType):
+        self._grid[c.row - self._min_row, c.col - self._min_col] = item
 
-    def get_neighbors(self, c: Coordinate) -> List[T]:
-        zero_based_coordinate = c.translate_to_zero_based(self._min_row, self._min_col)
+    def get_neighbors(self, c: Coordinate) -> List[Tuple[Coordinate, int]]:
         result = []
-        for item_coordinate, item in self._matrix.get_neighbors(zero_based_coordinate):
-            nonzero_based_coordinate = item_coordinate.translate_from_zero_based(self._min_row, self._min_col)
-            result.append((nonzero_based_coordinate, item))
+        for row, col in self._grid.neighbors(c.row - self._min_row, c.col - self._min_col):
+            result.append((Coordinate(row + self._min_row, col + self._min_col), self._grid[row, col]))
         return result
 
 
@@ -142,13 +100,19 @@ def init():
 
 
 def process():
+    print(solve(parse(inputs.load(args.file))))
 
-    ditch_coordinates = get_ditch_coordinates()
+
+def parse(source: inputs.Input):
+    return get_ditch_coordinates(source)
+
+
+def solve(ditch_coordinates: Set[Coordinate]):
     min_row, max_row, min_col, max_col = get_min_max_coordinates(ditch_coordinates)
     print(min_row, max_row, min_col, max_col)
     edge_coordinates = get_edge_coordinates(min_row, max_row, min_col, max_col)
     outside_coordinates = set([x for x in edge_coordinates if x not in ditch_coordinates])
-    matrix = NonOriginBasedMatrix[BlockType](min_row, max_row, min_col, max_col)
+    matrix = NonOriginBasedMatrix(min_row, max_row, min_col, max_col)
     for c in ditch_coordinates:
         matrix.put(c, BlockType.DITCH)
     for c in outside_coordinates:
@@ -159,7 +123,7 @@ def process():
         c = queue.popleft()
         neighbors = matrix.get_neighbors(c)
         for neighbor_coordinate, neighbor in neighbors:
-            if neighbor is None:
+            if neighbor == BlockType.UNKNOWN:
                 matrix.put(neighbor_coordinate, BlockType.OUTSIDE)
                 queue.append(neighbor_coordinate)
     lava_cubes = 0
@@ -170,7 +134,11 @@ def process():
             block = matrix.get(Coordinate(row, col))
             if block != BlockType.OUTSIDE:
                 lava_cubes += 1
-    print(lava_cubes)
+    print_matrix(matrix)
+    return lava_cubes
+
+
+def print_matrix(matrix: NonOriginBasedMatrix):
     for row in range(matrix.height):
         row += matrix.min_row
         for col in range(matrix.width):
@@ -186,11 +154,11 @@ def process():
         print()
 
 
-def get_ditch_coordinates():
+def get_ditch_coordinates(source: inputs.Input):
     result = set()
     c = Coordinate(0, 0)
     result.add(c)
-    for line in get_lines():
+    for line in source.text_lines():
         match = input_pattern.fullmatch(line)
         direction, distance = match.group(1), match.group(2)
         direction, distance = Direction.from_string(direction), int(distance)
@@ -200,12 +168,6 @@ def get_ditch_coordinates():
     return result
 
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
-
-
 def get_min_max_coordinates(coordinates: Set[Coordinate]):
     for c in coordinates:
         min_row, max_row, min_col, max_col = c.row, c.row, c.col, c.col
@@ -235,4 +197,4 @@ def wrapup():
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,18 +1,23 @@
 import argparse
-import re
+import os
+import sys
 import time
 
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Set, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
-input_pattern1 = re.compile("([UDLR]) ([1-9][0-9]*) .+")
-input_pattern2 = re.compile("[^#]+#(.{5})([0123])\\)")
+input_pattern1 = lazy.compile("([UDLR]) ([1-9][0-9]*) .+")
+input_pattern2 = lazy.compile("[^#]+#(.{5})([0123])\\)")
 
 
 class Direction(Enum):
@@ -124,7 +129,14 @@ def init():
 
 
 def process():
-    line_segment_collection = get_line_segment_collection()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return get_line_segment_collection(source)
+
+
+def solve(line_segment_collection: LineSegmentCollection):
     terrain_width = max([x.col for x in line_segment_collection.get_by_orientation(Orientation.VERTICAL)]) + 1
     rows = sorted(set([x.row for x in line_segment_collection.get_by_orientation(Orientation.HORIZONTAL)]))
     total_area = 0
@@ -138,17 +150,17 @@ def process():
             width = calculate_row_area(r1, line_segment_collection, terrain_width)
             area = height * width
             total_area += area
-    print(total_area)
+    return total_area
 
 
-def get_line_segment_collection() -> LineSegmentCollection:
-    line_segments = get_line_segments2()
+def get_line_segment_collection(source: inputs.Input) -> LineSegmentCollection:
+    line_segments = get_line_segments2(source)
     return LineSegmentCollection(line_segments)
 
 
-def get_line_segments1() -> List[LineSegment]:
+def get_line_segments1(source: inputs.Input) -> List[LineSegment]:
     coordinates: List[Coordinate] = [Coordinate(0, 0)]
-    for line in get_lines():
+    for line in source.text_lines():
         match = input_pattern1.fullmatch(line)
         direction, distance = match.group(1), match.group(2)
         direction, distance = Direction.from_string(direction), int(distance)
@@ -159,9 +171,9 @@ def get_line_segments1() -> List[LineSegment]:
     return result
 
 
-def get_line_segments2() -> List[LineSegment]:
+def get_line_segments2(source: inputs.Input) -> List[LineSegment]:
     coordinates: List[Coordinate] = [Coordinate(0, 0)]
-    for line in get_lines():
+    for line in source.text_lines():
         match = input_pattern2.fullmatch(line)
         direction, distance = match.group(2), match.group(1)
         direction, distance = "RDLU"[int(direction)], int(distance, 16)
@@ -173,12 +185,6 @@ def get_line_segments2() -> List[LineSegment]:
     return result
 
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
-
-
 class RowAreaCalculationType(Enum):
     ROW = 1
     COL = 2
@@ -256,4 +262,4 @@ def wrapup():
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,37 +1,43 @@
 import argparse
+import os
 import re
+import sys
 import time
 
 from dataclasses import dataclass
 from operator import gt, lt
 from typing import List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
-comma_delimited_pattern = re.compile("([^,]+)")
-string_in_braces_pattern = re.compile("{(.+)}")
+comma_delimited_pattern = lazy.compile("([^,]+)")
+string_in_braces_pattern = lazy.compile("{(.+)}")
 
-workflow_pattern = re.compile("""
+workflow_pattern = lazy.compile("""
                               (?P<name>[a-z]+)   # name of the workflow
                               {(?P<rules>.+)}    # list of rules inside braces
                               """, re.VERBOSE)
 
-rule_pattern = re.compile("""
+rule_pattern = lazy.compile("""
                             (?:(?P<comparison>[^:]+):)?    # optional comparison statement followed by a colon
                             (?P<destination>.+)            # required destination value
                           """, re.VERBOSE)
 
-comparison_pattern = re.compile("""
+comparison_pattern = lazy.compile("""
                                     (?P<variable>[xmas])       # variable name
                                     (?P<operator>[<>])         # comparison operator
                                     (?P<amount>[1-9][0-9]*)    # number
                                 """, re.VERBOSE)
 
 
-assignment_statement_pattern = re.compile("""
+assignment_statement_pattern = lazy.compile("""
                                             (?P<variable>[xmas])       # variable name
                                             =                          # equals sign
                                             (?P<value>[1-9][0-9]*)     # number
@@ -92,7 +98,6 @@ class WorkflowSystem:
             workflow = self._dict[destination]
 
 
-
 def main():
     init()
     process()
@@ -105,8 +110,16 @@ def init():
 
 
 def process():
-    workflow_system = WorkflowSystem(get_workflows())
-    items = get_items()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    workflow_block, item_block = source.text_blocks()
+    return WorkflowSystem(get_workflows(workflow_block)), get_items(item_block)
+
+
+def solve(system):
+    workflow_system, items = system
     accepted_items = []
     for item in items:
         destination = workflow_system.get_destination(item)
@@ -116,14 +129,12 @@ def process():
     for item in accepted_items:
         subtotal = sum(item.values())
         total += subtotal
-    print(total)
+    return total
 
 
-def get_workflows() -> List[Workflow]:
+def get_workflows(lines) -> List[Workflow]:
     result = []
-    for line in get_lines():
-        if line == '':
-            break
+    for line in lines:
         workflow_match = workflow_pattern.fullmatch(line)
         workflow_name = workflow_match.group('name')
         rule_definitions = comma_delimited_pattern.findall(workflow_match.group('rules'))
@@ -144,16 +155,12 @@ def build_rule(rule_definition: str):
         return WorkflowRule(destination, Comparison(variable, operator, amount))
 
 
-def get_items():
+def get_items(lines):
     result = []
-    started = False
-    for line in get_lines():
-        if line == '':
-            started = True
-        elif started:
-            item_match = string_in_braces_pattern.fullmatch(line)
-            item_definition = item_match.group(1)
-            result.append(build_item(item_definition))
+    for line in lines:
+        item_match = string_in_braces_pattern.fullmatch(line)
+        item_definition = item_match.group(1)
+        result.append(build_item(item_definition))
     return result
 
 
@@ -166,16 +173,10 @@ def build_item(item_definition):
     return result
 
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
-
-
 def wrapup():
     pass
 
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
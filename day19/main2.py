@@ -1,38 +1,44 @@
 import argparse
 import collections
+import os
 import re
+import sys
 import time
 
 from dataclasses import dataclass
 from operator import gt, lt
 from typing import Deque, Generator, List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, lazy
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
-comma_delimited_pattern = re.compile("([^,]+)")
-string_in_braces_pattern = re.compile("{(.+)}")
+comma_delimited_pattern = lazy.compile("([^,]+)")
+string_in_braces_pattern = lazy.compile("{(.+)}")
 
-workflow_pattern = re.compile("""
+workflow_pattern = lazy.compile("""
                               (?P<name>[a-z]+)   # name of the workflow
                               {(?P<rules>.+)}    # list of rules inside braces
                               """, re.VERBOSE)
 
-rule_pattern = re.compile("""
+rule_pattern = lazy.compile("""
                             (?:(?P<comparison>[^:]+):)?    # optional comparison statement followed by a colon
                             (?P<destination>.+)            # required destination value
                           """, re.VERBOSE)
 
-comparison_pattern = re.compile("""
+comparison_pattern = lazy.compile("""
                                     (?P<variable>[xmas])       # variable name
                                     (?P<operator>[<>])         # comparison operator
                                     (?P<amount>[1-9][0-9]*)    # number
                                 """, re.VERBOSE)
 
 
-assignment_statement_pattern = re.compile("""
+assignment_statement_pattern = lazy.compile("""
                                             (?P<variable>[xmas])       # variable name
                                             =                          # equals sign
                                             (?P<value>[1-9][0-9]*)     # number
@@ -139,15 +145,22 @@ def init():
 
 
 def process():
-    root = build_workflow_rule_tree()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return get_workflows(source.text_blocks()[0])
+
+
+def solve(workflows: List[Workflow]):
+    root = build_workflow_rule_tree(workflows)
     total = 0
     for path in get_accepted_paths(root):
         total += count_combinations_on_node(path)
-    print(total)
+    return total
 
 
-def build_workflow_rule_tree():
-    workflows = get_workflows()
+def build_workflow_rule_tree(workflows: List[Workflow]):
     workflows = {wf.name: wf for wf in workflows}
     workflows['A'] = Workflow('A')
     workflows['R'] = Workflow('R')
@@ -171,11 +184,9 @@ def get_accepted_paths(root: TreeNode[WorkflowRule]):
             yield node
 
 
-def get_workflows() -> List[Workflow]:
+def get_workflows(lines) -> List[Workflow]:
     result = []
-    for line in get_lines():
-        if line == '':
-            break
+    for line in lines:
         workflow_match = workflow_pattern.fullmatch(line)
         workflow_name = workflow_match.group('name')
         rule_definitions = comma_delimited_pattern.findall(workflow_match.group('rules'))
@@ -196,12 +207,6 @@ def build_rule(rule_definition: str):
         return WorkflowRule(destination, Comparison(variable, operator, amount))
 
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
-
-
 def count_combinations_on_node(node: TreeNode[WorkflowRule]):
     comparisons = get_comparisons(node)
     return count_combinations(comparisons)
@@ -246,4 +251,4 @@ def wrapup():
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,20 +1,26 @@
 import argparse
 import collections
+import os
 import re
+import sys
 import time
 
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, instrument, lazy
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
-comma_delimited_pattern = re.compile("([^ ,]+)")
+comma_delimited_pattern = lazy.compile("([^ ,]+)")
 
-module_pattern = re.compile("""
+module_pattern = lazy.compile("""
                             (?P<type>[%&]?)         
                             (?P<name>[^ ]+)          # module name
                             [ ]->[ ]                 # arrow
@@ -87,6 +93,7 @@ class Network:
         self.modules = modules
         self.high_pulses_sent = self.low_pulses_sent = 0
 
+    @instrument.timed
     def push_button(self):
         queue = collections.deque()
         queue.append(Message('button', 'broadcaster', Pulse.LOW))
@@ -112,21 +119,29 @@ def init():
 
 
 def process():
-    network = build_network()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return list(get_modules(source))
+
+
+def solve(module_definitions):
+    network = build_network(module_definitions)
     for _ in range(1000):
         network.push_button()
     result = network.high_pulses_sent * network.low_pulses_sent
-    print(result)
+    return result
 
 
-def build_network():
-    return Network(build_modules())
+def build_network(module_definitions):
+    return Network(build_modules(module_definitions))
 
 
-def build_modules():
+def build_modules(module_definitions):
     result = []
-    sender_to_receivers, receiver_to_senders = get_sender_receiver_mapping()
-    for module_type, module_name, _ in get_modules():
+    sender_to_receivers, receiver_to_senders = get_sender_receiver_mapping(module_definitions)
+    for module_type, module_name, _ in module_definitions:
         if module_type == '%':
             module = FlipFlop(module_name, sender_to_receivers[module_name])
         elif module_type == '&':
@@ -144,17 +159,17 @@ def build_modules():
     return result
 
 
-def get_sender_receiver_mapping():
+def get_sender_receiver_mapping(module_definitions):
     source_to_dest, dest_to_source = collections.defaultdict(list), collections.defaultdict(list)
-    for _, module_name, destinations in get_modules():
+    for _, module_name, destinations in module_definitions:
         for destination in destinations:
             source_to_dest[module_name].append(destination)
             dest_to_source[destination].append(module_name)
     return source_to_dest, dest_to_source
 
 
-def get_modules():
-    for line in get_lines():
+def get_modules(source: inputs.Input):
+    for line in source.text_lines():
         match = module_pattern.fullmatch(line)
         module_type = match.group('type')
         module_name = match.group('name')
@@ -162,16 +177,10 @@ def get_modules():
         yield module_type, module_name, destinations
 
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
-
-
 def wrapup():
     pass
 
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,3 +1,10 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import inputs, instrument, lazy
+
 """
 This is only a partial answer. 
 Looking at the input as a flowchart in mermaid I can see the following: 
@@ -27,11 +34,11 @@ from typing import Dict, List
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
-comma_delimited_pattern = re.compile("([^ ,]+)")
+comma_delimited_pattern = lazy.compile("([^ ,]+)")
 
-module_pattern = re.compile("""
+module_pattern = lazy.compile("""
                             (?P<type>[%&]?)         
                             (?P<name>[^ ]+)          # module name
                             [ ]->[ ]                 # arrow
@@ -108,6 +115,7 @@ class Network:
         self.high_pulses_sent = self.low_pulses_sent = 0
         self.clicks = 0
 
+    @instrument.timed
     def push_button(self):
         self.clicks += 1
         queue = collections.deque()
@@ -115,7 +123,9 @@ class Network:
         while queue:
             message: Message = queue.popleft()
             if message.receiver == 'ng' and message.pulse == Pulse.LOW:
+                # the clicks printed here are the cycle lengths in the notes above
                 print(message, self.clicks)
+                instrument.count('low pulses to ng')
             self.high_pulses_sent += (1 if message.pulse == Pulse.HIGH else 0)
             self.low_pulses_sent += (1 if message.pulse == Pulse.LOW else 0)
             # print(f"{message.sender} -> {message.pulse.value} -> {message.receiver}")
@@ -136,7 +146,7 @@ def init():
 
 
 def process1():
-    modules = build_modules()
+    modules = build_modules(parse(inputs.load(args.file)))
     labels = {}
     for m in modules:
         if isinstance(m, FlipFlop):
@@ -152,19 +162,27 @@ def process1():
 
 
 def process():
-    network = build_network()
+    print(solve(parse(inputs.load(args.file))))
+
+
+def parse(source: inputs.Input):
+    return list(get_modules(source))
+
+
+def solve(module_definitions):
+    network = build_network(module_definitions)
     while True:
         network.push_button()
 
 
-def build_network():
-    return Network(build_modules())
+def build_network(module_definitions):
+    return Network(build_modules(module_definitions))
 
 
-def build_modules():
+def build_modules(module_definitions):
     result = []
-    sender_to_receivers, receiver_to_senders = get_sender_receiver_mapping()
-    for module_type, module_name, _ in get_modules():
+    sender_to_receivers, receiver_to_senders = get_sender_receiver_mapping(module_definitions)
+    for module_type, module_name, _ in module_definitions:
         if module_type == '%':
             module = FlipFlop(module_name, sender_to_receivers[module_name])
         elif module_type == '&':
@@ -196,17 +214,17 @@ def build_modules():
     return result
 
 
-def get_sender_receiver_mapping():
+def get_sender_receiver_mapping(module_definitions):
     source_to_dest, dest_to_source = collections.defaultdict(list), collections.defaultdict(list)
-    for _, module_name, destinations in get_modules():
+    for _, module_name, destinations in module_definitions:
         for destination in destinations:
             source_to_dest[module_name].append(destination)
             dest_to_source[destination].append(module_name)
     return source_to_dest, dest_to_source
 
 
-def get_modules():
-    for line in get_lines():
+def get_modules(source: inputs.Input):
+    for line in source.text_lines():
         match = module_pattern.fullmatch(line)
         module_type = match.group('type')
         module_name = match.group('name')
@@ -214,16 +232,10 @@ def get_modules():
         yield module_type, module_name, destinations
 
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
-
-
 def wrapup():
     pass
 
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
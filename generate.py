@@ -0,0 +1,43 @@
+import argparse
+import os
+import time
+
+from aoc import generators, solvers
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('days', nargs='*', type=int, help='days to generate input for (default: all)')
+argparser.add_argument('--size', type=int, help='number of lines, records or grid width, depending on the day')
+argparser.add_argument('--density', type=float, help='a value between 0 and 1 whose meaning depends on the day')
+argparser.add_argument('--seed', type=int, default=0)
+argparser.add_argument('--output', help="file name inside each day directory (default: input_generated.txt)")
+
+start_time = time.perf_counter()
+
+
+def main():
+    init()
+    process()
+    wrapup()
+
+
+def init():
+    global args
+    args = argparser.parse_args()
+
+
+def process():
+    for day in args.days or generators.days:
+        size = args.size or generators.get_generator(day).default_size
+        name = args.output or 'input_generated.txt'
+        path = name if os.path.isabs(name) else os.path.join(solvers.root, f'day{day:02}', name)
+        generators.write(path, day, size, args.density, args.seed)
+        print(f'{os.path.relpath(path, solvers.root)}: {os.path.getsize(path)} bytes')
+
+
+def wrapup():
+    pass
+
+
+if __name__ == "__main__":
+    main()
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
@@ -1,10 +1,12 @@
 import argparse
 import time
 
+from aoc import inputs
+
 argparser = argparse.ArgumentParser()
 argparser.add_argument('file')
 
-start_time = time.time()
+start_time = time.perf_counter()
 
 
 def main():
@@ -19,13 +21,15 @@ def init():
 
 
 def process():
-    pass
+    print(solve(parse(inputs.load(args.file))))
+
 
+def parse(source: inputs.Input):
+    return list(source.text_lines())
 
-def get_lines():
-    with open(args.file) as file:
-        for line in file:
-            yield line.strip()
+
+def solve(lines):
+    pass
 
 
 def wrapup():
@@ -34,4 +38,4 @@ def wrapup():
 
 if __name__ == "__main__":
     main()
-    print("--- %s seconds ---" % int(time.time() - start_time))
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))
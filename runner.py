@@ -0,0 +1,78 @@
+import argparse
+import functools
+import io
+import sys
+import time
+
+from aoc import cache, instrument, parallel, solvers, startup
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument('solvers', nargs='*', help='solvers to run, e.g. day03 or day03/main1 (default: all)')
+argparser.add_argument('--input', action='append', help='input file name inside each day directory; the first one found is used (default: input.txt, input_full.txt)')
+argparser.add_argument('--report', help='write the results to this JSON file')
+argparser.add_argument('--timeout', type=float, help='seconds allowed per solver')
+argparser.add_argument('--no-memory', action='store_true', help='skip tracemalloc peak memory tracking')
+argparser.add_argument('--verbose', action='store_true', help='show what the solvers print while they run')
+argparser.add_argument('--no-cache', action='store_true', help='always run the solvers instead of reusing answers from earlier runs')
+argparser.add_argument('--cache-size', type=float, default=cache.default_max_bytes / 2 ** 20, help='MiB of answers and parsed inputs to keep (default: %(default)s)')
+argparser.add_argument('--profile-imports', action='store_true', help='report what loading each solver costs in a fresh interpreter instead of running it')
+argparser.add_argument('--instrument', action='store_true', help='collect the counters and timers the solvers define')
+argparser.add_argument('--profile', choices=instrument.profilers, help='profile parse and solve, writing a flamegraph-ready .folded file per solver')
+argparser.add_argument('--profile-dir', default=solvers.default_profile_directory, help='where --profile writes its files (default: %(default)s)')
+argparser.add_argument('--jobs', type=int, default=1, help='number of solvers to run at the same time, each in its own process')
+
+start_time = time.perf_counter()
+
+
+def main():
+    init()
+    process()
+    wrapup()
+
+
+def init():
+    global args
+    args = argparser.parse_args()
+
+
+def process():
+    global results
+    results = []
+    selected = solvers.discover(args.solvers)
+    if args.profile_imports:
+        for solver in selected:
+            print(solver.name)
+            print(startup.format_profile(startup.profile(solver)))
+        return
+    if args.jobs > 1:
+        # the days already share the cores, so they should not fan out again
+        parallel.set_workers(1)
+    result_cache = None if args.no_cache else cache.ResultCache(max_bytes=int(args.cache_size * 2 ** 20))
+    run = functools.partial(run_solver, input_names=args.input, trace_memory=not args.no_memory, verbose=args.verbose, timeout=args.timeout,
+                            cache=result_cache, instrumented=args.instrument, profiler=args.profile, profile_directory=args.profile_dir)
+    for solver, (result, output) in zip(selected, parallel.map(run, selected, chunk_size=1, workers=args.jobs)):
+        sys.stdout.write(output)
+        if result.error:
+            print(f'{solver.name}: -')
+        print(solvers.format_result(result))
+        results.append(result)
+
+
+def run_solver(solver: solvers.Solver, **options):
+    out = io.StringIO()
+    result = solvers.run(solver, out=out, **options)
+    return result, out.getvalue()
+
+
+def wrapup():
+    if args.profile_imports:
+        return
+    if args.report:
+        solvers.write_report(args.report, results)
+    failures = len([x for x in results if x.error])
+    print(f'{len(results)} solvers, {failures} failed')
+
+
+if __name__ == "__main__":
+    main()
+    print("--- %.3f seconds ---" % (time.perf_counter() - start_time))